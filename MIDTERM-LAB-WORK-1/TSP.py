@@ -1,4 +1,11 @@
-graph = {
+import sys
+
+from graph_loader import load_graph
+from held_karp import MAX_CITIES, NUMPY_AVAILABLE, PYTHON_MAX_CITIES, shortest_tour
+from road_graph import RoadGraph
+from shortest_paths import PathCache
+
+graph = RoadGraph({
     (1,2): {"D":10, "T":15, "F":1.2},
     (1,6): {"D":10, "T":15, "F":1.2},
     (2,1): {"D":10, "T":15, "F":1.2},
@@ -19,46 +26,24 @@ graph = {
     (6,2): {"D":10, "T":15, "F":1.2},
     (6,3): {"D":10, "T":25, "F":1.3},
     (6,5): {"D":10, "T":25, "F":1.5}
-}
+})
 
 cities = [1, 2, 3, 4, 5, 6]
 
+# python TSP.py roads.csv: use an edge-list file (u, v, D, T, F rows, see
+# graph_loader.py) instead of the graph above
+if len(sys.argv) > 1:
+    graph = load_graph(sys.argv[1])
+    cities = graph.labels
+
+# Shortest paths for every pair, computed once per metric (and again only
+# after an edge of graph changes)
+shortest = PathCache(graph, cities)
+
 def find_best_path(start, end, metric):
     """Find the shortest path from start to end based on metric (D, T, or F).
-    Checks direct edge, 1 intermediate, and 2 intermediate nodes."""
-    
-    best_value = float('inf')
-    best_path = None
-    
-    # Check direct edge
-    if (start, end) in graph:
-        best_value = graph[(start, end)][metric]
-        best_path = [start, end]
-    
-    # Check indirect paths through one intermediate node
-    for mid in cities:
-        if mid == start or mid == end:
-            continue
-        if (start, mid) in graph and (mid, end) in graph:
-            value = graph[(start, mid)][metric] + graph[(mid, end)][metric]
-            if value < best_value:
-                best_value = value
-                best_path = [start, mid, end]
-    
-    # Check indirect paths through two intermediate nodes
-    for mid1 in cities:
-        if mid1 == start or mid1 == end:
-            continue
-        for mid2 in cities:
-            if mid2 == start or mid2 == end or mid2 == mid1:
-                continue
-            if (start, mid1) in graph and (mid1, mid2) in graph and (mid2, end) in graph:
-                value = graph[(start, mid1)][metric] + graph[(mid1, mid2)][metric] + graph[(mid2, end)][metric]
-                if value < best_value:
-                    best_value = value
-                    best_path = [start, mid1, mid2, end]
-    
-    return best_path, best_value if best_path else None
+    Exact over routes of any length (see shortest_paths.py)."""
+    return shortest.path(start, end, metric)
 
 def calculate_node_total(start, metric):
     """Calculate total of shortest paths from start node to all other nodes."""
@@ -100,8 +85,8 @@ for metric, name, unit in [("D", "Distance", "km"), ("T", "Time", "min"), ("F",
         total, paths = calculate_node_total(start, metric)
         if total is not None:
             # Also get tiebreaker values
-            total_tb1, _ = calculate_node_total(start, tiebreakers[metric][0])
-            total_tb2, _ = calculate_node_total(start, tiebreakers[metric][1])
+            total_tb1 = shortest.total(start, tiebreakers[metric][0], cities)
+            total_tb2 = shortest.total(start, tiebreakers[metric][1], cities)
             node_results.append((start, total, total_tb1, total_tb2, paths))
     
     # Print table header
@@ -143,4 +128,27 @@ for metric, name, unit in [("D", "Distance", "km"), ("T", "Time", "min"), ("F",
         path_str = " → ".join(map(str, path))
         print(f"  {end:<4} {path_str:<20} {round(value, 2)} {unit}")
 
+    # Exact round trip through every city from the best starting node
+    # (Held–Karp over the shortest paths, same tiebreakers)
+    print(f"\n  ↻ SHORTEST TOUR FROM NODE {winner[0]}")
+    tour_limit = MAX_CITIES if NUMPY_AVAILABLE else PYTHON_MAX_CITIES
+    if len(cities) > tour_limit:
+        print(f"    Skipped: {len(cities)} cities (Held–Karp limit is {tour_limit})")
+        continue
+    tour, tour_totals, legs = shortest_tour(shortest, cities, metric, tiebreakers[metric],
+                                            start=winner[0])
+    if tour is None:
+        print("    No tour visits every city")
+        continue
+    tb_totals = ", ".join(f"{metric_names[tb]}: {round(total, 2)} {metric_units[tb]}"
+                          for tb, total in zip(tiebreakers[metric], tour_totals[1:]))
+    print(f"    Route: {' → '.join(map(str, tour))}")
+    print(f"    Total {name}: {round(tour_totals[0], 2)} {unit} ({tb_totals})")
+    print(f"\n  {'Leg':<8} {'Path':<20} {name:<10}")
+    print(f"  {'-'*8} {'-'*20} {'-'*10}")
+    for a, b, path in zip(tour, tour[1:], legs):
+        leg_str = f"{a} → {b}"
+        path_str = " → ".join(map(str, path))
+        print(f"  {leg_str:<8} {path_str:<20} {round(shortest.distance(a, b, metric), 2)} {unit}")
+
 print(f"\n{'=' * 50}")
\ No newline at end of file
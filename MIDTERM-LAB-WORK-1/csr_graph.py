@@ -0,0 +1,209 @@
+"""
+Compressed sparse row (CSR) form of the TSP road graph
+
+The edge dict {(u, v): {"D": ..., "T": ..., "F": ...}} costs a tuple hash
+and two dict lookups per relaxation and a few hundred bytes per edge.
+CSRGraph stores the same graph in flat typed arrays:
+
+- nodes get integer ids 0..n-1 (labels[i] is the original name of node i,
+  ids[label] the reverse)
+- the edges leaving node i are positions offsets[i]:offsets[i + 1] of
+  targets and of one weights[metric] array per metric, so the neighbors of
+  a node are a contiguous slice
+- a metric whose weights are all integers is stored as int64 ('q'), any
+  other as double ('d'), so distances keep the type they were given in
+
+That is 4 bytes per edge for the target plus 8 per metric. CSRBuilder
+streams edges in one at a time, so a large edge list never has to exist as
+Python objects.
+"""
+
+import gc
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import islice
+from operator import le
+
+# Metrics of the TSP graph: distance, time, fuel
+METRICS = ("D", "T", "F")
+
+# Weights checked first before converting a whole metric to int64
+_NARROW_SAMPLE = 1000
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector: building millions of rows and index
+    lists only creates acyclic objects, but each allocation burst would
+    still trigger full collections that rescan all of them.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class CSRGraph:
+    """
+    Directed graph in CSR form (see the module docstring); never changes.
+
+    The arrays can also be memoryviews of the same types, as returned for a
+    memory-mapped snapshot (graph_loader.py).
+    """
+
+    version = 0  # edit a RoadGraph and build a new CSRGraph instead
+
+    def __init__(self, labels, offsets, targets, weights):
+        self.labels = labels
+        self.ids = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets  # array('q'), n + 1 entries
+        self.targets = targets  # array('i'), one per edge
+        self.weights = weights  # {metric: array('q' or 'd')}, one per edge
+
+    @classmethod
+    def from_edges(cls, edges, nodes=(), metrics=None):
+        """
+        Build from an edge dict {(u, v): weights} or an iterable of
+        (u, v, weights) triples; weights is a {metric: value} mapping.
+        nodes adds nodes that may have no edges.
+        """
+        if hasattr(edges, "items"):
+            edges = ((u, v, weights) for (u, v), weights in edges.items())
+        builder = None
+        for u, v, weights in edges:
+            if builder is None:
+                builder = CSRBuilder(metrics or tuple(weights), nodes)
+            builder.add_edge(u, v, weights)
+        if builder is None:
+            builder = CSRBuilder(metrics or METRICS, nodes)
+        return builder.build()
+
+    @property
+    def node_count(self):
+        return len(self.labels)
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    @property
+    def metrics(self):
+        return tuple(self.weights)
+
+    def neighbors(self, node, metric):
+        """(targets, weights) slices of the edges leaving node id"""
+        lo, hi = self.offsets[node], self.offsets[node + 1]
+        return self.targets[lo:hi], self.weights[metric][lo:hi]
+
+    def edges(self):
+        """(u, v, {metric: weight}) for every edge, with the original labels"""
+        labels, offsets, targets = self.labels, self.offsets, self.targets
+        for u in range(self.node_count):
+            for e in range(offsets[u], offsets[u + 1]):
+                yield (labels[u], labels[targets[e]],
+                       {metric: values[e] for metric, values in self.weights.items()})
+
+
+class CSRBuilder:
+    """
+    Collects edges one at a time, then build() sorts them into a CSRGraph.
+
+    Node ids follow the sorted labels when the labels can be sorted (else
+    the order they were first seen in); every node's edges keep the order
+    they were added in.
+    """
+
+    def __init__(self, metrics=METRICS, nodes=()):
+        self.metrics = tuple(metrics)
+        self.ids = {}
+        self.labels = []
+        self.sources = array('i')
+        self.targets = array('i')
+        self.weights = [array('d') for _ in self.metrics]
+        for label in nodes:
+            self.node(label)
+
+    def node(self, label):
+        """Id of label, adding the node if it is new"""
+        node = self.ids.get(label)
+        if node is None:
+            node = self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        return node
+
+    def add_edge(self, u, v, weights):
+        """Add u → v; weights is a {metric: value} mapping or values in metrics order"""
+        if hasattr(weights, "keys"):
+            weights = [weights[metric] for metric in self.metrics]
+        self.add_ids(self.node(u), self.node(v), weights)
+
+    def add_ids(self, u, v, weights):
+        """add_edge() for node ids returned by node(), weights in metrics order"""
+        for values, value in zip(self.weights, weights):
+            values.append(value)
+        self.sources.append(u)
+        self.targets.append(v)
+
+    def add_columns(self, sources, targets, weights):
+        """Add many edges at once: node id columns plus one weight column per metric"""
+        for values, column in zip(self.weights, weights):
+            values.extend(column)
+        self.sources.extend(sources)
+        self.targets.extend(targets)
+
+    def build(self):
+        with gc_paused():
+            return self._build()
+
+    def _build(self):
+        labels, sources, targets = self.labels, self.sources, self.targets
+        n = len(labels)
+        try:
+            order = sorted(range(n), key=labels.__getitem__)
+        except TypeError:
+            order = range(n)
+        if any(old != new for new, old in enumerate(order)):
+            rank = array('i', bytes(4 * n))
+            for new, old in enumerate(order):
+                rank[old] = new
+            labels = [labels[old] for old in order]
+            sources = array('i', map(rank.__getitem__, sources))
+            targets = array('i', map(rank.__getitem__, targets))
+
+        weights = self.weights
+        # Edge lists are often already grouped by source: skip the permutation
+        if not all(map(le, sources, islice(sources, 1, None))):
+            edge_order = sorted(range(len(sources)), key=sources.__getitem__)
+            sources = array('i', map(sources.__getitem__, edge_order))
+            targets = array('i', map(targets.__getitem__, edge_order))
+            weights = [array('d', map(values.__getitem__, edge_order)) for values in weights]
+        offsets = array('q', (bisect_left(sources, u) for u in range(n + 1)))
+        return CSRGraph(labels, offsets, targets, dict(zip(self.metrics, map(_narrow, weights))))
+
+
+def typecode(values):
+    """Type code of a weight array or memoryview ('q' or 'd')"""
+    return getattr(values, "typecode", None) or values.format
+
+
+def _narrow(values):
+    """values as int64 if every weight is a whole number, else unchanged"""
+    if not all(map(float.is_integer, values[:_NARROW_SAMPLE])):
+        return values
+    try:
+        whole = array('q', map(int, values))
+    except (OverflowError, ValueError):  # inf / nan / beyond int64
+        return values
+    return whole if array('d', whole) == values else values
+
+
+def as_csr(graph, nodes=()):
+    """graph itself if it is a CSRGraph, else a CSRGraph built from the edge dict"""
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_edges(graph, nodes)
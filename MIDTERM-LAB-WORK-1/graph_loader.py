@@ -0,0 +1,239 @@
+"""
+Load a road graph from an edge list, with a memory-mapped binary snapshot
+
+Edge lists are one row per directed road, "u, v, D, T, F":
+
+- .csv (comma) or .tsv / .tab / .txt (tab) files, streamed in batches of
+  rows into a CSRBuilder; an optional header row names the metric columns,
+  and empty rows or rows starting with # are skipped
+- .json files: {"metrics": [...], "nodes": [...], "edges": [...]} where
+  every edge is [u, v, D, T, F] or {"u": ..., "v": ..., "D": ..., ...};
+  only "edges" is required
+
+Node names that look like integers become ints. After parsing, the CSR
+arrays are written to <source>.numcache. Later loads of an unchanged source
+(same size and modification time) memory-map that file instead of parsing:
+the graph arrays are then memoryviews over the page cache, so nothing is
+copied but the node labels.
+"""
+
+import csv
+import json
+import mmap
+import os
+import struct
+from array import array
+from itertools import filterfalse, islice, repeat
+from operator import itemgetter
+
+from csr_graph import METRICS, CSRBuilder, CSRGraph, gc_paused, typecode
+
+# First bytes of a snapshot file (bump the digit when the layout changes)
+SNAPSHOT_MAGIC = b"CSRSNAP1"
+
+# Suffix added to the source path for its snapshot
+SNAPSHOT_SUFFIX = ".numcache"
+
+# Edge-list rows parsed per batch (bounds the memory held as Python strings)
+CHUNK_ROWS = 65536
+
+_DELIMITERS = {".csv": ",", ".tsv": "\t", ".tab": "\t", ".txt": "\t"}
+
+# Labels stored as an int64 section; any others go in the JSON header
+_INT64 = range(-2 ** 63, 2 ** 63)
+
+
+def _label(text):
+    """Node name from a text field: int if it is one, else the stripped text"""
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return text
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _node_ids(builder, ids, column):
+    """Node ids for a column of raw names, adding new nodes"""
+    for name in filterfalse(ids.__contains__, dict.fromkeys(column)):
+        ids[name] = builder.node(_label(name))
+    return list(map(ids.__getitem__, column))
+
+
+def read_edge_list(path, delimiter=None):
+    """Stream a CSV/TSV edge list into a CSRGraph, CHUNK_ROWS rows at a time"""
+    if delimiter is None:
+        delimiter = _DELIMITERS.get(os.path.splitext(path)[1].lower(), ",")
+    builder = None
+    ids = {}  # raw field -> node id, so every name is parsed once
+    line = 0
+    with open(path, newline="", encoding="utf-8") as f, gc_paused():
+        reader = csv.reader(f, delimiter=delimiter)
+        while True:
+            chunk = list(islice(reader, CHUNK_ROWS))
+            if not chunk:
+                break
+            first_line = line + 1
+            line += len(chunk)
+            rows = chunk
+            widths = set(map(len, chunk))
+            # Only look at rows one by one when there is something to skip
+            if len(widths) > 1 or 0 in widths or \
+                    any(map(str.startswith, map(itemgetter(0), chunk), repeat("#"))):
+                rows = [row for row in chunk
+                        if row and row[0].strip() and not row[0].lstrip().startswith("#")]
+                if not rows:
+                    continue
+            if builder is None:
+                if len(rows[0]) < 3:
+                    raise ValueError(f"{path}:{first_line}: expected u, v and at least one metric")
+                if not _is_number(rows[0][2]):  # header row
+                    builder = CSRBuilder([name.strip() for name in rows.pop(0)[2:]])
+                else:
+                    count = len(rows[0]) - 2
+                    builder = CSRBuilder(METRICS[:count] if count <= len(METRICS)
+                                         else [f"W{i}" for i in range(count)])
+            width = len(builder.metrics) + 2
+            if not rows:
+                continue
+            if set(map(len, rows)) != {width}:
+                row = next(row for row in rows if len(row) != width)
+                raise ValueError(f"{path}:{first_line + chunk.index(row)}: "
+                                 f"expected {width} columns, got {len(row)}")
+            columns = list(zip(*rows))
+            try:
+                weights = [array('d', map(float, column)) for column in columns[2:]]
+            except ValueError:
+                raise ValueError(f"{path}:{first_line}-{line}: weights must be numbers") from None
+            builder.add_columns(_node_ids(builder, ids, columns[0]),
+                                _node_ids(builder, ids, columns[1]), weights)
+    return (builder or CSRBuilder()).build()
+
+
+def read_json(path):
+    """Read the JSON edge-list form into a CSRGraph"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    edges = data["edges"]
+    metrics = data.get("metrics")
+    if metrics is None:
+        if edges and isinstance(edges[0], dict):
+            metrics = [key for key in edges[0] if key not in ("u", "v")]
+        else:
+            metrics = METRICS
+    builder = CSRBuilder(metrics, data.get("nodes", ()))
+    for edge in edges:
+        if isinstance(edge, dict):
+            builder.add_edge(edge["u"], edge["v"], edge)
+        else:
+            builder.add_edge(edge[0], edge[1], edge[2:])
+    return builder.build()
+
+
+def snapshot_path(path):
+    return path + SNAPSHOT_SUFFIX
+
+
+def _pad(f):
+    """Align the next section to 8 bytes"""
+    f.write(b"\0" * (-f.tell() % 8))
+
+
+def write_snapshot(graph, path, source=None):
+    """
+    Write graph's CSR arrays to path. With source, its size and modification
+    time are recorded so load_graph() can tell when the snapshot is stale.
+    """
+    int_labels = all(type(label) is int and label in _INT64 for label in graph.labels)
+    header = {
+        "nodes": graph.node_count,
+        "edges": graph.edge_count,
+        "metrics": list(graph.metrics),
+        "typecodes": [typecode(values) for values in graph.weights.values()],
+        "labels": None if int_labels else graph.labels,
+    }
+    if source is not None:
+        stat = os.stat(source)
+        header["source_size"] = stat.st_size
+        header["source_mtime_ns"] = stat.st_mtime_ns
+    encoded = json.dumps(header).encode("utf-8")
+    sections = [array('q', graph.labels)] if int_labels else []
+    sections += [graph.offsets, graph.targets, *graph.weights.values()]
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<Q", len(encoded)))
+        f.write(encoded)
+        for values in sections:
+            _pad(f)
+            f.write(memoryview(values).cast("B"))
+    os.replace(temporary, path)
+
+
+def read_snapshot(path, source=None):
+    """
+    Memory-map a snapshot as a CSRGraph, or return None if the file is not a
+    snapshot or (with source) was written for a different version of it.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            return None
+        size, = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(size).decode("utf-8"))
+        if source is not None:
+            stat = os.stat(source)
+            if (header.get("source_size"), header.get("source_mtime_ns")) != \
+                    (stat.st_size, stat.st_mtime_ns):
+                return None
+        position = f.tell()
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def section(code, count):
+        nonlocal position
+        position += -position % 8
+        start = position
+        position += count * struct.calcsize(code)
+        return view[start:position].cast(code)
+
+    n, m = header["nodes"], header["edges"]
+    labels = header["labels"]
+    if labels is None:
+        labels = section("q", n).tolist()
+    offsets = section("q", n + 1)
+    targets = section("i", m)
+    weights = {metric: section(code, m)
+               for metric, code in zip(header["metrics"], header["typecodes"])}
+    return CSRGraph(labels, offsets, targets, weights)
+
+
+def load_graph(path, snapshot=True):
+    """
+    CSRGraph from an edge-list file (format chosen by extension).
+
+    With snapshot, an up-to-date <path>.numcache is memory-mapped instead of
+    parsing the file, and a fresh one is written after parsing (skipped
+    silently if the directory is read-only).
+    """
+    cache = snapshot_path(path)
+    if snapshot and os.path.exists(cache):
+        graph = read_snapshot(cache, source=path)
+        if graph is not None:
+            return graph
+    if os.path.splitext(path)[1].lower() == ".json":
+        graph = read_json(path)
+    else:
+        graph = read_edge_list(path)
+    if snapshot:
+        try:
+            write_snapshot(graph, cache, source=path)
+        except OSError:
+            pass
+    return graph
@@ -0,0 +1,202 @@
+"""
+Exact travelling-salesman tours (Held–Karp)
+
+A tour starts at one city, visits every other city once and returns. Legs
+run over the metric closure: the cost of going from a to b is the shortest
+path between them (shortest_paths.PathCache), so a leg may pass through
+other cities on the road network.
+
+Held–Karp fills cost[S][j], the cheapest way to leave the start, visit
+exactly the cities in bitmask S and stop at j ∈ S, one subset size at a
+time: O(2^n · n²) time and O(2^n · n) memory instead of O(n!). The tables
+are flat arrays:
+
+- with NumPy, one float64 table per compared metric plus an int8 table of
+  predecessors, and each subset size is relaxed in a few vectorized steps;
+  20 cities take 2^19 · 19 entries, about 80 MB per metric
+- without NumPy, a pure Python version handles up to PYTHON_MAX_CITIES
+
+Tours are compared on the primary metric first and then on the
+tiebreaker metrics in order, like the report in TSP.py. Totals that
+differ by less than TIE_TOLERANCE (relative) count as tied.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+INF = float("inf")
+
+# Largest tour solved (the tables grow as 2^n · n)
+MAX_CITIES = 20
+
+# Largest tour solved without NumPy
+PYTHON_MAX_CITIES = 12
+
+# Relative difference below which two totals count as tied
+TIE_TOLERANCE = 1e-9
+
+
+def _python_held_karp(costs, start):
+    """Held–Karp on nested lists (see held_karp); costs is [metric][i][j]"""
+    n = len(costs[0])
+    others = [city for city in range(n) if city != start]
+    m = len(others)
+    full = (1 << m) - 1
+    # table[c][S * m + j]: metric c total of the best path for subset S ending at others[j]
+    table = [array('d', [INF]) * ((full + 1) * m) for _ in costs]
+    parent = array('b', [-1]) * ((full + 1) * m)
+    for j, city in enumerate(others):
+        for c, matrix in enumerate(costs):
+            table[c][(1 << j) * m + j] = matrix[start][city]
+
+    def better(candidate, best):
+        for a, b in zip(candidate, best):
+            if abs(a - b) > TIE_TOLERANCE * max(1.0, abs(b)) or (a == INF) != (b == INF):
+                return a < b
+        return False
+
+    masks = sorted(range(1, full + 1), key=lambda mask: bin(mask).count("1"))
+    for subset in masks:
+        if subset & (subset - 1) == 0:  # single city: set above
+            continue
+        for j in range(m):
+            if not subset >> j & 1:
+                continue
+            previous = subset ^ (1 << j)
+            best, best_k = None, -1
+            for k in range(m):
+                if not previous >> k & 1:
+                    continue
+                candidate = tuple(table[c][previous * m + k] + costs[c][others[k]][others[j]]
+                                  for c in range(len(costs)))
+                if best is None or better(candidate, best):
+                    best, best_k = candidate, k
+            for c in range(len(costs)):
+                table[c][subset * m + j] = best[c]
+            parent[subset * m + j] = best_k
+
+    best, last = None, -1
+    for j in range(m):
+        candidate = tuple(table[c][full * m + j] + costs[c][others[j]][start]
+                          for c in range(len(costs)))
+        if best is None or better(candidate, best):
+            best, last = candidate, j
+    return _walk_back(parent, m, full, last, others, start), best
+
+
+def _lexicographic_argmin(candidates):
+    """Per row, the first column that is minimal on candidates[0], then [1], ..."""
+    tied = None
+    for values in candidates:
+        if tied is not None:
+            values = np.where(tied, values, np.inf)
+        best = values.min(axis=1, keepdims=True)
+        close = values <= best + TIE_TOLERANCE * np.maximum(1.0, np.abs(best))
+        close |= np.isinf(best)
+        tied = close if tied is None else tied & close
+    return tied.argmax(axis=1)
+
+
+def _numpy_held_karp(costs, start):
+    """Held–Karp over all subsets of one size at a time (see held_karp)"""
+    matrices = [np.array(matrix, dtype=np.float64) for matrix in costs]
+    n = matrices[0].shape[0]
+    others = np.array([city for city in range(n) if city != start], dtype=np.intp)
+    m = len(others)
+    full = (1 << m) - 1
+    legs = [matrix[np.ix_(others, others)] for matrix in matrices]  # legs[c][k, j]: k → j
+    tables = [np.full((full + 1, m), np.inf) for _ in matrices]
+    parent = np.full((full + 1, m), -1, dtype=np.int8)
+    for table, matrix in zip(tables, matrices):
+        table[1 << np.arange(m), np.arange(m)] = matrix[start, others]
+
+    masks = np.arange(full + 1)
+    sizes = np.zeros(full + 1, dtype=np.int8)
+    for j in range(m):
+        sizes += (masks >> j) & 1
+    for size in range(2, m + 1):
+        layer = masks[sizes == size]
+        for j in range(m):
+            subsets = layer[(layer >> j) & 1 == 1]
+            previous = subsets ^ (1 << j)
+            candidates = [table[previous] + leg[:, j] for table, leg in zip(tables, legs)]
+            best = _lexicographic_argmin(candidates)
+            rows = np.arange(len(subsets))
+            for table, values in zip(tables, candidates):
+                table[subsets, j] = values[rows, best]
+            parent[subsets, j] = best
+
+    closing = [table[full] + matrix[others, start] for table, matrix in zip(tables, matrices)]
+    last = int(_lexicographic_argmin([values[None, :] for values in closing])[0])
+    totals = tuple(float(values[last]) for values in closing)
+    return _walk_back(parent.ravel(), m, full, last, others.tolist(), start), totals
+
+
+def _walk_back(parent, m, subset, last, others, start):
+    """Tour as city indices start → ... → start from a flat predecessor table"""
+    tour = [start]
+    j = last
+    while j != -1:
+        tour.append(others[j])
+        previous = subset ^ (1 << j)
+        j, subset = int(parent[subset * m + j]), previous
+    tour.append(start)
+    tour.reverse()
+    return tour
+
+
+def held_karp(costs, start=0):
+    """
+    Exact tour over n cities.
+
+    costs is a list of n × n matrices (primary metric first, then the
+    tiebreakers); costs[c][i][j] is the cost of going from city i to city j,
+    None or INF if there is no route. Returns (tour, totals): the city
+    indices from start back to start, and the tour's total for every
+    matrix. Returns (None, None) if no tour exists.
+    """
+    costs = [[[INF if value is None else value for value in row] for row in matrix]
+             for matrix in costs]
+    n = len(costs[0])
+    if n > MAX_CITIES:
+        raise ValueError(f"Held–Karp is limited to {MAX_CITIES} cities, got {n}")
+    if n == 1:
+        return [start, start], tuple(0 for _ in costs)
+    if NUMPY_AVAILABLE:
+        tour, totals = _numpy_held_karp(costs, start)
+    elif n <= PYTHON_MAX_CITIES:
+        tour, totals = _python_held_karp(costs, start)
+    else:
+        raise ValueError(f"Tours over {PYTHON_MAX_CITIES} cities need NumPy (pip install numpy)")
+    if totals[0] == INF:
+        return None, None
+    return tour, totals
+
+
+def shortest_tour(paths, cities, metric, tiebreakers=(), start=None):
+    """
+    Best tour through cities by metric, ties broken by tiebreakers in order.
+
+    paths is a PathCache over the road graph. Returns (tour, totals, legs)
+    with city labels from start (default: the first city) back to it, the
+    totals in (metric, *tiebreakers) order, and the road path of every leg
+    by metric; or (None, None, None) if some city cannot be reached.
+    """
+    cities = list(cities)
+    metrics = (metric, *tiebreakers)
+    costs = [[[0 if a == b else paths.distance(a, b, m) for b in cities] for a in cities]
+             for m in metrics]
+    tour, totals = held_karp(costs, cities.index(start) if start is not None else 0)
+    if tour is None:
+        return None, None, None
+    tour = [cities[i] for i in tour]
+    # Re-add the legs so integer metrics keep integer totals
+    totals = tuple(sum(paths.distance(a, b, m) for a, b in zip(tour, tour[1:]))
+                   for m in metrics)
+    legs = [paths.path(a, b, metric)[0] for a, b in zip(tour, tour[1:])]
+    return tour, totals, legs
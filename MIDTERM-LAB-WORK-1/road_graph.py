@@ -0,0 +1,62 @@
+"""
+Versioned edge dict for the TSP road graph
+
+RoadGraph is the {(u, v): {"D": ..., "T": ..., "F": ...}} dict TSP.py
+always used, plus a version counter that goes up on every edge change.
+Caches of shortest paths (shortest_paths.PathCache) compare versions to
+know when they are stale. Edge weights are stored read-only, so a change
+has to replace the edge and cannot bypass the counter:
+
+    graph[(1, 2)] = {"D": 8, "T": 12, "F": 1.0}    # version + 1
+    graph[(1, 2)]["D"] = 8                          # TypeError
+"""
+
+from types import MappingProxyType
+
+
+class RoadGraph(dict):
+    """Edge dict {(u, v): weights} whose .version counts changes"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.version = 0
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, edge, weights):
+        super().__setitem__(edge, MappingProxyType(dict(weights)))
+        self.version += 1
+
+    def __delitem__(self, edge):
+        super().__delitem__(edge)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        for edge, weights in dict(*args, **kwargs).items():
+            self[edge] = weights
+
+    def setdefault(self, edge, weights):
+        if edge not in self:
+            self[edge] = weights
+        return self[edge]
+
+    def pop(self, edge, *default):
+        if edge in self:
+            self.version += 1
+        return super().pop(edge, *default)
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def nodes(self):
+        """Sorted list of every node that has an edge"""
+        return sorted({node for edge in self for node in edge})
@@ -0,0 +1,228 @@
+"""
+Shortest paths for the TSP road graph
+
+find_best_path used to try the direct edge and every route through one or
+two intermediate cities, which misses longer optimal routes. These
+functions answer any (start, end, metric) query exactly. They run on a
+CSRGraph (csr_graph.py) over integer node ids; shortest_path and PathCache
+also take the TSP.py edge dict {(u, v): {"D": ..., "T": ..., "F": ...}}
+and speak in its node labels.
+
+- dijkstra: one source, binary heap (heapq), O((V + E) log V)
+- floyd_warshall: all pairs at once, O(V³), for small dense graphs
+- shortest_path answers one query, all_pairs picks the algorithm
+- PathCache keeps the all-pairs arrays per metric until the graph changes
+
+Results are typed arrays indexed by node id: dist, and pred (the node
+before each node on its shortest path, the source for itself, -1 when
+unreachable). Paths are rebuilt with reconstruct_path. Weights must be
+non-negative. Routes with equal totals are resolved in favour of fewer
+edges, so direct roads are printed as direct roads.
+"""
+
+import heapq
+from array import array
+
+from csr_graph import as_csr, typecode
+
+INF = float("inf")
+
+# Graphs with at least this fraction of all possible edges are dense (below
+# it one Dijkstra per source measured faster than Floyd–Warshall)
+DENSE_RATIO = 0.75
+
+# Floyd–Warshall is only used up to this many nodes (O(V³) in pure Python)
+FLOYD_MAX_NODES = 400
+
+
+def is_dense(csr):
+    """True if Floyd–Warshall beats one Dijkstra per source for this graph"""
+    n = csr.node_count
+    return 1 < n <= FLOYD_MAX_NODES and csr.edge_count >= DENSE_RATIO * n * (n - 1)
+
+
+def _result(dist, pred, weights):
+    """Typed (dist, pred) arrays; unreachable nodes get distance 0"""
+    return (array(typecode(weights), [0 if d is None or d == INF else d for d in dist]),
+            array('i', pred))
+
+
+def dijkstra(csr, source, metric):
+    """
+    Shortest paths by metric from node id source (binary heap, lazy
+    deletion). Returns (dist, pred) arrays indexed by node id.
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights[metric]
+    n = csr.node_count
+    dist = [None] * n
+    hops = [0] * n
+    pred = [-1] * n
+    dist[source] = 0
+    pred[source] = source
+    heap = [(0, 0, source)]
+    settled = bytearray(n)
+    while heap:
+        d, h, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        h += 1
+        lo, hi = offsets[u], offsets[u + 1]
+        for v, weight in zip(targets[lo:hi], weights[lo:hi]):
+            nd = d + weight
+            old = dist[v]
+            if old is None or nd < old or (nd == old and h < hops[v]):
+                dist[v] = nd
+                hops[v] = h
+                pred[v] = u
+                heapq.heappush(heap, (nd, h, v))
+    return _result(dist, pred, weights)
+
+
+def floyd_warshall(csr, metric):
+    """
+    Shortest paths by metric between all pairs, by dynamic programming over
+    intermediate nodes. Returns one (dist, pred) pair per source id.
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights[metric]
+    n = csr.node_count
+    dist = [[INF] * n for _ in range(n)]
+    hops = [[0] * n for _ in range(n)]
+    pred = [[-1] * n for _ in range(n)]
+    for i in range(n):
+        dist[i][i] = 0
+        pred[i][i] = i
+        for e in range(offsets[i], offsets[i + 1]):
+            j = targets[e]
+            if i != j and weights[e] < dist[i][j]:
+                dist[i][j] = weights[e]
+                hops[i][j] = 1
+                pred[i][j] = i
+
+    for k in range(n):
+        dist_k, hops_k, pred_k = dist[k], hops[k], pred[k]
+        for i in range(n):
+            d_ik = dist[i][k]
+            if d_ik == INF or i == k:
+                continue
+            h_ik = hops[i][k]
+            dist_i, hops_i, pred_i = dist[i], hops[i], pred[i]
+            for j in range(n):
+                d = d_ik + dist_k[j]
+                if d < dist_i[j] or (d == dist_i[j] and j != i and h_ik + hops_k[j] < hops_i[j]):
+                    dist_i[j] = d
+                    hops_i[j] = h_ik + hops_k[j]
+                    pred_i[j] = pred_k[j]
+
+    return [_result(dist[i], pred[i], weights) for i in range(n)]
+
+
+def all_pairs(csr, metric, method="auto"):
+    """
+    Shortest paths by metric between all pairs: one (dist, pred) per source id.
+
+    method is "dijkstra", "floyd-warshall" or "auto" (Floyd–Warshall for
+    small dense graphs, otherwise Dijkstra from every source).
+    """
+    if method == "floyd-warshall" or (method == "auto" and is_dense(csr)):
+        return floyd_warshall(csr, metric)
+    if method not in ("auto", "dijkstra"):
+        raise ValueError(f"Unknown method: {method!r}")
+    return [dijkstra(csr, source, metric) for source in range(csr.node_count)]
+
+
+def reconstruct_path(pred, start, end):
+    """Node ids start → end from a pred array, or None if end is unreachable"""
+    if pred[end] == -1:
+        return None
+    path = [end]
+    while path[-1] != start:
+        path.append(pred[path[-1]])
+    path.reverse()
+    return path
+
+
+def shortest_path(graph, start, end, metric):
+    """(path, total) of the shortest start → end route by metric, or (None, None)"""
+    csr = as_csr(graph, (start, end))
+    source, target = csr.ids.get(start), csr.ids.get(end)
+    if source is None or target is None:
+        return None, None
+    dist, pred = dijkstra(csr, source, metric)
+    path = reconstruct_path(pred, source, target)
+    if path is None:
+        return None, None
+    return [csr.labels[node] for node in path], dist[target]
+
+
+class PathCache:
+    """
+    All-pairs distance and predecessor arrays, computed once per metric.
+
+    The arrays are rebuilt on the next query after graph.version changed
+    (RoadGraph counts its edge changes). A graph without a version is
+    assumed never to change; call invalidate() after editing it.
+    """
+
+    def __init__(self, graph, nodes=(), method="auto"):
+        self.graph = graph
+        self.nodes = tuple(nodes)
+        self.method = method
+        self._csr = None  # (graph version, CSRGraph)
+        self._matrices = {}  # metric -> (graph version, [(dist, pred) per source id])
+
+    def invalidate(self):
+        """Forget the CSR form and every metric's arrays"""
+        self._csr = None
+        self._matrices.clear()
+
+    def csr(self):
+        """The graph as a CSRGraph, rebuilt only if the graph changed"""
+        version = getattr(self.graph, "version", None)
+        if self._csr is None or self._csr[0] != version:
+            self._csr = (version, as_csr(self.graph, self.nodes))
+        return self._csr[1]
+
+    def matrices(self, metric):
+        """[(dist, pred) per source id] for metric, recomputed only if the graph changed"""
+        version = getattr(self.graph, "version", None)
+        cached = self._matrices.get(metric)
+        if cached is None or cached[0] != version:
+            cached = (version, all_pairs(self.csr(), metric, self.method))
+            self._matrices[metric] = cached
+        return cached[1]
+
+    def _row(self, start, end, metric):
+        """(dist, pred, source id, target id), or None if end is unreachable"""
+        rows = self.matrices(metric)
+        ids = self.csr().ids
+        source, target = ids.get(start), ids.get(end)
+        if source is None or target is None or rows[source][1][target] == -1:
+            return None
+        return rows[source] + (source, target)
+
+    def distance(self, start, end, metric):
+        """Shortest start → end total by metric, or None if unreachable"""
+        row = self._row(start, end, metric)
+        return row[0][row[3]] if row is not None else None
+
+    def path(self, start, end, metric):
+        """(path, total) like shortest_path(), read from the cache"""
+        row = self._row(start, end, metric)
+        if row is None:
+            return None, None
+        dist, pred, source, target = row
+        labels = self.csr().labels
+        return [labels[node] for node in reconstruct_path(pred, source, target)], dist[target]
+
+    def total(self, start, metric, targets):
+        """Sum of the shortest distances from start to every other target, or None"""
+        total = 0
+        for end in targets:
+            if end == start:
+                continue
+            value = self.distance(start, end, metric)
+            if value is None:
+                return None
+            total += value
+        return total
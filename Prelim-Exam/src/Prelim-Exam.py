@@ -2,13 +2,32 @@
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import csv
+import locale
+import os
+import sys
 import time
 import threading
 
+# Shared sorting engine lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import sorting_engine
+
 
 class SortingBenchmark:
     
+    # Text comparison modes -> sorting_engine key transforms
+    TEXT_TRANSFORMS = {
+        "Case-insensitive": "casefold",
+        "Case-sensitive": "none",
+        "Locale collation": "collate",
+    }
+    
+    # "Then by" choice for no tie-breaker column
+    NO_COLUMN = "(none)"
+    
+    # Rows shown in the results view (and selected in "Top only" mode)
+    RESULT_ROWS = 10
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Sorting Algorithm Benchmark Tool")
@@ -18,11 +37,18 @@ class SortingBenchmark:
         # Data storage
         self.data = []
         self.sorted_data = []
+        self.sort_stats = sorting_engine.SortStats()
+        self.profiling = False
+        self.profile_memory = False
+        self.profile_report = None
+        self.top_only = False
+        self.sorted_rows = 0
         self.file_path = None
         self.load_time = 0
         self.sort_time = 0
         self.is_sorting = False
-        self.cancel_sorting = False
+        self.cancel_event = threading.Event()
+        self.progress_channel = sorting_engine.ProgressChannel()
         
         # Configure style
         self.style = ttk.Style()
@@ -70,7 +96,7 @@ class SortingBenchmark:
         ttk.Label(config_inner, text="Algorithm:", style="Header.TLabel").grid(row=0, column=2, sticky=tk.W, padx=(20, 5), pady=5)
         self.algorithm_var = tk.StringVar(value="Merge Sort")
         algorithm_combo = ttk.Combobox(config_inner, textvariable=self.algorithm_var, 
-                                        values=["Bubble Sort", "Insertion Sort", "Merge Sort"], state="readonly", width=15)
+                                        values=list(sorting_engine.ALGORITHMS), state="readonly", width=15)
         algorithm_combo.grid(row=0, column=3, sticky=tk.W, padx=5, pady=5)
         
         # Number of rows
@@ -87,6 +113,35 @@ class SortingBenchmark:
                                     values=["Ascending", "Descending"], state="readonly", width=15)
         order_combo.grid(row=1, column=3, sticky=tk.W, padx=5, pady=5)
         
+        # Text comparison (key transform applied once per record)
+        ttk.Label(config_inner, text="Text Compare:", style="Header.TLabel").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.text_compare_var = tk.StringVar(value="Case-insensitive")
+        text_compare_combo = ttk.Combobox(config_inner, textvariable=self.text_compare_var,
+                                          values=list(self.TEXT_TRANSFORMS), state="readonly", width=15)
+        text_compare_combo.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+        
+        # Worker processes for Parallel Merge Sort
+        ttk.Label(config_inner, text="Workers:", style="Header.TLabel").grid(row=2, column=2, sticky=tk.W, padx=(20, 5), pady=5)
+        self.workers_var = tk.StringVar(value="Auto")
+        workers_combo = ttk.Combobox(config_inner, textvariable=self.workers_var,
+                                     values=["Auto", "1", "2", "4", "8", "16", "32"], width=15)
+        workers_combo.grid(row=2, column=3, sticky=tk.W, padx=5, pady=5)
+        
+        # Tie-breaker columns, packed with the main column into one sort key
+        ttk.Label(config_inner, text="Then by:", style="Header.TLabel").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        then_frame = ttk.Frame(config_inner)
+        then_frame.grid(row=3, column=1, columnspan=3, sticky=tk.W, padx=5, pady=5)
+        self.then_by_vars = []
+        for _ in range(2):
+            then_column_var = tk.StringVar(value=self.NO_COLUMN)
+            then_order_var = tk.StringVar(value="Ascending")
+            ttk.Combobox(then_frame, textvariable=then_column_var,
+                         values=[self.NO_COLUMN, "ID", "FirstName", "LastName"],
+                         state="readonly", width=12).pack(side=tk.LEFT, padx=(0, 5))
+            ttk.Combobox(then_frame, textvariable=then_order_var, values=["Ascending", "Descending"],
+                         state="readonly", width=11).pack(side=tk.LEFT, padx=(0, 15))
+            self.then_by_vars.append((then_column_var, then_order_var))
+        
         # Sort buttons frame
         btn_frame = ttk.Frame(config_frame)
         btn_frame.pack(pady=(10, 0))
@@ -94,9 +149,26 @@ class SortingBenchmark:
         self.sort_btn = ttk.Button(btn_frame, text="🚀 Start Sorting", command=self._start_sorting, state="disabled")
         self.sort_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.external_btn = ttk.Button(btn_frame, text="💾 Sort File to Disk", command=self._start_external_sort)
+        self.external_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         self.cancel_btn = ttk.Button(btn_frame, text="⛔ Cancel", command=self._cancel_sorting, state="disabled")
         self.cancel_btn.pack(side=tk.LEFT)
         
+        # Partial sort: select only the rows the results view shows
+        self.top_only_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text=f"⚡ Top {self.RESULT_ROWS} only (partial sort)",
+                        variable=self.top_only_var).pack(side=tk.LEFT, padx=(20, 0))
+        
+        # Opt-in profiling: cProfile and stack samples of the sort, plus peak
+        # memory from a second, traced run (several times slower) if ticked
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="🔬 Profile run",
+                        variable=self.profile_var).pack(side=tk.LEFT, padx=(10, 0))
+        self.profile_memory_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(btn_frame, text="Peak memory",
+                        variable=self.profile_memory_var).pack(side=tk.LEFT, padx=(5, 0))
+        
         # Progress frame
         progress_frame = ttk.LabelFrame(main_frame, text="📈 Progress", padding="10")
         progress_frame.pack(fill=tk.X, pady=(0, 10))
@@ -133,12 +205,12 @@ class SortingBenchmark:
         self.complexity_label.grid(row=1, column=3, sticky=tk.W, padx=5, pady=2)
         
         # Results frame
-        results_frame = ttk.LabelFrame(main_frame, text="📋 Sorted Results (First 10 Records)", padding="10")
+        results_frame = ttk.LabelFrame(main_frame, text=f"📋 Sorted Results (First {self.RESULT_ROWS} Records)", padding="10")
         results_frame.pack(fill=tk.BOTH, expand=True)
         
         # Treeview for results
         columns = ("ID", "FirstName", "LastName")
-        self.results_tree = ttk.Treeview(results_frame, columns=columns, show="headings", height=10)
+        self.results_tree = ttk.Treeview(results_frame, columns=columns, show="headings", height=self.RESULT_ROWS)
         
         for col in columns:
             self.results_tree.heading(col, text=col)
@@ -155,7 +227,7 @@ class SortingBenchmark:
         info_frame = ttk.Frame(main_frame)
         info_frame.pack(fill=tk.X, pady=(10, 0))
         
-        info_text = "📖 Complexity: Merge Sort = O(n log n) | Bubble/Insertion Sort = O(n²)"
+        info_text = "📖 Complexity: Merge Sort = O(n log n) | Tim Sort = O(n) on presorted data | Bubble/Insertion Sort = O(n²)"
         ttk.Label(info_frame, text=info_text, style="Info.TLabel", foreground="gray").pack()
     
     def _load_file(self):
@@ -175,13 +247,8 @@ class SortingBenchmark:
         try:
             start_time = time.perf_counter()
             
-            self.data = []
-            with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # Convert ID to integer for proper numeric sorting
-                    row['ID'] = int(row['ID'])
-                    self.data.append(row)
+            # Columnar store: ID in an int array, names dictionary-encoded
+            self.data = sorting_engine.RecordStore.from_csv(file_path, int_columns=("ID",))
             
             end_time = time.perf_counter()
             self.load_time = end_time - start_time
@@ -216,10 +283,17 @@ class SortingBenchmark:
             messagebox.showwarning("Warning", f"Requested {n:,} rows but file only has {len(self.data):,}. Using all available rows.")
             n = len(self.data)
         
+        workers = self.workers_var.get().strip()
+        try:
+            sorting_engine.set_default_workers(None if workers in ("", "Auto") else int(workers))
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Workers must be 'Auto' or a positive number.")
+            return
+        
         algorithm = self.algorithm_var.get()
         
-        # Warn for large datasets with O(n²) algorithms
-        if algorithm in ["Bubble Sort", "Insertion Sort"] and n > 10000:
+        # Warn for large datasets with O(n²) algorithms (top-only mode does not sort)
+        if algorithm in ["Bubble Sort", "Insertion Sort"] and n > 10000 and not self.top_only_var.get():
             estimated_time = (n / 1000) ** 2 * 0.5  # Rough estimate in seconds
             result = messagebox.askyesno(
                 "⚠️ Performance Warning",
@@ -234,103 +308,291 @@ class SortingBenchmark:
         
         # Start sorting in a separate thread
         self.is_sorting = True
-        self.cancel_sorting = False
+        self.cancel_event.clear()
         self.sort_btn.config(state="disabled")
+        self.external_btn.config(state="disabled")
         self.load_btn.config(state="disabled")
         self.cancel_btn.config(state="normal")
         
+        self.profiling = self.profile_var.get()
+        self.profile_memory = self.profile_memory_var.get()
+        self.progress_channel.reset()
         thread = threading.Thread(target=self._perform_sorting, args=(n,))
         thread.daemon = True
         thread.start()
+        self._poll_progress()
+    
+    def _start_external_sort(self):
+        """Sort a CSV file of any size file-to-file, without loading it into memory."""
+        if self.is_sorting:
+            return
+        
+        input_path = filedialog.askopenfilename(
+            title="Select CSV File to Sort",
+            filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
+        )
+        if not input_path:
+            return
+        output_path = filedialog.asksaveasfilename(
+            title="Save Sorted CSV As",
+            defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv"), ("All Files", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        self.is_sorting = True
+        self.cancel_event.clear()
+        self.sort_btn.config(state="disabled")
+        self.external_btn.config(state="disabled")
+        self.load_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.complexity_label.config(text=sorting_engine.COMPLEXITY_INFO["Merge Sort"]["average"])
+        self.status_label.config(text="Sorting file in chunks (external merge sort)...")
+        self.progress_var.set(0)
+        
+        self.progress_channel.reset()
+        thread = threading.Thread(target=self._perform_external_sort, args=(input_path, output_path))
+        thread.daemon = True
+        thread.start()
+        self._poll_progress()
+    
+    def _perform_external_sort(self, input_path, output_path):
+        """Run the external merge sort: sorted runs on disk, then a k-way merge."""
+        stats = sorting_engine.SortStats()
+        start_time = time.perf_counter()
+        try:
+            written = sorting_engine.external_sort_csv(
+                input_path,
+                output_path,
+                column=self.column_var.get(),
+                kernel=sorting_engine.merge_sort,
+                reverse=self.order_var.get() != "Ascending",
+                transform=self.TEXT_TRANSFORMS.get(self.text_compare_var.get(), "casefold"),
+                progress_callback=self.progress_channel,
+                cancel_event=self.cancel_event,
+                stats=stats,
+            )
+            error = None
+        except Exception as e:
+            written, error = 0, e
+        elapsed = time.perf_counter() - start_time
+        self.root.after(0, lambda: self._finish_external_sort(output_path, written, stats.passes, elapsed, error))
+    
+    def _finish_external_sort(self, output_path, written, runs, elapsed, error):
+        """Report the external sort result and re-enable the buttons."""
+        if error is not None:
+            messagebox.showerror("Error", f"External sort failed:\n{str(error)}")
+            self.status_label.config(text="❌ External sort failed")
+        elif self.cancel_event.is_set():
+            self.status_label.config(text="❌ Sorting cancelled by user (output file is incomplete).")
+        else:
+            filename = os.path.basename(output_path)
+            self.sort_time_label.config(text=f"{elapsed:.4f} seconds")
+            self.total_rows_label.config(text=f"{written:,}")
+            self.progress_var.set(100)
+            self.status_label.config(
+                text=f"✅ Sorted {written:,} records into {filename} ({runs} runs merged)."
+            )
+        
+        self.sort_btn.config(state="normal" if len(self.data) else "disabled")
+        self.external_btn.config(state="normal")
+        self.load_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        self.is_sorting = False
+        self.cancel_event.clear()
     
     def _cancel_sorting(self):
         """Cancel the current sorting operation."""
         if self.is_sorting:
-            self.cancel_sorting = True
+            self.cancel_event.set()
             self.status_label.config(text="⏳ Cancelling... Please wait.")
             self.cancel_btn.config(state="disabled")
     
     def _perform_sorting(self, n):
         """Perform the sorting operation."""
         algorithm = self.algorithm_var.get()
-        column = self.column_var.get()
-        ascending = self.order_var.get() == "Ascending"
+        column, ascending, order_text = self._sort_columns()
+        self.top_only = self.top_only_var.get()
+        if self.top_only:
+            algorithm = f"Top-{self.RESULT_ROWS} selection"
         
         # Update complexity display
-        if algorithm == "Merge Sort":
-            complexity = "O(n log n)"
+        if self.top_only:
+            complexity = "O(n + k log k)" if sorting_engine.NUMPY_AVAILABLE else "O(n log k)"
         else:
-            complexity = "O(n²)"
+            complexity = sorting_engine.COMPLEXITY_INFO[algorithm]["average"]
         
         self.root.after(0, lambda: self.complexity_label.config(text=complexity))
-        self.root.after(0, lambda: self.status_label.config(text=f"Sorting {n:,} rows using {algorithm}..."))
+        self.root.after(0, lambda: self.status_label.config(
+            text=f"Sorting {n:,} rows by {order_text} using {algorithm}..."))
         self.root.after(0, lambda: self.progress_var.set(0))
         
         # Copy data subset
-        data_to_sort = self.data[:n].copy()
-        
-        # Track start time
-        start_time = time.perf_counter()
-        
-        # Sort based on selected algorithm
-        if algorithm == "Bubble Sort":
-            sorted_data = self._bubble_sort_optimized(data_to_sort, column, ascending)
-        elif algorithm == "Insertion Sort":
-            sorted_data = self._insertion_sort_optimized(data_to_sort, column, ascending)
-        else:  # Merge Sort
-            sorted_data = self._merge_sort(data_to_sort, column, ascending)
-        
-        end_time = time.perf_counter()
-        self.sort_time = end_time - start_time
+        data_to_sort = self.data.head(n)
+        self.sorted_rows = n
+        
+        self.sort_stats = sorting_engine.SortStats()
+        
+        def sort():
+            # Sort based on selected algorithm
+            if self.top_only:
+                transform = self.TEXT_TRANSFORMS.get(self.text_compare_var.get(), "casefold")
+                return data_to_sort.take(
+                    data_to_sort.top_k(column, self.RESULT_ROWS, not ascending, transform))
+            elif algorithm == "Bubble Sort":
+                return self._bubble_sort_optimized(data_to_sort, column, ascending)
+            elif algorithm == "Insertion Sort":
+                return self._insertion_sort_optimized(data_to_sort, column, ascending)
+            elif algorithm == "Merge Sort":
+                return self._merge_sort(data_to_sort, column, ascending)
+            else:  # Other engine algorithms (Tim Sort, NumPy Sort, ...)
+                kernel = sorting_engine.get_algorithm(algorithm)
+                return self._run_engine(kernel, data_to_sort, column, ascending,
+                                        stats=self.sort_stats)
+        
+        self.profile_report = None
+        if self.profiling:
+            sorted_data, self.profile_report = sorting_engine.profile_run(
+                sort, memory=self.profile_memory)
+            self.sort_time = self.profile_report.elapsed
+        else:
+            # Track start time
+            start_time = time.perf_counter()
+            sorted_data = sort()
+            end_time = time.perf_counter()
+            self.sort_time = end_time - start_time
         self.sorted_data = sorted_data
         
         # Update UI on main thread
         self.root.after(0, self._display_results)
     
+    def _sort_columns(self):
+        """
+        Selected ordering as (column, ascending, description).
+        
+        With "Then by" columns, column is a list of (name, descending)
+        pairs and ascending is True: the directions are encoded in the
+        packed composite key, so one stable pass handles the whole order.
+        """
+        spec = [(self.column_var.get(), self.order_var.get() == "Descending")]
+        for column_var, order_var in self.then_by_vars:
+            name = column_var.get()
+            if name != self.NO_COLUMN and name not in [n for n, _ in spec]:
+                spec.append((name, order_var.get() == "Descending"))
+        order_text = ", ".join(f"{name} {'↓' if descending else '↑'}" for name, descending in spec)
+        if len(spec) == 1:
+            return spec[0][0], not spec[0][1], order_text
+        return spec, True, order_text
+    
     def _display_results(self):
         """Display the sorting results."""
         # Clear previous results
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
         
-        # Insert first 10 records
-        for i, row in enumerate(self.sorted_data[:10]):
+        # Insert the first records
+        for i in range(min(self.RESULT_ROWS, len(self.sorted_data))):
+            row = self.sorted_data.record(i)
             self.results_tree.insert("", tk.END, values=(row['ID'], row['FirstName'], row['LastName']))
         
         # Update metrics
-        self.sort_time_label.config(text=f"{self.sort_time:.4f} seconds")
+        profiled = " (profiled)" if self.profile_report is not None else ""
+        self.sort_time_label.config(text=f"{self.sort_time:.4f} seconds{profiled}")
         self.progress_var.set(100)
         
-        if self.cancel_sorting:
+        if self.cancel_event.is_set():
             self.status_label.config(text="❌ Sorting cancelled by user.")
         else:
-            self.status_label.config(text=f"✅ Sorting complete! Processed {len(self.sorted_data):,} records.")
+            status = f"✅ Sorting complete! Processed {len(self.sorted_data):,} records."
+            if self.top_only:
+                status = (f"✅ Top {len(self.sorted_data):,} of {self.sorted_rows:,} records "
+                          f"selected without a full sort.")
+            if self.sort_stats.strategy:
+                status += f" Auto chose {self.sort_stats.strategy}"
+            self.status_label.config(text=status)
         
         # Re-enable buttons
         self.sort_btn.config(state="normal")
+        self.external_btn.config(state="normal")
         self.load_btn.config(state="normal")
         self.cancel_btn.config(state="disabled")
         self.is_sorting = False
-        self.cancel_sorting = False
+        self.cancel_event.clear()
+        
+        if self.profile_report is not None:
+            self._show_profile(self.profile_report)
+    
+    def _show_profile(self, report):
+        """Show the hottest functions of a profiled run, with an option to save the profile."""
+        window = tk.Toplevel(self.root)
+        window.title("🔬 Sort Profile")
+        window.geometry("760x420")
+        window.transient(self.root)
+        
+        frame = ttk.Frame(window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        text = tk.Text(frame, font=("Consolas", 10), wrap=tk.NONE, height=18)
+        text.insert("1.0", report.summary())
+        text.config(state="disabled")
+        text.pack(fill=tk.BOTH, expand=True)
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(pady=(10, 0))
+        ttk.Button(btn_frame, text="💾 Save Profile...",
+                   command=lambda: self._save_profile(report, window)).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(btn_frame, text="Close", command=window.destroy).pack(side=tk.LEFT)
+    
+    def _save_profile(self, report, window):
+        """Write the summary (.txt), collapsed stacks for flame graphs (.collapsed) and cProfile data (.prof)."""
+        path = filedialog.asksaveasfilename(
+            parent=window,
+            title="Save Profile As",
+            initialfile="sort-profile",
+            filetypes=[("Profile prefix", "*")]
+        )
+        if not path:
+            return
+        try:
+            paths = report.save(os.path.splitext(path)[0])
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save profile:\n{str(e)}", parent=window)
+            return
+        messagebox.showinfo("Profile Saved", "Saved:\n" + "\n".join(paths), parent=window)
     
     # ==================== SORTING ALGORITHMS ====================
     
-    def _get_key(self, item, column):
-        """Get the comparison key for sorting."""
-        value = item[column]
-        if column == "ID":
-            return value  # Already an integer
-        return value.lower()  # Case-insensitive string comparison
+    def _poll_progress(self):
+        """Copy the latest published progress to the bar, once per frame, while sorting."""
+        if not self.is_sorting:
+            return
+        snapshot = self.progress_channel.poll()
+        if snapshot is not None:
+            self.progress_var.set(snapshot["percent"])
+        self.root.after(sorting_engine.FRAME_MS, self._poll_progress)
     
-    def _compare(self, a, b, column, ascending):
-        """Compare two items based on column and order."""
-        key_a = self._get_key(a, column)
-        key_b = self._get_key(b, column)
-        
-        if ascending:
-            return key_a > key_b
-        else:
-            return key_a < key_b
+    def _run_engine(self, kernel, data, column, ascending, stats=None):
+        """
+        Run a shared engine kernel with this app's progress and cancel hooks.
+        
+        data is a RecordStore. Keys are built once per column (ID is used
+        as-is, names are ranked once per distinct value after the selected
+        text transform), the kernel sorts row indices by those int keys,
+        and the rows are permuted at the end. column may be a list of
+        (name, descending) pairs, packed into one int key per row. stats (a SortStats) receives
+        the kernel's counters, e.g. the strategy picked by Auto.
+        """
+        transform = self.TEXT_TRANSFORMS.get(self.text_compare_var.get(), "casefold")
+        return data.sorted_by(
+            column,
+            kernel,
+            reverse=not ascending,
+            transform=transform,
+            progress_callback=self.progress_channel,
+            cancel_event=self.cancel_event,
+            stats=stats,
+        )
     
     # ----- BUBBLE SORT (Optimized) -----
     def _bubble_sort_optimized(self, data, column, ascending=True):
@@ -344,36 +606,7 @@ class SortingBenchmark:
         
         Complexity: O(n²) worst/average, O(n) best case
         """
-        n = len(data)
-        last_swap = n - 1
-        update_interval = max(1, n // 100)  # Update progress every 1%
-        
-        for i in range(n):
-            # Check for cancellation
-            if self.cancel_sorting:
-                return data
-            
-            swapped = False
-            new_last_swap = 0
-            
-            for j in range(last_swap):
-                if self._compare(data[j], data[j + 1], column, ascending):
-                    data[j], data[j + 1] = data[j + 1], data[j]
-                    swapped = True
-                    new_last_swap = j
-            
-            last_swap = new_last_swap
-            
-            # Early termination - array is sorted
-            if not swapped:
-                break
-            
-            # Update progress
-            if i % update_interval == 0:
-                progress = (i / n) * 100
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-        
-        return data
+        return self._run_engine(sorting_engine.bubble_sort, data, column, ascending)
     
     # ----- INSERTION SORT (Optimized) -----
     def _insertion_sort_optimized(self, data, column, ascending=True):
@@ -387,39 +620,7 @@ class SortingBenchmark:
         
         Complexity: O(n²) worst/average, O(n) best case
         """
-        n = len(data)
-        update_interval = max(1, n // 100)
-        
-        for i in range(1, n):
-            # Check for cancellation
-            if self.cancel_sorting:
-                return data
-            
-            key_item = data[i]
-            
-            # Binary search for insertion position
-            left, right = 0, i
-            while left < right:
-                mid = (left + right) // 2
-                if self._compare(data[mid], key_item, column, ascending):
-                    right = mid
-                else:
-                    left = mid + 1
-            
-            # Shift elements and insert
-            if left < i:
-                # Move elements to make room
-                temp = data[i]
-                for j in range(i, left, -1):
-                    data[j] = data[j - 1]
-                data[left] = temp
-            
-            # Update progress
-            if i % update_interval == 0:
-                progress = (i / n) * 100
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-        
-        return data
+        return self._run_engine(sorting_engine.insertion_sort, data, column, ascending)
     
     # ----- MERGE SORT (Optimized) -----
     def _merge_sort(self, data, column, ascending=True):
@@ -433,89 +634,17 @@ class SortingBenchmark:
         
         Complexity: O(n log n) always
         """
-        n = len(data)
-        
-        if n <= 1:
-            return data
-        
-        # Use insertion sort for small arrays
-        if n <= 32:
-            return self._insertion_sort_small(data, column, ascending)
-        
-        # Bottom-up iterative merge sort
-        aux = data.copy()
-        width = 1
-        total_passes = 0
-        temp = n
-        while temp > 1:
-            total_passes += 1
-            temp //= 2
-        
-        current_pass = 0
-        
-        while width < n:
-            # Check for cancellation
-            if self.cancel_sorting:
-                return data
-            
-            for i in range(0, n, 2 * width):
-                left = i
-                mid = min(i + width, n)
-                right = min(i + 2 * width, n)
-                self._merge(data, aux, left, mid, right, column, ascending)
-            
-            # Swap arrays
-            data, aux = aux, data
-            width *= 2
-            
-            current_pass += 1
-            progress = (current_pass / total_passes) * 100
-            self.root.after(0, lambda p=progress: self.progress_var.set(p))
-        
-        return data
-    
-    def _merge(self, src, dest, left, mid, right, column, ascending):
-        """Merge two sorted subarrays."""
-        i, j, k = left, mid, left
-        
-        while i < mid and j < right:
-            # Use inverted comparison for merge
-            if not self._compare(src[i], src[j], column, ascending):
-                dest[k] = src[i]
-                i += 1
-            else:
-                dest[k] = src[j]
-                j += 1
-            k += 1
-        
-        # Copy remaining elements
-        while i < mid:
-            dest[k] = src[i]
-            i += 1
-            k += 1
-        
-        while j < right:
-            dest[k] = src[j]
-            j += 1
-            k += 1
-    
-    def _insertion_sort_small(self, data, column, ascending):
-        """Simple insertion sort for small arrays (used by merge sort)."""
-        for i in range(1, len(data)):
-            key_item = data[i]
-            j = i - 1
-            
-            while j >= 0 and self._compare(data[j], key_item, column, ascending):
-                data[j + 1] = data[j]
-                j -= 1
-            
-            data[j + 1] = key_item
-        
-        return data
+        return self._run_engine(sorting_engine.merge_sort, data, column, ascending)
 
 
 def main():
     """Main entry point for the application."""
+    # Use the user's locale for "Locale collation" text comparison
+    try:
+        locale.setlocale(locale.LC_COLLATE, "")
+    except locale.Error:
+        pass
+    
     root = tk.Tk()
     
     # Center window on screen
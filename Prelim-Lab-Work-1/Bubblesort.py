@@ -8,10 +8,22 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import os
+import sys
 import time
 import re
+import queue
 import threading
 
+# Shared sorting engine lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sorting_engine import (FRAME_MS, ProgressChannel, SortStats, bubble_sort,
+                            count_inversions, load_numbers_mmap)
+from sorting_engine.dataview import DataView
+
+# Numbers from a loaded file shown in the input box (the rest stay in memory)
+PREVIEW_LIMIT = 1000
+
 
 class BubbleSortApp:
     def __init__(self, root):
@@ -21,6 +33,15 @@ class BubbleSortApp:
         self.root.configure(bg="#1e1e2e")
         self.root.resizable(True, True)
         
+        # Numbers from the last loaded file (used while the input is unedited)
+        self.loaded_numbers = None
+        
+        # Background sort: cancel token, progress channel and result handoff
+        self.sort_thread = None
+        self.cancel_event = threading.Event()
+        self.progress_channel = None
+        self.results = queue.Queue()
+        
         # Configure styles
         self.setup_styles()
         
@@ -154,17 +175,15 @@ class BubbleSortApp:
                                       padding=15)
         output_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
-        # Output text widget
-        self.output_text = tk.Text(output_frame,
-                                   height=6,
-                                   bg="#313244",
-                                   fg="#a6e3a1",
-                                   font=("Consolas", 11),
-                                   relief=tk.FLAT,
-                                   padx=10,
-                                   pady=10,
-                                   wrap=tk.WORD,
-                                   state=tk.DISABLED)
+        # Output view (renders only the visible rows of large results)
+        self.output_text = DataView(output_frame,
+                                    height=6,
+                                    bg="#313244",
+                                    fg="#a6e3a1",
+                                    font=("Consolas", 11),
+                                    relief=tk.FLAT,
+                                    padx=10,
+                                    pady=10)
         self.output_text.pack(fill=tk.BOTH, expand=True)
 
     def create_stats_section(self):
@@ -219,11 +238,11 @@ class BubbleSortApp:
         btn_frame.pack(fill=tk.X)
         
         # Sort button
-        sort_btn = ttk.Button(btn_frame,
-                             text="▶ Sort Array",
-                             style="Primary.TButton",
-                             command=self.perform_sort)
-        sort_btn.pack(side=tk.LEFT, padx=(0, 10))
+        self.sort_btn = ttk.Button(btn_frame,
+                                   text="▶ Sort Array",
+                                   style="Primary.TButton",
+                                   command=self.perform_sort)
+        self.sort_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         # Clear button
         clear_btn = ttk.Button(btn_frame,
@@ -243,16 +262,16 @@ class BubbleSortApp:
         """Create a modern progress window for sorting visualization"""
         self.progress_window = tk.Toplevel(self.root)
         self.progress_window.title("Sorting in Progress")
-        self.progress_window.geometry("450x380")
+        self.progress_window.geometry("450x430")
         self.progress_window.configure(bg="#1e1e2e")
         self.progress_window.resizable(False, False)
         self.progress_window.transient(self.root)
-        self.progress_window.grab_set()
+        self.progress_window.protocol("WM_DELETE_WINDOW", self.cancel_sort)
         
         # Center the window
         self.progress_window.update_idletasks()
         x = self.root.winfo_x() + (self.root.winfo_width() // 2) - 225
-        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 190
+        y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 215
         self.progress_window.geometry(f"+{x}+{y}")
         
         # Main container
@@ -336,6 +355,13 @@ class BubbleSortApp:
                                       font=("Segoe UI", 14, "bold"))
         self.progress_swap.pack()
         
+        # Cancel button (the sort stops at the next pass boundary)
+        self.cancel_btn = ttk.Button(container,
+                                     text="✖ Cancel",
+                                     style="Secondary.TButton",
+                                     command=self.cancel_sort)
+        self.cancel_btn.pack(pady=(15, 0))
+        
         # Animation state
         self.animation_icons = ["🔄", "🔃", "🔁", "🔂"]
         self.animation_index = 0
@@ -362,14 +388,13 @@ class BubbleSortApp:
             self.progress_swap.config(text=str(swaps))
             if status:
                 self.progress_status.config(text=status)
-            self.progress_window.update()
     
     def close_progress_window(self):
         """Close the progress window"""
         if hasattr(self, 'progress_window') and self.progress_window.winfo_exists():
             self.progress_window.destroy()
 
-    def bubble_sort_optimized(self, arr, show_progress=False):
+    def bubble_sort_optimized(self, arr, progress_callback=None, cancel_event=None, stats=None):
         """
         Optimized Bubble Sort Algorithm
         
@@ -378,53 +403,16 @@ class BubbleSortApp:
         
         Args:
             arr: List of numbers to sort
-            show_progress: Whether to update progress window
+            progress_callback: Called with the percentage done (e.g. a ProgressChannel)
+            cancel_event: threading.Event checked before every pass
+            stats: SortStats that receives the pass and comparison counters
             
         Returns:
-            tuple: (sorted_array, comparisons, swaps)
+            list: the sorted array
         """
-        n = len(arr)
-        arr = arr.copy()  # Don't modify original
-        comparisons = 0
-        swaps = 0
-        total_passes = n - 1
-        
-        # Calculate update interval - update less frequently for larger arrays
-        update_interval = max(500, n * 5)  # Update every 500+ comparisons
-        last_update = 0
-        
-        for i in range(n - 1):
-            swapped = False  # Optimization flag
-            
-            # Last i elements are already in place
-            for j in range(n - 1 - i):
-                comparisons += 1
-                
-                # Compare adjacent elements (descending order)
-                if arr[j] < arr[j + 1]:
-                    # Exchange (swap) elements
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    swaps += 1
-                    swapped = True
-            
-            # Update progress only at end of each pass (much faster)
-            if show_progress and (comparisons - last_update >= update_interval or i == n - 2):
-                self.update_progress(i + 1, total_passes, comparisons, swaps,
-                                    f"Pass {i + 1} of {total_passes}")
-                last_update = comparisons
-            
-            # Early break: if no swaps occurred, array is sorted
-            if not swapped:
-                if show_progress:
-                    self.update_progress(i + 1, total_passes, comparisons, swaps,
-                                        "✅ Early termination - Array sorted!", force_complete=True)
-                break
-        
-        if show_progress:
-            self.update_progress(total_passes, total_passes, comparisons, swaps,
-                                "✅ Sorting complete!", force_complete=True)
-                
-        return arr, comparisons, swaps
+        # Shared engine kernel (descending order, early break, last-swap tracking)
+        return bubble_sort(arr, reverse=True, progress_callback=progress_callback,
+                           cancel_event=cancel_event, stats=stats)
 
     def parse_input(self, text):
         """Parse input text to extract numbers"""
@@ -456,8 +444,11 @@ class BubbleSortApp:
                                   "Please enter numbers or load a file.")
             return
         
-        # Parse input
-        numbers = self.parse_input(input_data)
+        # Parse input (a loaded file is already parsed unless the text was edited)
+        if self.loaded_numbers is not None and not self.input_text.edit_modified():
+            numbers = list(self.loaded_numbers)
+        else:
+            numbers = self.parse_input(input_data)
         
         if not numbers:
             messagebox.showerror("Invalid Input",
@@ -469,38 +460,68 @@ class BubbleSortApp:
                                   "Please enter at least 2 numbers to sort.")
             return
         
-        # Store numbers for sorting thread
-        self.numbers_to_sort = numbers
-        
-        # Create and show progress window
+        # Sort on a worker thread; the UI polls its progress every frame
+        self.total_passes = len(numbers) - 1
+        stats = SortStats()
+        self.progress_channel = ProgressChannel(stats)
+        self.cancel_event.clear()
+        self.sort_btn.config(state="disabled")
         self.create_progress_window()
         
-        # Start sorting in a slight delay to allow progress window to render
-        self.root.after(100, self.run_sort_with_progress)
+        self.sort_thread = threading.Thread(target=self.sort_worker, args=(numbers, stats))
+        self.sort_thread.daemon = True
+        self.sort_thread.start()
+        self.poll_sort()
     
-    def run_sort_with_progress(self):
-        """Run the sort with progress updates"""
-        numbers = self.numbers_to_sort
-        
-        # Perform sort and measure time
+    def sort_worker(self, numbers, stats):
+        """Worker thread: sort, then hand the result to the UI through the queue"""
         start_time = time.perf_counter()
-        sorted_arr, comparisons, swaps = self.bubble_sort_optimized(numbers, show_progress=True)
-        end_time = time.perf_counter()
-        
-        execution_time = (end_time - start_time) * 1000  # Convert to ms
-        
-        # Close progress window
+        sorted_arr = self.bubble_sort_optimized(numbers, self.progress_channel,
+                                                self.cancel_event, stats)
+        execution_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
+        
+        # Each swap removes one inverted pair, so swaps are counted here,
+        # outside the timed sort, instead of inside its inner loop
+        if not self.cancel_event.is_set():
+            stats.swaps = count_inversions(numbers, reverse=True)
+        self.results.put((sorted_arr, stats, execution_time))
+    
+    def poll_sort(self):
+        """Show the latest progress once per frame until the result arrives"""
+        try:
+            sorted_arr, stats, execution_time = self.results.get_nowait()
+        except queue.Empty:
+            snapshot = self.progress_channel.poll()
+            if snapshot is not None and not self.cancel_event.is_set():
+                self.update_progress(snapshot["passes"], self.total_passes, snapshot["comparisons"],
+                                     "--", f"Pass {snapshot['passes']} of {self.total_passes}")
+            self.root.after(FRAME_MS, self.poll_sort)
+            return
+        self.show_result(sorted_arr, stats, execution_time)
+    
+    def cancel_sort(self):
+        """Ask the worker to stop at the next pass boundary"""
+        if self.sort_thread is not None and self.sort_thread.is_alive():
+            self.cancel_event.set()
+            self.progress_status.config(text="⏳ Cancelling...")
+            self.cancel_btn.config(state="disabled")
+    
+    def show_result(self, sorted_arr, stats, execution_time):
+        """Display the sorted array and statistics (UI thread)"""
         self.close_progress_window()
+        self.sort_btn.config(state="normal")
+        self.sort_thread = None
+        
+        if self.cancel_event.is_set():
+            self.output_text.set_message(
+                f"Sorting cancelled after {stats.passes:,} of {self.total_passes:,} passes.")
+            self.time_label.config(text="-- ms")
+            self.comp_label.config(text="--")
+            self.swap_label.config(text="--")
+            return
         
-        # Update output
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete("1.0", tk.END)
-        
-        # Format output - only show sorted array
-        output = str(sorted_arr)
-        
-        self.output_text.insert("1.0", output)
-        self.output_text.config(state=tk.DISABLED)
+        # Update output - only show sorted array
+        self.output_text.set_data(sorted_arr)
         
         # Update statistics
         if execution_time < 1:
@@ -508,8 +529,8 @@ class BubbleSortApp:
         else:
             self.time_label.config(text=f"{execution_time:.2f} ms")
             
-        self.comp_label.config(text=str(comparisons))
-        self.swap_label.config(text=str(swaps))
+        self.comp_label.config(text=str(stats.comparisons))
+        self.swap_label.config(text=str(stats.swaps))
 
     def load_file(self):
         """Load numbers from a file"""
@@ -526,14 +547,17 @@ class BubbleSortApp:
         
         if filepath:
             try:
-                with open(filepath, 'r') as file:
-                    content = file.read()
-                    
+                # mmap + typed array; reloads come from the binary cache
+                numbers = load_numbers_mmap(filepath, cache=True)
+                
+                preview = ", ".join(map(str, numbers[:PREVIEW_LIMIT]))
+                if len(numbers) > PREVIEW_LIMIT:
+                    preview += ", ...\n(more numbers from the file are not shown)"
                 self.input_text.delete("1.0", tk.END)
-                self.input_text.insert("1.0", content)
+                self.input_text.insert("1.0", preview)
+                self.input_text.edit_modified(False)
+                self.loaded_numbers = numbers if numbers else None
                 
-                # Validate that we can parse numbers
-                numbers = self.parse_input(content)
                 if numbers:
                     messagebox.showinfo("File Loaded",
                                        f"Successfully loaded {len(numbers)} numbers.")
@@ -548,15 +572,15 @@ class BubbleSortApp:
     def load_sample(self):
         """Load sample data for demonstration"""
         sample = "64, 34, 25, 12, 22, 11, 90, 45, 33, 77, 55, 88, 99, 10, 5"
+        self.loaded_numbers = None
         self.input_text.delete("1.0", tk.END)
         self.input_text.insert("1.0", sample)
 
     def clear_all(self):
         """Clear all inputs and outputs"""
+        self.loaded_numbers = None
         self.input_text.delete("1.0", tk.END)
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete("1.0", tk.END)
-        self.output_text.config(state=tk.DISABLED)
+        self.output_text.clear()
         self.time_label.config(text="-- ms")
         self.comp_label.config(text="--")
         self.swap_label.config(text="--")
@@ -10,6 +10,12 @@ from tkinter import ttk, filedialog, messagebox
 import time
 import threading
 import os
+import sys
+
+# Shared sorting engine lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import sorting_engine
+from sorting_engine.dataview import DataView
 
 # Try to import openpyxl and xlrd for Excel support
 try:
@@ -102,18 +108,32 @@ class ProgressDialog(tk.Toplevel):
         if status:
             self.status_label.config(text=status)
         self.time_label.config(text=f"Time: {elapsed_time:.3f}s")
-        self.update()
 
 
 class ComparisonDialog(tk.Toplevel):
-    """Modern dialog to display algorithm comparison results"""
+    """Modern dialog that streams algorithm comparison results as they finish"""
+    
+    # Color codes for rankings
+    RANK_COLORS = ["#a6e3a1", "#f9e2af", "#fab387"]  # green, yellow, orange
+    OTHER_COLOR = "#f38ba8"  # red
+    PENDING_COLOR = "#45475a"
+    
+    STATUS_TEXT = {
+        "timeout": "⏱️ timeout",
+        "error": "❌ error",
+        "cancelled": "⛔ cancelled",
+    }
     
-    def __init__(self, parent, results, data_size):
+    def __init__(self, parent, algorithms, complexity_info, data_size, on_cancel=None):
         super().__init__(parent)
         self.title("📊 Algorithm Comparison Results")
-        self.geometry("600x450")
+        height = 250 + 80 * len(algorithms)
+        self.geometry(f"600x{height}")
         self.resizable(False, False)
         self.configure(bg="#1e1e2e")
+        self.on_cancel = on_cancel
+        self.results = {}
+        self.finished = False
         
         # Center the dialog
         self.transient(parent)
@@ -122,7 +142,7 @@ class ComparisonDialog(tk.Toplevel):
         # Center on parent
         self.update_idletasks()
         x = parent.winfo_x() + (parent.winfo_width() - 600) // 2
-        y = parent.winfo_y() + (parent.winfo_height() - 450) // 2
+        y = parent.winfo_y() + (parent.winfo_height() - height) // 2
         self.geometry(f"+{x}+{y}")
         
         # Title
@@ -146,117 +166,264 @@ class ComparisonDialog(tk.Toplevel):
         size_label.pack(pady=(0, 20))
         
         # Results container
-        results_frame = tk.Frame(self, bg="#1e1e2e")
-        results_frame.pack(fill=tk.BOTH, expand=True, padx=30)
-        
-        # Sort results by time to determine ranking
-        sorted_results = sorted(results.items(), key=lambda x: x[1]['time'])
-        
-        # Color codes for rankings
-        rank_colors = ["#a6e3a1", "#f9e2af", "#fab387"]  # green, yellow, orange
-        
-        for idx, (algo, data) in enumerate(sorted_results):
-            # Card for each algorithm
-            card = tk.Frame(results_frame, bg="#313244", highlightthickness=1, highlightbackground="#45475a")
-            card.pack(fill=tk.X, pady=8)
-            
-            # Rank badge
-            rank_frame = tk.Frame(card, bg=rank_colors[idx], width=40)
-            rank_frame.pack(side=tk.LEFT, fill=tk.Y)
-            rank_frame.pack_propagate(False)
-            
-            rank_label = tk.Label(
-                rank_frame,
-                text=f"#{idx + 1}",
-                font=("Segoe UI", 14, "bold"),
-                bg=rank_colors[idx],
-                fg="#1e1e2e"
-            )
-            rank_label.pack(expand=True)
-            
-            # Algorithm info
-            info_frame = tk.Frame(card, bg="#313244")
-            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=12)
-            
-            algo_label = tk.Label(
-                info_frame,
-                text=algo,
-                font=("Segoe UI", 13, "bold"),
-                bg="#313244",
-                fg="#89b4fa"
-            )
-            algo_label.pack(anchor=tk.W)
-            
-            complexity_label = tk.Label(
-                info_frame,
-                text=f"Time Complexity: {data['complexity']}",
-                font=("Segoe UI", 9),
-                bg="#313244",
-                fg="#6c7086"
-            )
-            complexity_label.pack(anchor=tk.W)
-            
-            # Time display
-            time_frame = tk.Frame(card, bg="#313244")
-            time_frame.pack(side=tk.RIGHT, padx=20)
-            
-            time_value = tk.Label(
-                time_frame,
-                text=f"{data['time']:.6f}s",
-                font=("Segoe UI", 16, "bold"),
-                bg="#313244",
-                fg=rank_colors[idx]
-            )
-            time_value.pack()
-            
-            # Speed comparison (relative to slowest)
-            slowest_time = sorted_results[-1][1]['time']
-            if slowest_time > 0 and data['time'] > 0:
-                speed_factor = slowest_time / data['time']
-                if speed_factor > 1.01:
-                    speed_text = f"{speed_factor:.1f}x faster"
-                else:
-                    speed_text = "baseline"
-            else:
-                speed_text = "-"
-                
-            speed_label = tk.Label(
-                time_frame,
-                text=speed_text,
-                font=("Segoe UI", 9),
-                bg="#313244",
-                fg="#a6adc8"
-            )
-            speed_label.pack()
+        self.results_frame = tk.Frame(self, bg="#1e1e2e")
+        self.results_frame.pack(fill=tk.BOTH, expand=True, padx=30)
         
-        # Winner announcement
-        winner = sorted_results[0][0]
-        winner_time = sorted_results[0][1]['time']
+        # One card per algorithm, shown as running until its result arrives
+        self.cards = {}
+        for algo in algorithms:
+            self.cards[algo] = self._create_card(algo, complexity_info[algo]["average"])
         
+        # Winner announcement / status
         winner_frame = tk.Frame(self, bg="#1e1e2e")
         winner_frame.pack(pady=20)
         
-        winner_label = tk.Label(
+        self.winner_label = tk.Label(
             winner_frame,
-            text=f"🏆 Winner: {winner} ({winner_time:.6f}s)",
+            text="⏳ Running algorithms in background processes...",
             font=("Segoe UI", 12, "bold"),
             bg="#1e1e2e",
             fg="#a6e3a1"
         )
-        winner_label.pack()
+        self.winner_label.pack()
+        
+        # Cancel / Close buttons
+        btn_frame = tk.Frame(self, bg="#1e1e2e")
+        btn_frame.pack(pady=(0, 20))
+        
+        self.cancel_btn = ttk.Button(
+            btn_frame,
+            text="⛔ Cancel",
+            style='Modern.TButton',
+            command=self.cancel
+        )
+        self.cancel_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        # Close button
         close_btn = ttk.Button(
+            btn_frame,
+            text="Close",
+            style='Modern.TButton',
+            command=self.close
+        )
+        close_btn.pack(side=tk.LEFT)
+        
+        self.protocol("WM_DELETE_WINDOW", self.close)
+    
+    def _create_card(self, algo, complexity):
+        """Create the result card for one algorithm"""
+        card = tk.Frame(self.results_frame, bg="#313244", highlightthickness=1, highlightbackground="#45475a")
+        card.pack(fill=tk.X, pady=8)
+        
+        # Rank badge
+        rank_frame = tk.Frame(card, bg=self.PENDING_COLOR, width=40)
+        rank_frame.pack(side=tk.LEFT, fill=tk.Y)
+        rank_frame.pack_propagate(False)
+        
+        rank_label = tk.Label(
+            rank_frame,
+            text="…",
+            font=("Segoe UI", 14, "bold"),
+            bg=self.PENDING_COLOR,
+            fg="#1e1e2e"
+        )
+        rank_label.pack(expand=True)
+        
+        # Algorithm info
+        info_frame = tk.Frame(card, bg="#313244")
+        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=15, pady=12)
+        
+        algo_label = tk.Label(
+            info_frame,
+            text=algo,
+            font=("Segoe UI", 13, "bold"),
+            bg="#313244",
+            fg="#89b4fa"
+        )
+        algo_label.pack(anchor=tk.W)
+        
+        complexity_label = tk.Label(
+            info_frame,
+            text=f"Time Complexity: {complexity}",
+            font=("Segoe UI", 9),
+            bg="#313244",
+            fg="#6c7086"
+        )
+        complexity_label.pack(anchor=tk.W)
+        
+        # Time display
+        time_frame = tk.Frame(card, bg="#313244")
+        time_frame.pack(side=tk.RIGHT, padx=20)
+        
+        time_value = tk.Label(
+            time_frame,
+            text="⏳ running",
+            font=("Segoe UI", 16, "bold"),
+            bg="#313244",
+            fg="#6c7086"
+        )
+        time_value.pack()
+        
+        speed_label = tk.Label(
+            time_frame,
+            text="",
+            font=("Segoe UI", 9),
+            bg="#313244",
+            fg="#a6adc8"
+        )
+        speed_label.pack()
+        
+        return {
+            "card": card,
+            "rank_frame": rank_frame,
+            "rank_label": rank_label,
+            "time": time_value,
+            "speed": speed_label,
+        }
+    
+    def add_result(self, algo, result):
+        """Show one algorithm's result and re-rank the finished ones"""
+        if not self.winfo_exists():
+            return
+        self.results[algo] = result
+        if result["status"] != "ok":
+            widgets = self.cards[algo]
+            widgets["time"].config(text=self.STATUS_TEXT.get(result["status"], result["status"]),
+                                   fg=self.OTHER_COLOR)
+            widgets["speed"].config(text=result.get("error") or "")
+        self._rank()
+    
+    def _rank(self):
+        """Order the cards: finished by time, then running, then failed"""
+        finished = sorted(
+            ((algo, r["time"]) for algo, r in self.results.items() if r["status"] == "ok"),
+            key=lambda item: item[1]
+        )
+        slowest_time = finished[-1][1] if finished else 0
+        order = [algo for algo, _ in finished]
+        order += [algo for algo in self.cards if algo not in self.results]
+        order += [algo for algo in self.cards if algo in self.results and algo not in order]
+        
+        for idx, (algo, elapsed) in enumerate(finished):
+            color = self.RANK_COLORS[idx] if idx < len(self.RANK_COLORS) else self.OTHER_COLOR
+            widgets = self.cards[algo]
+            widgets["rank_frame"].config(bg=color)
+            widgets["rank_label"].config(text=f"#{idx + 1}", bg=color)
+            widgets["time"].config(text=f"{elapsed:.6f}s", fg=color)
+            
+            # Speed comparison (relative to slowest finished so far)
+            if slowest_time > 0 and elapsed > 0:
+                speed_factor = slowest_time / elapsed
+                speed_text = f"{speed_factor:.1f}x faster" if speed_factor > 1.01 else "baseline"
+            else:
+                speed_text = "-"
+            widgets["speed"].config(text=speed_text)
+        
+        for algo in order:
+            self.cards[algo]["card"].pack_forget()
+        for algo in order:
+            self.cards[algo]["card"].pack(fill=tk.X, pady=8)
+        
+        if finished:
+            winner, winner_time = finished[0]
+            prefix = "🏆 Winner" if self.finished else "🏃 Leading"
+            self.winner_label.config(text=f"{prefix}: {winner} ({winner_time:.6f}s)")
+    
+    def finish(self):
+        """All algorithms are done (or were cancelled)"""
+        if not self.winfo_exists():
+            return
+        self.finished = True
+        self.cancel_btn.config(state="disabled")
+        if any(r["status"] == "ok" for r in self.results.values()):
+            self._rank()
+        else:
+            self.winner_label.config(text="No algorithm finished.")
+    
+    def cancel(self):
+        """Stop the algorithms that are still running"""
+        self.cancel_btn.config(state="disabled")
+        if not self.finished:
+            self.winner_label.config(text="⏳ Cancelling...")
+        if self.on_cancel:
+            self.on_cancel()
+    
+    def close(self):
+        """Close the dialog, cancelling any running algorithms"""
+        if not self.finished and self.on_cancel:
+            self.on_cancel()
+        self.destroy()
+
+
+class ProfileDialog(tk.Toplevel):
+    """Shows the hottest functions of a profiled sort and saves the profile files"""
+    
+    def __init__(self, parent, report, algo):
+        super().__init__(parent)
+        self.title("Sort Profile")
+        self.geometry("760x460")
+        self.configure(bg="#1e1e2e")
+        self.transient(parent)
+        self.report = report
+        
+        tk.Label(
+            self,
+            text=f"🔬 Profile: {algo}",
+            font=("Segoe UI", 14, "bold"),
+            bg="#1e1e2e",
+            fg="#b4befe"
+        ).pack(pady=(15, 10))
+        
+        text = tk.Text(
             self,
+            font=("Consolas", 10),
+            bg="#313244",
+            fg="#cdd6f4",
+            relief=tk.FLAT,
+            padx=10,
+            pady=10,
+            wrap=tk.NONE
+        )
+        text.insert("1.0", report.summary())
+        text.config(state=tk.DISABLED)
+        text.pack(fill=tk.BOTH, expand=True, padx=20)
+        
+        btn_frame = tk.Frame(self, bg="#1e1e2e")
+        btn_frame.pack(pady=15)
+        
+        ttk.Button(
+            btn_frame,
+            text="💾 Save Profile...",
+            style='Modern.TButton',
+            command=self.save
+        ).pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(
+            btn_frame,
             text="Close",
             style='Modern.TButton',
             command=self.destroy
+        ).pack(side=tk.LEFT)
+    
+    def save(self):
+        """Write the summary, collapsed stacks (flame graph) and cProfile data"""
+        filepath = filedialog.asksaveasfilename(
+            parent=self,
+            title="Save Profile As",
+            initialfile="sort-profile",
+            filetypes=[("Profile prefix", "*")]
         )
-        close_btn.pack(pady=(0, 20))
+        if not filepath:
+            return
+        try:
+            paths = self.report.save(os.path.splitext(filepath)[0])
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save profile:\n{str(e)}", parent=self)
+            return
+        messagebox.showinfo("Profile Saved", "Saved:\n" + "\n".join(paths), parent=self)
 
 
 class SortingAlgorithms:
-    """Sorting algorithms with progress callback support"""
+    """Sorting algorithms with progress callback support (backed by sorting_engine)"""
     
     @staticmethod
     def bubble_sort(arr, progress_callback=None):
@@ -265,26 +432,7 @@ class SortingAlgorithms:
         Time Complexity: O(n²) - Best: O(n), Average: O(n²), Worst: O(n²)
         Space Complexity: O(1)
         """
-        n = len(arr)
-        arr = arr.copy()
-        total_ops = n * (n - 1) // 2
-        current_op = 0
-        
-        for i in range(n):
-            swapped = False
-            for j in range(0, n - i - 1):
-                if arr[j] > arr[j + 1]:
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                    swapped = True
-                current_op += 1
-                if progress_callback and current_op % max(1, total_ops // 100) == 0:
-                    progress_callback(min(100, (current_op / total_ops) * 100))
-            if not swapped:
-                break
-                
-        if progress_callback:
-            progress_callback(100)
-        return arr
+        return sorting_engine.bubble_sort(arr, progress_callback=progress_callback)
     
     @staticmethod
     def insertion_sort(arr, progress_callback=None):
@@ -293,26 +441,7 @@ class SortingAlgorithms:
         Time Complexity: O(n²) - Best: O(n), Average: O(n²), Worst: O(n²)
         Space Complexity: O(1)
         """
-        n = len(arr)
-        arr = arr.copy()
-        total_ops = n * (n - 1) // 2
-        current_op = 0
-        
-        for i in range(1, n):
-            key = arr[i]
-            j = i - 1
-            while j >= 0 and arr[j] > key:
-                arr[j + 1] = arr[j]
-                j -= 1
-                current_op += 1
-                if progress_callback and current_op % max(1, total_ops // 100) == 0:
-                    progress_callback(min(100, (current_op / total_ops) * 100))
-            arr[j + 1] = key
-            current_op += 1
-            
-        if progress_callback:
-            progress_callback(100)
-        return arr
+        return sorting_engine.insertion_sort(arr, progress_callback=progress_callback)
     
     @staticmethod
     def merge_sort(arr, progress_callback=None):
@@ -321,84 +450,73 @@ class SortingAlgorithms:
         Time Complexity: O(n log n) - Best: O(n log n), Average: O(n log n), Worst: O(n log n)
         Space Complexity: O(n)
         """
-        arr = list(arr)  # Make a copy
-        n = len(arr)
-        if n <= 1:
-            if progress_callback:
-                progress_callback(100)
-            return arr
-        
-        # Bottom-up iterative merge sort to avoid recursion limits
-        # Calculate total operations for progress
-        import math
-        total_passes = math.ceil(math.log2(n)) if n > 1 else 1
-        current_pass = 0
-        
-        # Start with sublists of size 1 and double each pass
-        size = 1
-        while size < n:
-            # Merge sublists
-            for start in range(0, n, size * 2):
-                mid = min(start + size, n)
-                end = min(start + size * 2, n)
-                
-                # Merge arr[start:mid] and arr[mid:end]
-                left = arr[start:mid]
-                right = arr[mid:end]
-                
-                merged = []
-                i = j = 0
-                while i < len(left) and j < len(right):
-                    if left[i] <= right[j]:
-                        merged.append(left[i])
-                        i += 1
-                    else:
-                        merged.append(right[j])
-                        j += 1
-                merged.extend(left[i:])
-                merged.extend(right[j:])
-                
-                # Copy back to arr
-                arr[start:start + len(merged)] = merged
-            
-            size *= 2
-            current_pass += 1
-            
-            if progress_callback:
-                progress_callback(min(100, (current_pass / total_passes) * 100))
-        
-        if progress_callback:
-            progress_callback(100)
-        return arr
+        return sorting_engine.merge_sort(arr, progress_callback=progress_callback)
+    
+    @staticmethod
+    def tim_sort(arr, progress_callback=None):
+        """
+        Tim Sort (natural runs + galloping merges)
+        Time Complexity: Best: O(n), Average: O(n log n), Worst: O(n log n)
+        Space Complexity: O(n)
+        """
+        return sorting_engine.tim_sort(arr, progress_callback=progress_callback)
+    
+    @staticmethod
+    def numpy_sort(arr, progress_callback=None):
+        """
+        NumPy Sort (vectorized on a typed int64/float64 array)
+        Time Complexity: O(n log n) - runs in compiled code
+        Space Complexity: O(n)
+        Falls back to Merge Sort when NumPy is not installed
+        """
+        return sorting_engine.numpy_sort(arr, progress_callback=progress_callback)
+    
+    @staticmethod
+    def parallel_merge_sort(arr, progress_callback=None):
+        """
+        Parallel Merge Sort (partitions sorted on all CPU cores, then merged)
+        Time Complexity: O(n log n) - split across worker processes
+        Space Complexity: O(n)
+        Falls back to Merge Sort for small or non-numeric data
+        """
+        return sorting_engine.parallel_merge_sort(arr, progress_callback=progress_callback)
+    
+    @staticmethod
+    def counting_sort(arr, progress_callback=None):
+        """
+        Counting Sort (count table indexed by value - min)
+        Time Complexity: O(n + k) - k = value range
+        Space Complexity: O(n + k)
+        Wide value ranges are handed to Radix Sort
+        """
+        return sorting_engine.counting_sort(arr, progress_callback=progress_callback)
+    
+    @staticmethod
+    def radix_sort(arr, progress_callback=None):
+        """
+        Radix Sort (byte-wise LSD, 256 buckets per pass)
+        Time Complexity: O(d·n) - d = bytes per value
+        Space Complexity: O(n)
+        Falls back to Merge Sort for non-integer data
+        """
+        return sorting_engine.radix_sort(arr, progress_callback=progress_callback)
+    
+    @staticmethod
+    def get(name):
+        """Return the sorting function for an algorithm display name"""
+        kernel = sorting_engine.get_algorithm(name)
+        return lambda arr, progress_callback=None, stats=None: kernel(
+            arr, progress_callback=progress_callback, stats=stats)
 
 
 class ModernSortingApp:
     """Modern UI Sorting Application"""
     
     # Time complexity information
-    COMPLEXITY_INFO = {
-        "Bubble Sort": {
-            "best": "O(n)",
-            "average": "O(n²)",
-            "worst": "O(n²)",
-            "space": "O(1)",
-            "description": "Simple comparison-based algorithm. Best for small datasets."
-        },
-        "Insertion Sort": {
-            "best": "O(n)",
-            "average": "O(n²)",
-            "worst": "O(n²)",
-            "space": "O(1)",
-            "description": "Efficient for small or nearly sorted datasets."
-        },
-        "Merge Sort": {
-            "best": "O(n log n)",
-            "average": "O(n log n)",
-            "worst": "O(n log n)",
-            "space": "O(n)",
-            "description": "Divide-and-conquer algorithm. Consistent performance."
-        }
-    }
+    COMPLEXITY_INFO = sorting_engine.COMPLEXITY_INFO
+    
+    # Seconds each algorithm may run in "Compare All" before it is stopped
+    COMPARISON_TIMEOUT = 120
     
     def __init__(self):
         self.root = tk.Tk()
@@ -414,7 +532,11 @@ class ModernSortingApp:
         # Data storage
         self.original_data = []
         self.sorted_data = []
+        self.last_strategy = None
+        self.last_profile = None
         self.current_file = None
+        self.comparison_running = False
+        self.comparison_cancel = threading.Event()
         
         # Apply modern styling
         self.setup_styles()
@@ -573,7 +695,7 @@ class ModernSortingApp:
         algo_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.sort_var = tk.StringVar(value="Bubble Sort")
-        algorithms = ["Bubble Sort", "Insertion Sort", "Merge Sort"]
+        algorithms = list(sorting_engine.ALGORITHMS)
         
         self.algo_dropdown = ttk.Combobox(
             sort_row1,
@@ -634,6 +756,36 @@ class ModernSortingApp:
         )
         compare_btn.pack(side=tk.LEFT)
         
+        # Opt-in profiling of the next run (cProfile and stack samples)
+        self.profile_var = tk.BooleanVar(value=False)
+        profile_check = tk.Checkbutton(
+            sort_row2,
+            text="🔬 Profile",
+            variable=self.profile_var,
+            font=("Segoe UI", 10),
+            bg="#313244",
+            fg="#cdd6f4",
+            selectcolor="#1e1e2e",
+            activebackground="#313244",
+            activeforeground="#cdd6f4"
+        )
+        profile_check.pack(side=tk.LEFT, padx=(15, 0))
+        
+        # Peak memory needs a second, traced run of the sort (several times slower)
+        self.profile_memory_var = tk.BooleanVar(value=False)
+        memory_check = tk.Checkbutton(
+            sort_row2,
+            text="Peak memory",
+            variable=self.profile_memory_var,
+            font=("Segoe UI", 10),
+            bg="#313244",
+            fg="#cdd6f4",
+            selectcolor="#1e1e2e",
+            activebackground="#313244",
+            activeforeground="#cdd6f4"
+        )
+        memory_check.pack(side=tk.LEFT, padx=(5, 0))
+        
         # Complexity info card
         complexity_card = self.create_card(main_frame, "📊 Time Complexity Analysis")
         complexity_card.pack(fill=tk.X, pady=(0, 15))
@@ -663,14 +815,14 @@ class ModernSortingApp:
         orig_card = self.create_card(data_frame, "📥 Original Data")
         orig_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
-        self.original_text = self.create_text_widget(orig_card)
+        self.original_text = self.create_data_view(orig_card)
         self.original_text.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         # Sorted data card
         sorted_card = self.create_card(data_frame, "📤 Sorted Data")
         sorted_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        self.sorted_text = self.create_text_widget(sorted_card)
+        self.sorted_text = self.create_data_view(sorted_card)
         self.sorted_text.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
         
         # Stats card
@@ -747,37 +899,18 @@ class ModernSortingApp:
         
         return val
     
-    def create_text_widget(self, parent):
-        """Create a styled text widget with scrollbar"""
-        frame = tk.Frame(parent, bg="#313244")
-        
-        scrollbar = ttk.Scrollbar(frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        text = tk.Text(
-            frame,
+    def create_data_view(self, parent):
+        """Create a styled, virtualized view for (possibly huge) data arrays"""
+        return DataView(
+            parent,
             bg="#1e1e2e",
             fg="#cdd6f4",
             font=("Consolas", 10),
-            insertbackground="#cdd6f4",
             selectbackground="#45475a",
-            wrap=tk.NONE,  # Use NONE for better resize performance
-            yscrollcommand=scrollbar.set,
             relief=tk.FLAT,
             padx=10,
-            pady=10,
-            undo=False,  # Disable undo for performance
-            maxundo=0
+            pady=10
         )
-        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=text.yview)
-        
-        # Add horizontal scrollbar for long content
-        h_scrollbar = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=text.xview)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-        text.config(xscrollcommand=h_scrollbar.set)
-        
-        return frame
     
     def update_complexity_display(self):
         """Update complexity information based on selected algorithm"""
@@ -837,9 +970,7 @@ class ModernSortingApp:
             self.display_data(self.original_text, data)
             
             # Clear sorted data
-            sorted_text = self.sorted_text.winfo_children()[1]  # Get text widget
-            sorted_text.delete(1.0, tk.END)
-            sorted_text.insert(tk.END, "Click 'Sort Data' to sort...")
+            self.sorted_text.set_message("Click 'Sort Data' to sort...")
             
             # Update stats
             self.stats_label.config(
@@ -854,22 +985,8 @@ class ModernSortingApp:
             messagebox.showerror("Error", f"Failed to load file: {str(e)}")
     
     def load_txt_file(self, filepath):
-        """Load numbers from text file"""
-        data = []
-        with open(filepath, 'r') as f:
-            content = f.read()
-            # Try to parse numbers separated by various delimiters
-            import re
-            numbers = re.findall(r'-?\d+\.?\d*', content)
-            for num in numbers:
-                try:
-                    if '.' in num:
-                        data.append(float(num))
-                    else:
-                        data.append(int(num))
-                except ValueError:
-                    continue
-        return data
+        """Load numbers from text file into a typed array (cached next to the file)"""
+        return sorting_engine.load_numbers_mmap(filepath, cache=True)
     
     def load_excel_file(self, filepath, ext):
         """Load numbers from Excel file"""
@@ -922,14 +1039,9 @@ class ModernSortingApp:
         
         return data
     
-    def display_data(self, text_frame, data):
-        """Display data in text widget"""
-        text_widget = text_frame.winfo_children()[1]  # Get text widget (after scrollbar)
-        text_widget.delete(1.0, tk.END)
-        
-        # Format data nicely
-        formatted = ", ".join(str(x) for x in data)
-        text_widget.insert(tk.END, formatted)
+    def display_data(self, view, data):
+        """Show data in a DataView (only the visible rows are formatted)"""
+        view.set_data(data)
     
     def reload_file(self):
         """Reload the current file"""
@@ -967,9 +1079,7 @@ class ModernSortingApp:
         self.display_data(self.original_text, data)
         
         # Clear sorted data
-        sorted_text = self.sorted_text.winfo_children()[1]
-        sorted_text.delete(1.0, tk.END)
-        sorted_text.insert(tk.END, "Click 'Run' to sort...")
+        self.sorted_text.set_message("Click 'Run' to sort...")
         
         # Update stats
         self.stats_label.config(
@@ -993,37 +1103,52 @@ class ModernSortingApp:
         # Create progress dialog
         self.progress_dialog = ProgressDialog(self.root, "Sorting in Progress")
         
+        # The sort only writes to the channel; the dialog polls it per frame
+        self.progress_channel = sorting_engine.ProgressChannel()
+        self.sort_start = time.time()
+        self.profiling = self.profile_var.get()
+        self.profile_memory = self.profile_memory_var.get()
+        
         # Start sorting in a separate thread
         thread = threading.Thread(target=self.sort_data)
         thread.start()
+        self.poll_progress()
+    
+    def poll_progress(self):
+        """Refresh the progress dialog from the channel at a fixed frame rate"""
+        if not self.progress_dialog.winfo_exists():
+            return
+        snapshot = self.progress_channel.poll()
+        if snapshot is not None:
+            self.progress_dialog.update_progress(
+                snapshot["percent"],
+                f"Sorting with {self.sort_var.get()}...",
+                time.time() - self.sort_start
+            )
+        self.root.after(sorting_engine.FRAME_MS, self.poll_progress)
     
     def sort_data(self):
         """Perform the sorting operation"""
         algo = self.sort_var.get()
-        data = self.original_data.copy()
+        data = list(self.original_data)
         
         start_time = time.time()
         
-        def progress_callback(progress):
-            elapsed = time.time() - start_time
-            self.root.after(0, lambda: self.progress_dialog.update_progress(
-                progress, 
-                f"Sorting with {algo}...",
-                elapsed
-            ))
-        
-        # Select sorting algorithm
-        if algo == "Bubble Sort":
-            sorted_data = SortingAlgorithms.bubble_sort(data, progress_callback)
-        elif algo == "Insertion Sort":
-            sorted_data = SortingAlgorithms.insertion_sort(data, progress_callback)
-        else:  # Merge Sort
-            sorted_data = SortingAlgorithms.merge_sort(data, progress_callback)
-        
-        end_time = time.time()
-        elapsed_time = end_time - start_time
+        # Select sorting algorithm (Auto reports its choice in stats.strategy)
+        sort = SortingAlgorithms.get(algo)
+        stats = sorting_engine.SortStats()
+        self.last_profile = None
+        if self.profiling:
+            sorted_data, self.last_profile = sorting_engine.profile_run(
+                sort, (data, self.progress_channel, stats), memory=self.profile_memory)
+            elapsed_time = self.last_profile.elapsed
+        else:
+            sorted_data = sort(data, self.progress_channel, stats)
+            end_time = time.time()
+            elapsed_time = end_time - start_time
         
         self.sorted_data = sorted_data
+        self.last_strategy = stats.strategy
         
         # Update UI on main thread
         self.root.after(0, lambda: self.sorting_complete(elapsed_time))
@@ -1046,58 +1171,58 @@ class ModernSortingApp:
         self.time_label.config(
             text=f"⏱️ Sorted in: {elapsed_time:.6f}s | Complexity: {complexity} | {verification_status}"
         )
+        strategy = f"Strategy: {self.last_strategy}\n" if self.last_strategy else ""
+        profiled = " (profiled)" if self.last_profile is not None else ""
         
         messagebox.showinfo(
             "Sorting Complete",
             f"✅ Successfully sorted {len(self.sorted_data):,} elements!\n\n"
             f"Algorithm: {algo}\n"
-            f"Time: {elapsed_time:.6f} seconds\n"
+            f"{strategy}"
+            f"Time: {elapsed_time:.6f} seconds{profiled}\n"
             f"Time Complexity: {complexity}\n"
             f"Verification: {verification_status}"
         )
+        if self.last_profile is not None:
+            ProfileDialog(self.root, self.last_profile, algo)
     
     def compare_algorithms(self):
-        """Compare all sorting algorithms on the current dataset"""
+        """Compare all sorting algorithms on the current dataset (in the background)"""
         if not self.original_data:
             messagebox.showwarning("Warning", "Please load a file first!")
             return
+        if self.comparison_running:
+            return
         
-        # Show a simple waiting message
-        self.root.config(cursor="wait")
-        self.root.update()
-        
-        # Run comparison directly (blocking but simple)
-        results = self._run_comparison_sync()
-        
-        self.root.config(cursor="")
+        algorithms = list(sorting_engine.ALGORITHMS)
+        self.comparison_cancel = threading.Event()
+        dialog = ComparisonDialog(self.root, algorithms, self.COMPLEXITY_INFO,
+                                  len(self.original_data), on_cancel=self.comparison_cancel.set)
         
-        # Show comparison dialog
-        ComparisonDialog(self.root, results, len(self.original_data))
+        # Each algorithm runs in its own process; results stream into the dialog
+        self.comparison_running = True
+        thread = threading.Thread(target=self._run_comparison,
+                                  args=(dialog, list(self.original_data), algorithms))
+        thread.daemon = True
+        thread.start()
     
-    def _run_comparison_sync(self):
-        """Run all sorting algorithms synchronously and collect timing data"""
-        data = self.original_data.copy()
-        results = {}
-        
-        algorithms = [
-            ("Bubble Sort", SortingAlgorithms.bubble_sort, "O(n²)"),
-            ("Insertion Sort", SortingAlgorithms.insertion_sort, "O(n²)"),
-            ("Merge Sort", SortingAlgorithms.merge_sort, "O(n log n)")
-        ]
-        
-        for name, sort_func, complexity in algorithms:
-            # Time the algorithm (without progress callback for accurate timing)
-            start_time = time.time()
-            sort_func(data.copy(), None)  # No callback for accurate timing
-            end_time = time.time()
-            
-            elapsed = end_time - start_time
-            results[name] = {
-                'time': elapsed,
-                'complexity': complexity
-            }
-        
-        return results
+    def _run_comparison(self, dialog, data, algorithms):
+        """Worker thread: time every algorithm in separate processes"""
+        try:
+            sorting_engine.run_comparison(
+                data,
+                algorithms,
+                on_result=lambda name, result: self.root.after(0, dialog.add_result, name, result),
+                cancel_event=self.comparison_cancel,
+                timeout=self.COMPARISON_TIMEOUT,
+            )
+        finally:
+            self.root.after(0, self._comparison_finished, dialog)
+    
+    def _comparison_finished(self, dialog):
+        """Main thread: comparison done or cancelled"""
+        self.comparison_running = False
+        dialog.finish()
     
     def save_sorted_data(self):
         """Save sorted data to file"""
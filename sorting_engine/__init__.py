@@ -0,0 +1,87 @@
+"""
+Headless sorting engine shared by the sorting applications
+
+The kernels live here instead of inside the Tkinter classes so they can be
+imported by batch jobs and worker processes without a display server.
+Importing this package never imports tkinter.
+"""
+
+from .algorithms import (
+    ALGORITHMS,
+    COMPLEXITY_INFO,
+    SortStats,
+    bubble_sort,
+    get_algorithm,
+    insertion_sort,
+    merge_sort,
+    register_algorithm,
+)
+from .keys import (
+    KEY_TRANSFORMS,
+    argsort,
+    composite_keys,
+    extract_keys,
+    parse_keys,
+    parse_sort_spec,
+    permute,
+    sort_records,
+)
+from .records import RecordStore
+from .loaders import load_input, load_numbers_mmap
+from .external import external_sort_csv, external_sort_numbers
+from .numpy_backend import NUMPY_AVAILABLE, numpy_sort, sort_array, to_array
+from .timsort import tim_sort
+from .parallel import parallel_merge_sort, set_default_workers
+from .radix import counting_sort, radix_sort
+from .topk import top_k, top_k_indices
+from .progress import FRAME_MS, ProgressChannel
+from .instrument import count_inversions, instrumented, register_instrumented
+from .profiling import ProfileReport, profile_run
+from .comparison import run_comparison
+from .auto import auto_sort, choose_strategy, profile
+
+__all__ = [
+    "ALGORITHMS",
+    "COMPLEXITY_INFO",
+    "FRAME_MS",
+    "KEY_TRANSFORMS",
+    "NUMPY_AVAILABLE",
+    "ProfileReport",
+    "ProgressChannel",
+    "RecordStore",
+    "SortStats",
+    "argsort",
+    "auto_sort",
+    "bubble_sort",
+    "choose_strategy",
+    "composite_keys",
+    "count_inversions",
+    "counting_sort",
+    "external_sort_csv",
+    "external_sort_numbers",
+    "extract_keys",
+    "get_algorithm",
+    "insertion_sort",
+    "instrumented",
+    "load_input",
+    "load_numbers_mmap",
+    "merge_sort",
+    "numpy_sort",
+    "parallel_merge_sort",
+    "parse_keys",
+    "parse_sort_spec",
+    "permute",
+    "profile",
+    "profile_run",
+    "radix_sort",
+    "register_algorithm",
+    "register_instrumented",
+    "run_comparison",
+    "set_default_workers",
+    "sort_array",
+    "sort_records",
+    "tim_sort",
+    "to_array",
+    "top_k",
+    "top_k_indices",
+]
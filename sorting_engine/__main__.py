@@ -0,0 +1,7 @@
+"""Allow ``python -m sorting_engine`` to run the command-line sorter"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,403 @@
+"""
+Sorting kernels shared by all sorting front-ends
+Algorithms: Bubble Sort, Insertion Sort, Merge Sort
+
+This module never imports tkinter, so it can be used from batch jobs,
+worker processes and headless servers.
+
+Every kernel has the same signature:
+
+    kernel(arr, key=None, reverse=False, progress_callback=None,
+           cancel_event=None, stats=None)
+
+- arr: any sequence; it is copied, never modified
+- key: optional function computing the sort key of an item (called once per item)
+- reverse: sort in descending order (still stable)
+- progress_callback: called with a percentage (0-100), at most once per percent
+- cancel_event: object with an is_set() method (e.g. threading.Event);
+  when set, the kernel stops early and returns the partially sorted list
+- stats: optional SortStats instance; each kernel fills the counters it can
+  track without slowing down its inner loop (instrument.instrumented(kernel)
+  returns a variant with the same signature that counts everything)
+"""
+
+
+class SortStats:
+    """Counters collected while a kernel runs"""
+
+    __slots__ = ("comparisons", "swaps", "passes", "peak_memory", "strategy")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0  # swaps, or element moves for insertion-based kernels
+        self.passes = 0
+        self.peak_memory = 0  # bytes allocated at the peak (instrumented runs only)
+        self.strategy = None  # set by Auto: chosen algorithm and why
+
+    def as_dict(self):
+        """Return the counters as a plain dictionary"""
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "passes": self.passes,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class _Progress:
+    """Reports progress only when the whole percentage changes"""
+
+    __slots__ = ("callback", "last")
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.last = -1
+
+    def report(self, percent):
+        value = int(percent)
+        if value > self.last:
+            self.last = value
+            self.callback(min(100, percent))
+
+    def done(self):
+        self.last = 100
+        self.callback(100)
+
+
+def _sort_by_key(kernel, arr, key, reverse, progress_callback, cancel_event, stats):
+    """
+    Decorate-sort-undecorate helper.
+
+    Each item's key is computed once. The original index is stored next to
+    the key (negated for descending order) so that ties keep their input
+    order and the items themselves are never compared.
+    """
+    sign = -1 if reverse else 1
+    decorated = [(key(item), sign * i, item) for i, item in enumerate(arr)]
+    result = kernel(decorated, None, reverse, progress_callback, cancel_event, stats)
+    return [entry[2] for entry in result]
+
+
+# ==================== BUBBLE SORT ====================
+
+def bubble_sort(arr, key=None, reverse=False, progress_callback=None,
+                cancel_event=None, stats=None):
+    """
+    Optimized Bubble Sort
+
+    Optimizations:
+    1. Early termination when a pass makes no swaps
+    2. Tracks the last swap position so settled elements are skipped
+
+    stats receives comparisons and passes (counted per pass); swaps are
+    left to the instrumented variant so the inner loop stays bare.
+
+    Time Complexity: Best: O(n), Average: O(n²), Worst: O(n²)
+    Space Complexity: O(1) (besides the output copy)
+    """
+    if key is not None:
+        return _sort_by_key(bubble_sort, arr, key, reverse,
+                            progress_callback, cancel_event, stats)
+
+    data = list(arr)
+    n = len(data)
+    progress = _Progress(progress_callback) if progress_callback else None
+    comparisons = 0
+    passes = 0
+    last_swap = n - 1
+
+    while last_swap > 0:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+
+        new_last_swap = 0
+        if reverse:
+            for j in range(last_swap):
+                if data[j] < data[j + 1]:
+                    data[j], data[j + 1] = data[j + 1], data[j]
+                    new_last_swap = j
+        else:
+            for j in range(last_swap):
+                if data[j] > data[j + 1]:
+                    data[j], data[j + 1] = data[j + 1], data[j]
+                    new_last_swap = j
+
+        comparisons += last_swap
+        passes += 1
+        last_swap = new_last_swap
+
+        if progress:
+            if stats is not None:
+                stats.comparisons, stats.passes = comparisons, passes
+            # Everything after the last swap is in its final position
+            progress.report((n - 1 - last_swap) / (n - 1) * 100)
+
+    if stats is not None:
+        stats.comparisons, stats.passes = comparisons, passes
+    if progress:
+        progress.done()
+    return data
+
+
+# ==================== INSERTION SORT ====================
+
+def insertion_sort(arr, key=None, reverse=False, progress_callback=None,
+                   cancel_event=None, stats=None):
+    """
+    Binary Insertion Sort
+
+    Optimizations:
+    1. Binary search finds the insertion position in O(log n) comparisons
+    2. The sorted prefix is a separate list, so elements are shifted with a
+       single list insert (memmove) instead of one assignment per element
+
+    stats receives the element moves (as swaps) and passes; comparisons
+    are left to the instrumented variant.
+
+    Time Complexity: Best: O(n), Average: O(n²), Worst: O(n²)
+    Space Complexity: O(1) (besides the output copy)
+    """
+    if key is not None:
+        return _sort_by_key(insertion_sort, arr, key, reverse,
+                            progress_callback, cancel_event, stats)
+
+    data = list(arr)
+    n = len(data)
+    progress = _Progress(progress_callback) if progress_callback else None
+    check_every = max(1, n // 100)
+    countdown = check_every
+    moves = 0
+
+    # The sorted prefix grows in its own list, so each insert only shifts
+    # the part of the prefix after the insertion point
+    result = data[:1]
+    i = 1
+    while i < n:
+        item = data[i]
+
+        # Fast path: already in place relative to the sorted prefix
+        if (result[-1] >= item) if reverse else (result[-1] <= item):
+            result.append(item)
+        else:
+            # Find the rightmost position so equal items keep their order
+            left, right = 0, i - 1
+            if reverse:
+                while left < right:
+                    mid = (left + right) >> 1
+                    if result[mid] < item:
+                        right = mid
+                    else:
+                        left = mid + 1
+            else:
+                while left < right:
+                    mid = (left + right) >> 1
+                    if result[mid] > item:
+                        right = mid
+                    else:
+                        left = mid + 1
+            result.insert(left, item)
+            moves += i - left
+        i += 1
+
+        countdown -= 1
+        if countdown == 0:
+            countdown = check_every
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if progress:
+                if stats is not None:
+                    stats.swaps, stats.passes = moves, i - 1
+                progress.report(i / n * 100)
+
+    if i < n:
+        # Cancelled: keep the unsorted remainder after the sorted prefix
+        result.extend(data[i:])
+
+    if stats is not None:
+        stats.swaps, stats.passes = moves, max(0, i - 1)
+    if progress:
+        progress.done()
+    return result
+
+
+# ==================== MERGE SORT ====================
+
+_SMALL_RUN = 32
+
+
+def _insertion_sort_range(data, lo, hi, reverse):
+    """Sort data[lo:hi] in place with straight insertion (used for small runs)"""
+    for i in range(lo + 1, hi):
+        item = data[i]
+        j = i - 1
+        if reverse:
+            while j >= lo and data[j] < item:
+                data[j + 1] = data[j]
+                j -= 1
+        else:
+            while j >= lo and data[j] > item:
+                data[j + 1] = data[j]
+                j -= 1
+        data[j + 1] = item
+
+
+def _merge(src, dest, left, mid, right, reverse):
+    """Stable merge of src[left:mid] and src[mid:right] into dest[left:right]"""
+    # Already in order: copy the whole range in one slice
+    if (src[mid - 1] >= src[mid]) if reverse else (src[mid - 1] <= src[mid]):
+        dest[left:right] = src[left:right]
+        return
+
+    i, j, k = left, mid, left
+    a, b = src[i], src[j]
+    if reverse:
+        while True:
+            if b > a:
+                dest[k] = b
+                j += 1
+                k += 1
+                if j == right:
+                    break
+                b = src[j]
+            else:
+                dest[k] = a
+                i += 1
+                k += 1
+                if i == mid:
+                    break
+                a = src[i]
+    else:
+        while True:
+            if b < a:
+                dest[k] = b
+                j += 1
+                k += 1
+                if j == right:
+                    break
+                b = src[j]
+            else:
+                dest[k] = a
+                i += 1
+                k += 1
+                if i == mid:
+                    break
+                a = src[i]
+
+    # Copy the remaining tail in one slice
+    if i < mid:
+        dest[k:right] = src[i:mid]
+    else:
+        dest[k:right] = src[j:right]
+
+
+def merge_sort(arr, key=None, reverse=False, progress_callback=None,
+               cancel_event=None, stats=None):
+    """
+    Merge Sort (Iterative/Bottom-up)
+
+    Optimizations:
+    1. Runs of 32 elements are pre-sorted with insertion sort
+    2. Iterative bottom-up passes (no recursion limits)
+    3. Two buffers swapped between passes instead of slice copies per merge
+    4. Already ordered neighbouring runs are copied without merging
+
+    Time Complexity: Best: O(n log n), Average: O(n log n), Worst: O(n log n)
+    Space Complexity: O(n)
+    """
+    if key is not None:
+        return _sort_by_key(merge_sort, arr, key, reverse,
+                            progress_callback, cancel_event, stats)
+
+    data = list(arr)
+    n = len(data)
+    progress = _Progress(progress_callback) if progress_callback else None
+
+    for lo in range(0, n, _SMALL_RUN):
+        _insertion_sort_range(data, lo, min(lo + _SMALL_RUN, n), reverse)
+
+    total_passes = 0
+    width = _SMALL_RUN
+    while width < n:
+        total_passes += 1
+        width *= 2
+
+    aux = [None] * n
+    width = _SMALL_RUN
+    passes = 0
+    while width < n:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+
+        for left in range(0, n, 2 * width):
+            mid = left + width
+            if mid >= n:
+                aux[left:n] = data[left:n]
+                continue
+            right = min(left + 2 * width, n)
+            _merge(data, aux, left, mid, right, reverse)
+
+        data, aux = aux, data
+        width *= 2
+        passes += 1
+        if progress:
+            progress.report(passes / total_passes * 100)
+
+    if stats is not None:
+        stats.passes = passes
+    if progress:
+        progress.done()
+    return data
+
+
+# ==================== REGISTRY ====================
+
+ALGORITHMS = {
+    "Bubble Sort": bubble_sort,
+    "Insertion Sort": insertion_sort,
+    "Merge Sort": merge_sort,
+}
+
+COMPLEXITY_INFO = {
+    "Bubble Sort": {
+        "best": "O(n)",
+        "average": "O(n²)",
+        "worst": "O(n²)",
+        "space": "O(1)",
+        "description": "Simple comparison-based algorithm. Best for small datasets."
+    },
+    "Insertion Sort": {
+        "best": "O(n)",
+        "average": "O(n²)",
+        "worst": "O(n²)",
+        "space": "O(1)",
+        "description": "Efficient for small or nearly sorted datasets."
+    },
+    "Merge Sort": {
+        "best": "O(n log n)",
+        "average": "O(n log n)",
+        "worst": "O(n log n)",
+        "space": "O(n)",
+        "description": "Divide-and-conquer algorithm. Consistent performance."
+    }
+}
+
+
+def register_algorithm(name, kernel, complexity):
+    """
+    Add a kernel to the registry so every front-end can offer it.
+
+    complexity is a dictionary with the same keys as COMPLEXITY_INFO entries
+    (best, average, worst, space, description).
+    """
+    ALGORITHMS[name] = kernel
+    COMPLEXITY_INFO[name] = complexity
+
+
+def get_algorithm(name):
+    """Look up a sorting kernel by its display name (e.g. "Merge Sort")"""
+    try:
+        return ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown algorithm: {name!r}. Choose from: {', '.join(ALGORITHMS)}"
+        ) from None
@@ -0,0 +1,169 @@
+"""
+Auto: pick the sorting engine from a cheap profile of the input
+
+A fixed-size sample of the data (or of its keys) is checked for
+presortedness, duplicates and value types; integer data also gets an exact
+min/max. The rules below then dispatch to the engine that is fastest for
+that shape of input, and the choice is reported with a one-line reason
+(stats.strategy, or choose_strategy() directly).
+"""
+
+import os
+import random
+
+from .algorithms import ALGORITHMS, register_algorithm
+from .instrument import measuring_memory, register_instrumented
+from .keys import compact_keys
+from .numpy_backend import NUMPY_AVAILABLE
+from .parallel import SHARED_MEMORY_AVAILABLE
+
+# Inputs up to this size go to insertion sort (lowest overhead)
+SMALL_INPUT = 64
+
+# Adjacent pairs checked when profiling
+SAMPLE_SIZE = 1024
+
+# Out-of-order fraction of sampled pairs below which input is "nearly sorted"
+NEARLY_SORTED = 0.05
+
+# Integer ranges up to this many times n are counted instead of compared
+COUNTING_RANGE_FACTOR = 4
+
+# Pure Python inputs from this size are split across cores
+PARALLEL_INPUT = 200000
+
+
+def profile(values):
+    """
+    Cheap profile of a sequence of values (or keys).
+
+    Returns a dict with n, kind ("int", "float", "text" or "mixed"),
+    ascending/descending (fractions of sampled adjacent pairs in that order),
+    runs (estimated number of monotone runs), duplicates (fraction of
+    repeated values in the sample) and, for integers, min and max over all
+    values.
+    """
+    n = len(values)
+    info = {"n": n, "kind": "mixed", "ascending": 1.0, "descending": 1.0,
+            "runs": 1, "duplicates": 0.0, "min": None, "max": None}
+    if n < 2:
+        return info
+
+    # Deterministic sample of adjacent pairs
+    rng = random.Random(n)
+    positions = range(n - 1) if n - 1 <= SAMPLE_SIZE else rng.sample(range(n - 1), SAMPLE_SIZE)
+    ascending = descending = 0
+    sample = []
+    kinds = set()
+    for i in positions:
+        a, b = values[i], values[i + 1]
+        sample.append(a)
+        kinds.add(type(a))
+        try:
+            if a < b:
+                ascending += 1
+            elif b < a:
+                descending += 1
+            else:
+                ascending += 1
+                descending += 1
+        except TypeError:
+            kinds.add(None)  # not comparable
+    pairs = len(sample)
+    info["ascending"] = ascending / pairs
+    info["descending"] = descending / pairs
+    presorted = max(info["ascending"], info["descending"])
+    info["runs"] = 1 + round((1 - presorted) * (n - 1))
+    info["duplicates"] = 1 - len(set(sample)) / pairs if all(
+        kind is not None and kind.__hash__ is not None for kind in kinds) else 0.0
+
+    if kinds == {int}:
+        info["kind"] = "int"
+    elif kinds <= {int, float}:
+        info["kind"] = "float"
+    elif kinds == {str}:
+        info["kind"] = "text"
+
+    # Integer ranges need every value: one non-int makes the data mixed
+    if info["kind"] == "int":
+        if all(type(value) is int for value in values):
+            info["min"], info["max"] = min(values), max(values)
+        else:
+            info["kind"] = "mixed"
+    return info
+
+
+def choose_strategy(values, profile_info=None):
+    """
+    Pick an algorithm for sorting values.
+
+    Returns (algorithm name, reason). Engines that are not registered (or
+    whose optional dependency is missing) are skipped.
+    """
+    info = profile_info or profile(values)
+    n = info["n"]
+    numeric = info["kind"] in ("int", "float")
+
+    if n <= SMALL_INPUT:
+        return "Insertion Sort", f"tiny input (n={n} ≤ {SMALL_INPUT}): lowest overhead"
+
+    presorted = max(info["ascending"], info["descending"])
+    if 1 - presorted <= NEARLY_SORTED:
+        direction = "ascending" if info["ascending"] >= info["descending"] else "descending"
+        return "Tim Sort", (f"nearly sorted ({presorted:.0%} of sampled pairs {direction}, "
+                            f"~{info['runs']:,} runs): merges existing runs in ~O(n)")
+
+    if numeric and NUMPY_AVAILABLE and "NumPy Sort" in ALGORITHMS:
+        return "NumPy Sort", f"{info['kind']} values (n={n:,}): vectorized NumPy sort"
+
+    if info["kind"] == "int":
+        span = info["max"] - info["min"] + 1
+        if span <= COUNTING_RANGE_FACTOR * n and "Counting Sort" in ALGORITHMS:
+            return "Counting Sort", (f"integers in a small range ({span:,} values for n={n:,}, "
+                                     f"{info['duplicates']:.0%} duplicates): O(n + k) counting")
+        if "Radix Sort" in ALGORITHMS:
+            return "Radix Sort", f"integers spanning {span:,} values: LSD radix passes, no comparisons"
+
+    cores = os.cpu_count() or 1
+    if numeric and n >= PARALLEL_INPUT and cores > 1 and SHARED_MEMORY_AVAILABLE \
+            and "Parallel Merge Sort" in ALGORITHMS:
+        return "Parallel Merge Sort", f"large numeric input (n={n:,}): split across {cores} cores"
+
+    return "Tim Sort", (f"general {info['kind']} input (n={n:,}, ~{info['runs']:,} runs, "
+                        f"{info['duplicates']:.0%} duplicates): adaptive merge sort")
+
+
+def auto_sort(arr, key=None, reverse=False, progress_callback=None,
+              cancel_event=None, stats=None):
+    """
+    Auto (profile the input, then dispatch)
+
+    Keys are computed once and profiled instead of the items. The chosen
+    algorithm and the reason are stored in stats.strategy.
+
+    Time Complexity: that of the chosen algorithm
+    Space Complexity: O(n)
+    """
+    items = arr if isinstance(arr, list) else list(arr)
+    if key is None:
+        name, reason = choose_strategy(items)
+        result = ALGORITHMS[name](items, None, reverse, progress_callback, cancel_event, stats)
+    else:
+        keys = compact_keys([key(item) for item in items])
+        name, reason = choose_strategy(keys)
+        order = ALGORITHMS[name](range(len(keys)), keys.__getitem__, reverse,
+                                 progress_callback, cancel_event, stats)
+        result = [items[i] for i in order]
+    if stats is not None:
+        stats.strategy = f"{name}: {reason}"
+    return result
+
+
+register_algorithm("Auto", auto_sort, {
+    "best": "O(n)",
+    "average": "O(n log n)",
+    "worst": "O(n log n)",
+    "space": "O(n)",
+    "description": "Profiles the input and picks the fastest engine for it."
+})
+register_instrumented(auto_sort, measuring_memory(auto_sort))
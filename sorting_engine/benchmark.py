@@ -0,0 +1,316 @@
+"""
+Reproducible benchmark suite for the engine kernels
+
+Runs every registered algorithm over a matrix of input sizes and
+distributions. Each cell gets warmup runs, then `repeat` timed runs with
+time.perf_counter_ns (garbage collection paused), summarized as
+min/median/mean/p95/stddev. Inputs come from a seeded generator, so two
+runs on the same machine time exactly the same data.
+
+Usage:
+    python -m sorting_engine.benchmark --json results.json --csv results.csv
+    python -m sorting_engine.benchmark --baseline results.json   # regressions
+
+Quadratic algorithms (Bubble/Insertion Sort) are skipped above
+--max-quadratic elements, which keeps a full 100..10^6 run practical.
+"""
+
+import argparse
+import csv
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from .algorithms import ALGORITHMS, COMPLEXITY_INFO
+from .numpy_backend import NUMPY_AVAILABLE
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+
+# Bubble/Insertion Sort above this size would take minutes per run
+DEFAULT_MAX_QUADRATIC = 10000
+
+# Slowdown (median) reported as a regression by compare()
+DEFAULT_THRESHOLD = 0.10
+
+RESULT_FIELDS = [
+    "algorithm", "distribution", "size", "repeat", "warmup",
+    "min_ns", "median_ns", "mean_ns", "p95_ns", "stddev_ns", "verified",
+]
+
+
+# ----- Input distributions -----
+
+def _random(n, rng):
+    return [rng.randint(1, max(10, n * 10)) for _ in range(n)]
+
+
+def _sorted(n, rng):
+    return list(range(1, n + 1))
+
+
+def _reversed(n, rng):
+    return list(range(n, 0, -1))
+
+
+def _few_unique(n, rng):
+    return [rng.randint(1, 10) for _ in range(n)]
+
+
+def _zigzag(n, rng):
+    """dataset.txt pattern: a falling and a rising sequence randomly interleaved"""
+    low, high = 1, n
+    data = []
+    while low <= high:
+        if rng.random() < 0.5:
+            data.append(high)
+            high -= 1
+        else:
+            data.append(low)
+            low += 1
+    return data
+
+
+DISTRIBUTIONS = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "few-unique": _few_unique,
+    "zigzag": _zigzag,
+}
+
+
+def make_input(distribution, n, seed=0):
+    """Deterministic input list for one benchmark cell"""
+    try:
+        generate = DISTRIBUTIONS[distribution]
+    except KeyError:
+        raise ValueError(
+            f"Unknown distribution: {distribution!r}. Choose from: {', '.join(DISTRIBUTIONS)}"
+        ) from None
+    # Seed per cell so adding sizes or distributions never changes other inputs
+    return generate(n, random.Random(f"{seed}:{distribution}:{n}"))
+
+
+# ----- Measuring -----
+
+def is_quadratic(name):
+    """True for algorithms with O(n²) average time"""
+    return COMPLEXITY_INFO.get(name, {}).get("average") == "O(n²)"
+
+
+def measure(kernel, data, repeat=5, warmup=1):
+    """
+    Time kernel(data) `repeat` times after `warmup` untimed runs.
+
+    Returns (timings in ns, verified) where verified tells whether the
+    warmup (or first) result was correctly sorted.
+    """
+    verified = True
+    gc_was_enabled = gc.isenabled()
+    timings = []
+    try:
+        for i in range(warmup + repeat):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter_ns()
+            result = kernel(data)
+            elapsed = time.perf_counter_ns() - start
+            if gc_was_enabled:
+                gc.enable()
+            if i == 0:
+                verified = len(result) == len(data) and all(
+                    result[j] <= result[j + 1] for j in range(len(result) - 1))
+            if i >= warmup:
+                timings.append(elapsed)
+            del result
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings, verified
+
+
+def summarize(timings):
+    """min/median/mean/p95/stddev of a list of ns timings"""
+    ordered = sorted(timings)
+    # Nearest-rank percentile
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    return {
+        "min_ns": ordered[0],
+        "median_ns": int(statistics.median(ordered)),
+        "mean_ns": int(statistics.mean(ordered)),
+        "p95_ns": p95,
+        "stddev_ns": int(statistics.stdev(ordered)) if len(ordered) > 1 else 0,
+    }
+
+
+def environment(seed):
+    """Machine and interpreter details stored next to the results"""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": NUMPY_AVAILABLE,
+        "seed": seed,
+    }
+
+
+def run_suite(algorithms=None, sizes=DEFAULT_SIZES, distributions=None, repeat=5,
+              warmup=1, seed=0, max_quadratic=DEFAULT_MAX_QUADRATIC, log=None):
+    """
+    Benchmark every (algorithm, distribution, size) cell.
+
+    algorithms: display names (default: every registered algorithm)
+    log: optional function called with a one-line summary per cell
+
+    Returns a list of result dicts (see RESULT_FIELDS).
+    """
+    algorithms = list(ALGORITHMS) if algorithms is None else list(algorithms)
+    distributions = list(DISTRIBUTIONS) if distributions is None else list(distributions)
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            data = make_input(distribution, size, seed)
+            for name in algorithms:
+                if is_quadratic(name) and size > max_quadratic:
+                    continue
+                timings, verified = measure(ALGORITHMS[name], data, repeat, warmup)
+                row = {
+                    "algorithm": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "repeat": repeat,
+                    "warmup": warmup,
+                }
+                row.update(summarize(timings))
+                row["verified"] = verified
+                results.append(row)
+                if log:
+                    log(f"{name:<20} {distribution:<11} n={size:<8} "
+                        f"median {row['median_ns'] / 1e6:10.3f} ms  "
+                        f"p95 {row['p95_ns'] / 1e6:10.3f} ms  "
+                        f"sd {row['stddev_ns'] / 1e6:8.3f} ms"
+                        + ("" if verified else "  NOT SORTED"))
+    return results
+
+
+# ----- Saving and comparing -----
+
+def write_json(path, results, meta):
+    with open(path, "w") as f:
+        json.dump({"environment": meta, "results": results}, f, indent=2)
+        f.write("\n")
+
+
+def write_csv(path, results):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_results(path):
+    """Results from a JSON file written by write_json (or a CSV from write_csv)"""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="") as f:
+            return [
+                dict(row, size=int(row["size"]), median_ns=int(row["median_ns"]))
+                for row in csv.DictReader(f)
+            ]
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline, results, threshold=DEFAULT_THRESHOLD):
+    """
+    Cells whose median got slower than the baseline by more than threshold.
+
+    Returns a list of (algorithm, distribution, size, old_ns, new_ns, ratio).
+    """
+    old = {(r["algorithm"], r["distribution"], int(r["size"])): int(r["median_ns"])
+           for r in baseline}
+    regressions = []
+    for r in results:
+        cell = (r["algorithm"], r["distribution"], r["size"])
+        if cell in old and old[cell] > 0:
+            ratio = r["median_ns"] / old[cell]
+            if ratio > 1 + threshold:
+                regressions.append(cell + (old[cell], r["median_ns"], ratio))
+    return regressions
+
+
+# ----- Command line -----
+
+def _slug_map():
+    from .cli import ALGORITHM_CHOICES
+    return ALGORITHM_CHOICES
+
+
+def build_parser():
+    choices = _slug_map()
+    parser = argparse.ArgumentParser(
+        prog="python -m sorting_engine.benchmark",
+        description="Benchmark the sorting algorithms over sizes and input distributions."
+    )
+    parser.add_argument("-a", "--algorithm", action="append", choices=sorted(choices),
+                        help="algorithm to include (repeatable; default: all)")
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="input sizes (default: 100 1000 10000 100000 1000000)")
+    parser.add_argument("-d", "--distribution", action="append", choices=list(DISTRIBUTIONS),
+                        help="input distribution (repeatable; default: all)")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timed runs per cell (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="untimed runs per cell (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="input seed (default: 0)")
+    parser.add_argument("--max-quadratic", type=int, default=DEFAULT_MAX_QUADRATIC,
+                        help=f"largest size for O(n²) algorithms (default: {DEFAULT_MAX_QUADRATIC})")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--baseline",
+                        help="earlier JSON/CSV results; exit 1 if any median regressed")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown vs --baseline (default: 0.10)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.repeat < 1 or args.warmup < 0:
+        print("error: --repeat must be >= 1 and --warmup >= 0", file=sys.stderr)
+        return 2
+    choices = _slug_map()
+    algorithms = [choices[slug] for slug in args.algorithm] if args.algorithm else None
+
+    meta = environment(args.seed)
+    results = run_suite(algorithms, args.sizes, args.distribution, args.repeat,
+                        args.warmup, args.seed, args.max_quadratic,
+                        log=lambda line: print(line, flush=True))
+    if args.json:
+        write_json(args.json, results, meta)
+    if args.csv:
+        write_csv(args.csv, results)
+
+    status = 0 if all(r["verified"] for r in results) else 1
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), results, args.threshold)
+        for name, distribution, size, old_ns, new_ns, ratio in regressions:
+            print(f"REGRESSION {name} {distribution} n={size}: "
+                  f"{old_ns / 1e6:.3f} ms -> {new_ns / 1e6:.3f} ms ({ratio:.2f}x)")
+        if regressions:
+            status = 1
+        else:
+            print(f"No regressions beyond {args.threshold:.0%} vs {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+"""
+Command-line batch sorter (no display server required)
+
+Usage:
+    python -m sorting_engine INPUT [-a merge] [-c ID] [--order desc] [-o OUTPUT]
+
+INPUT may be a dataset.txt style number list, a CSV table with a header row
+(generated_data.csv) or an .xlsx workbook. The sorted data is streamed to
+OUTPUT (or stdout) in the same shape: one number per line, or CSV with the
+original header. Load, sort and write timings are reported as one JSON
+object on stderr (or in the file given with --report).
+
+With --top K, only the first K records are selected (partial sort) and
+written. With --count, the input is sorted a second time by the
+instrumented variant of the algorithm and its comparisons, swaps, passes
+and peak memory are added to the report; the reported sort time is always
+that of the uninstrumented run. With --profile PREFIX, the sort runs under
+cProfile and a stack sampler: PREFIX.txt (hottest functions),
+PREFIX.collapsed (flame graph input) and PREFIX.prof are written; with
+--profile-memory as well, the sort runs once more under tracemalloc for the
+peak memory. With --external, .txt and .csv inputs are sorted in bounded
+memory: sorted runs are spilled to temporary files and merged into the
+output, so inputs larger than RAM work.
+"""
+
+import argparse
+import csv
+import json
+import locale
+import os
+import sys
+import time
+from itertools import islice
+
+from .algorithms import ALGORITHMS, SortStats
+from .external import DEFAULT_CHUNK_ROWS, external_sort_csv, external_sort_numbers
+from .instrument import instrumented
+from .keys import parse_sort_spec
+from .profiling import profile_run
+from .loaders import load_input
+from .parallel import set_default_workers
+from .records import RecordStore
+from .topk import top_k
+
+# Rows written per chunk when streaming output
+_WRITE_CHUNK = 65536
+
+
+def algorithm_slug(name):
+    """Command-line name of an algorithm (e.g. "Merge Sort" -> "merge")"""
+    return name.lower().replace(" sort", "").replace(" ", "-")
+
+
+ALGORITHM_CHOICES = {algorithm_slug(name): name for name in ALGORITHMS}
+
+
+def write_numbers(out, data):
+    """Stream numbers one per line"""
+    for start in range(0, len(data), _WRITE_CHUNK):
+        out.write("\n".join(map(str, data[start:start + _WRITE_CHUNK])))
+        out.write("\n")
+
+
+def write_table(out, store, order):
+    """Stream a RecordStore as CSV with its header row, in the given row order"""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(store.columns)
+    rows = store.iter_rows(order)
+    for start in range(0, len(order), _WRITE_CHUNK):
+        writer.writerows(islice(rows, _WRITE_CHUNK))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m sorting_engine",
+        description="Sort a number list, CSV table or .xlsx sheet without a GUI."
+    )
+    parser.add_argument("input", help="input file (.txt, .csv or .xlsx)")
+    parser.add_argument("-a", "--algorithm", choices=sorted(ALGORITHM_CHOICES),
+                        default="merge", help="sorting algorithm (default: merge)")
+    parser.add_argument("-c", "--column",
+                        help="key column for tables (default: first column); several "
+                             "columns sort as one key, e.g. LastName,FirstName,ID:desc")
+    parser.add_argument("--order", choices=["asc", "desc"], default="asc",
+                        help="sort order (default: asc)")
+    parser.add_argument("-i", "--ignore-case", action="store_true",
+                        help="compare text columns case-insensitively (casefold)")
+    parser.add_argument("--collate", action="store_true",
+                        help="compare text columns with the current locale's collation")
+    parser.add_argument("--cache", action="store_true",
+                        help="keep a binary cache next to number files for fast reloads")
+    parser.add_argument("-w", "--workers", type=int,
+                        help="processes for parallel-merge (default: all cores)")
+    parser.add_argument("--top", type=int, metavar="K",
+                        help="output only the first K records, selected without a full sort")
+    parser.add_argument("--count", action="store_true",
+                        help="add operation counters from a separate instrumented run to the report")
+    parser.add_argument("--profile", metavar="PREFIX",
+                        help="profile the sort; writes PREFIX.txt, PREFIX.collapsed and PREFIX.prof")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="with --profile, also measure peak memory in a second, traced run (slow)")
+    parser.add_argument("--external", action="store_true",
+                        help="sort .txt/.csv files larger than memory via temporary sorted runs")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"CSV rows per in-memory run with --external (default: {DEFAULT_CHUNK_ROWS})")
+    parser.add_argument("--tmp-dir",
+                        help="directory for --external runs (default: system temp dir)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file (default: stdout)")
+    parser.add_argument("--report", default="-",
+                        help="where to write the JSON timing report (default: stderr)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.collate:
+        locale.setlocale(locale.LC_COLLATE, "")
+    algorithm = ALGORITHM_CHOICES[args.algorithm]
+    if args.workers is not None:
+        if args.workers < 1:
+            print("error: --workers must be at least 1", file=sys.stderr)
+            return 2
+        set_default_workers(args.workers)
+    reverse = args.order == "desc"
+    if args.top is not None and args.top < 0:
+        print("error: --top must be at least 0", file=sys.stderr)
+        return 2
+    if args.count and (args.top is not None or args.external):
+        print("error: --count cannot be combined with --top or --external", file=sys.stderr)
+        return 2
+    if args.profile and args.external:
+        print("error: --profile cannot be combined with --external", file=sys.stderr)
+        return 2
+    if args.profile_memory and not args.profile:
+        print("error: --profile-memory needs --profile", file=sys.stderr)
+        return 2
+    if args.external:
+        if args.top is not None:
+            print("error: --top cannot be combined with --external", file=sys.stderr)
+            return 2
+        return run_external(args, algorithm, reverse)
+
+    start = time.perf_counter()
+    try:
+        data = load_input(args.input, cache=args.cache)
+    except (OSError, RuntimeError, csv.Error, UnicodeDecodeError, ValueError) as e:
+        print(f"error: could not load {args.input}: {e}", file=sys.stderr)
+        return 1
+    load_seconds = time.perf_counter() - start
+
+    is_table = isinstance(data, RecordStore)
+    kernel = ALGORITHMS[algorithm]
+    if is_table:
+        column = args.column or data.columns[0]
+        try:
+            # "A,B:desc" is a composite key; --order is the default direction
+            spec = parse_sort_spec(column, reverse) if "," in column or ":" in column else None
+        except ValueError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+        for name in [name for name, _ in spec] if spec else [column]:
+            if name not in data.columns:
+                print(f"error: unknown column {name!r}; available: {', '.join(data.columns)}",
+                      file=sys.stderr)
+                return 2
+        transform = "collate" if args.collate else "casefold" if args.ignore_case else None
+        if args.top is not None:
+            sort, sort_args = data.top_k, (spec or column, args.top, False if spec else reverse, transform)
+        elif spec:
+            sort, sort_args = data.argsort, (spec, kernel, False, transform)
+        else:
+            sort, sort_args = data.argsort, (column, kernel, reverse, transform)
+    else:
+        column = None
+        if args.top is not None:
+            sort, sort_args = top_k, (data, args.top, None, reverse)
+        else:
+            sort, sort_args = kernel, (data, None, reverse)
+
+    profile = None
+    if args.profile:
+        # Profiled time (the tracemalloc pass for peak memory is not included)
+        result, profile = profile_run(sort, sort_args, memory=args.profile_memory)
+        sort_seconds = profile.elapsed
+    else:
+        start = time.perf_counter()
+        result = sort(*sort_args)
+        sort_seconds = time.perf_counter() - start
+
+    counters = None
+    if args.count:
+        # Separate run, so the counting never shows up in sort_seconds
+        stats = SortStats()
+        if is_table:
+            data.argsort(spec or column, instrumented(kernel), False if spec else reverse,
+                         transform, stats=stats)
+        else:
+            instrumented(kernel)(data, reverse=reverse, stats=stats)
+        counters = stats.as_dict()
+
+    start = time.perf_counter()
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        if is_table:
+            write_table(out, data, result)
+        else:
+            write_numbers(out, result)
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+    write_seconds = time.perf_counter() - start
+
+    report = {
+        "input": args.input,
+        "output": args.output,
+        "algorithm": algorithm if args.top is None else "top-k",
+        "column": column,
+        "order": args.order,
+        "records": len(result),
+        "load_seconds": load_seconds,
+        "sort_seconds": sort_seconds,
+        "write_seconds": write_seconds,
+    }
+    if counters is not None:
+        report["counters"] = counters
+    if profile is not None:
+        try:
+            files = profile.save(args.profile)
+        except OSError as e:
+            print(f"error: could not write profile {args.profile}: {e}", file=sys.stderr)
+            return 1
+        report["profile"] = {
+            "peak_memory": profile.peak_memory,
+            "hottest": [row["function"] for row in profile.hottest(5)],
+            "files": files,
+        }
+    write_report(args, report)
+    return 0
+
+
+def run_external(args, algorithm, reverse):
+    """--external: sort file to file in bounded memory"""
+    ext = os.path.splitext(args.input)[1].lower()
+    if ext == ".xlsx":
+        print("error: --external supports .txt and .csv inputs", file=sys.stderr)
+        return 1
+    if args.column and ("," in args.column or ":" in args.column):
+        print("error: --external sorts by a single column", file=sys.stderr)
+        return 2
+    kernel = ALGORITHMS[algorithm]
+    stats = SortStats()
+    output = sys.stdout if args.output == "-" else args.output
+    start = time.perf_counter()
+    try:
+        if ext == ".csv":
+            transform = "collate" if args.collate else "casefold" if args.ignore_case else None
+            records = external_sort_csv(args.input, output, args.column, kernel, reverse,
+                                        transform, args.chunk_rows, args.tmp_dir, stats=stats)
+        else:
+            records = external_sort_numbers(args.input, output, kernel, reverse,
+                                            tmp_dir=args.tmp_dir, stats=stats)
+        if output is sys.stdout:
+            sys.stdout.flush()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        print(f"error: could not sort {args.input}: {e}", file=sys.stderr)
+        return 1
+
+    write_report(args, {
+        "input": args.input,
+        "output": args.output,
+        "algorithm": algorithm,
+        "column": args.column,
+        "order": args.order,
+        "records": records,
+        "external_runs": stats.passes,
+        "total_seconds": time.perf_counter() - start,
+    })
+    return 0
+
+
+def write_report(args, report):
+    """Write the JSON timing report to stderr or the --report file"""
+    if args.report == "-":
+        print(json.dumps(report), file=sys.stderr)
+    else:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
@@ -0,0 +1,130 @@
+"""
+Side-by-side algorithm comparison in worker processes
+
+Every algorithm sorts its own copy of the data in a separate process, a few
+at a time, so a slow O(n²) run neither blocks the caller nor delays the
+fast algorithms' results. Each result is reported as soon as it arrives;
+runs can be cancelled and are stopped after a per-algorithm timeout.
+"""
+
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+from .algorithms import ALGORITHMS, COMPLEXITY_INFO
+from .parallel import _typed
+
+# Seconds an algorithm may run before it is stopped (None = no limit)
+DEFAULT_TIMEOUT = 60.0
+
+# How often running workers are checked for timeouts and cancellation
+_POLL_SECONDS = 0.1
+
+
+def _time_algorithm(name, data, conn):
+    """Worker process: sort data once with one algorithm and send the time"""
+    try:
+        data = list(data)
+        kernel = ALGORITHMS[name]
+        start = time.perf_counter()
+        kernel(data)
+        conn.send(("ok", time.perf_counter() - start, None))
+    except Exception as e:
+        conn.send(("error", None, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def run_comparison(data, algorithms=None, on_result=None, cancel_event=None,
+                   timeout=DEFAULT_TIMEOUT, max_parallel=None):
+    """
+    Time each algorithm on data, each in its own process.
+
+    algorithms: display names (default: every registered algorithm)
+    on_result: called as on_result(name, result) when an algorithm finishes,
+        times out, fails or is cancelled (from the calling thread)
+    cancel_event: threading.Event; when set, running workers are stopped
+    timeout: wall-clock seconds per algorithm, including process start-up
+    max_parallel: processes running at once (default: one per core)
+
+    Blocks until every algorithm is done, so GUIs call it from a thread.
+    Returns {name: result}, where result has "status" ("ok", "timeout",
+    "error" or "cancelled"), "time" (seconds or None), "complexity" and
+    "error" (message or None).
+    """
+    ctx = multiprocessing.get_context("spawn")
+    pending = list(ALGORITHMS if algorithms is None else algorithms)
+    max_parallel = max(1, max_parallel or os.cpu_count() or 1)
+    # A typed array pickles as one block of bytes instead of n objects
+    payload = _typed(data) or list(data)
+    running = {}  # connection -> (name, process, start time)
+    results = {}
+
+    def finish(name, status, elapsed=None, error=None):
+        result = {
+            "status": status,
+            "time": elapsed,
+            "complexity": COMPLEXITY_INFO.get(name, {}).get("average", "?"),
+            "error": error,
+        }
+        results[name] = result
+        if on_result:
+            on_result(name, result)
+
+    def receive(conn, process):
+        """The worker's (status, time, error), or an error if it sent none"""
+        try:
+            return conn.recv()
+        except EOFError:
+            return "error", None, f"worker exited with code {process.exitcode}"
+
+    def stop(conn):
+        name, process, _ = running.pop(conn)
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        conn.close()
+        return name
+
+    try:
+        while pending or running:
+            if cancel_event is not None and cancel_event.is_set():
+                for conn in list(running):
+                    finish(stop(conn), "cancelled")
+                for name in pending:
+                    finish(name, "cancelled")
+                pending = []
+                break
+
+            while pending and len(running) < max_parallel:
+                name = pending.pop(0)
+                receiver, sender = ctx.Pipe(duplex=False)
+                process = ctx.Process(target=_time_algorithm, args=(name, payload, sender))
+                process.start()
+                sender.close()
+                running[receiver] = (name, process, time.monotonic())
+
+            wait(list(running) + [process.sentinel for _, process, _ in running.values()],
+                 timeout=_POLL_SECONDS)
+            now = time.monotonic()
+            for conn, (name, process, started) in list(running.items()):
+                if conn.poll():
+                    status, elapsed, error = receive(conn, process)
+                elif not process.is_alive():
+                    # The result may have been sent after the poll() above
+                    if conn.poll():
+                        status, elapsed, error = receive(conn, process)
+                    else:
+                        status, elapsed, error = "error", None, \
+                            f"worker exited with code {process.exitcode}"
+                elif timeout is not None and now - started > timeout:
+                    status, elapsed, error = "timeout", None, f"stopped after {timeout:g}s"
+                else:
+                    continue
+                stop(conn)
+                finish(name, status, elapsed, error)
+    finally:
+        for conn in list(running):
+            stop(conn)
+    return results
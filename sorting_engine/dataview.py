@@ -0,0 +1,199 @@
+"""
+Virtualized Tk view for very large sequences
+
+A tk.Text holding ", ".join(map(str, data)) costs seconds and hundreds of
+MB at 10^6 items. DataView keeps only a reference to the sequence and
+formats the rows that are currently visible; scrolling renders the next
+window straight from the data (list, array or ndarray slices), so the
+display cost depends on the widget size, not on len(data).
+
+Unlike the rest of the package this module imports tkinter, so it is not
+imported by sorting_engine/__init__.py:
+
+    from sorting_engine.dataview import DataView
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+
+# Items sampled to estimate the widest formatted item
+_SAMPLE = 200
+
+# Rows moved per mouse wheel notch
+_WHEEL_ROWS = 3
+
+
+def item_width(data):
+    """Characters needed per item (widest of a sample) plus the separator"""
+    n = len(data)
+    if n == 0:
+        return 1
+    sample = list(data[:_SAMPLE]) + list(data[max(_SAMPLE, n - _SAMPLE):])
+    return max(len(str(value)) for value in sample) + 2
+
+
+def row_count(n, per_row):
+    """Number of rows needed for n items"""
+    return -(-n // per_row)
+
+
+def format_rows(data, first_row, rows, per_row, label_width=0):
+    """
+    Text for rows first_row .. first_row + rows - 1 of data.
+
+    Each row holds per_row comma-separated items, prefixed with the index
+    of its first item when label_width > 0.
+    """
+    lines = []
+    n = len(data)
+    for row in range(first_row, min(first_row + rows, row_count(n, per_row))):
+        start = row * per_row
+        line = ", ".join(map(str, data[start:start + per_row]))
+        if start + per_row < n:
+            line += ","
+        if label_width:
+            line = f"{start:>{label_width}} │ {line}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class DataView(tk.Frame):
+    """
+    Read-only, lazily rendered view of a sequence.
+
+    per_row: items per row (default: as many as fit the widget width)
+    show_index: prefix every row with the index of its first item
+    text_options: passed to the inner tk.Text (bg, fg, font, padx, ...)
+    """
+
+    def __init__(self, parent, per_row=None, show_index=True, **text_options):
+        super().__init__(parent, bg=text_options.get("bg", "#1e1e2e"))
+        self.data = ()
+        self.first_row = 0
+        self.fixed_per_row = per_row
+        self.per_row = per_row or 1
+        self.show_index = show_index
+        self.item_width = 1
+
+        self.scrollbar = ttk.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text_options.setdefault("wrap", tk.NONE)
+        self.text = tk.Text(self, undo=False, maxundo=0, **text_options)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.config(state=tk.DISABLED)
+        self.font = tkfont.Font(font=self.text.cget("font"))
+
+        self.text.bind("<Configure>", self._on_resize)
+        for widget in (self, self.text):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda e: self.scroll_rows(-_WHEEL_ROWS))
+            widget.bind("<Button-5>", lambda e: self.scroll_rows(_WHEEL_ROWS))
+        # A disabled Text does not take focus on click; keys need it
+        self.text.bind("<Button-1>", lambda e: self.text.focus_set(), add="+")
+        self.text.bind("<Prior>", lambda e: self.yview("scroll", -1, "pages"))
+        self.text.bind("<Next>", lambda e: self.yview("scroll", 1, "pages"))
+        self.text.bind("<Home>", lambda e: self.yview("moveto", 0))
+        self.text.bind("<End>", lambda e: self.yview("moveto", 1))
+        self.text.bind("<Up>", lambda e: self.scroll_rows(-1))
+        self.text.bind("<Down>", lambda e: self.scroll_rows(1))
+
+    # ----- Content -----
+
+    def set_data(self, data):
+        """Show a sequence (kept by reference, never copied) from the top"""
+        self.data = data
+        self.first_row = 0
+        self.item_width = item_width(data)
+        self._fit_row()
+        self.render()
+
+    def set_message(self, message):
+        """Clear the data and show a placeholder message"""
+        self.data = ()
+        self.first_row = 0
+        self._replace_text(message)
+        self.scrollbar.set(0, 1)
+
+    def clear(self):
+        self.set_message("")
+
+    # ----- Layout -----
+
+    def visible_rows(self):
+        """Rows that fit the widget (the configured height before it is mapped)"""
+        height = self.text.winfo_height()
+        if height <= 1:
+            return int(self.text.cget("height"))
+        padding = 2 * (int(self.text.cget("pady")) + int(self.text.cget("borderwidth")))
+        return max(1, (height - padding) // self.font.metrics("linespace"))
+
+    def _label_width(self):
+        return len(str(max(len(self.data) - 1, 0))) if self.show_index else 0
+
+    def _fit_row(self):
+        """Items per row that fit the current width (unless fixed)"""
+        if self.fixed_per_row:
+            return
+        width = self.text.winfo_width()
+        if width <= 1:
+            width = int(self.text.cget("width")) * self.font.measure("0")
+        padding = 2 * (int(self.text.cget("padx")) + int(self.text.cget("borderwidth")))
+        chars = (width - padding) // max(1, self.font.measure("0"))
+        label = self._label_width() + 3 if self.show_index else 0
+        self.per_row = max(1, (chars - label) // self.item_width)
+
+    def _on_resize(self, event=None):
+        if not len(self.data):
+            return
+        top_item = self.first_row * self.per_row
+        self._fit_row()
+        self.first_row = top_item // self.per_row
+        self.render()
+
+    # ----- Scrolling -----
+
+    def rows(self):
+        return row_count(len(self.data), self.per_row)
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.first_row = int(float(args[1]) * self.rows())
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= max(1, self.visible_rows() - 1)
+            self.first_row += step
+        self.render()
+
+    def scroll_rows(self, rows):
+        self.yview("scroll", rows, "units")
+        return "break"
+
+    def _on_wheel(self, event):
+        # Windows/macOS report the direction in delta (X11 uses Button-4/5)
+        return self.scroll_rows(-_WHEEL_ROWS if event.delta > 0 else _WHEEL_ROWS)
+
+    # ----- Rendering -----
+
+    def render(self):
+        """Format and show only the visible window of rows"""
+        total = self.rows()
+        visible = self.visible_rows()
+        self.first_row = max(0, min(self.first_row, total - visible))
+        self._replace_text(format_rows(self.data, self.first_row, visible,
+                                       self.per_row, self._label_width()))
+        if total:
+            self.scrollbar.set(self.first_row / total,
+                               min(1.0, (self.first_row + visible) / total))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _replace_text(self, content):
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", content)
+        self.text.config(state=tk.DISABLED)
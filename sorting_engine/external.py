@@ -0,0 +1,265 @@
+"""
+External merge sort for inputs larger than memory
+
+The input is read in bounded chunks. Each chunk is sorted with an engine
+kernel (merge sort by default) and spilled to a temporary run file, then the
+runs are combined with a k-way heap merge (heapq.merge) straight into the
+output. Memory use depends on the chunk size, not on the input size, so
+multi-GB ID dumps shaped like generated_data.csv can be sorted on small
+machines.
+
+- external_sort_csv: CSV tables with a header row
+- external_sort_numbers: dataset.txt style number files
+"""
+
+import csv
+import heapq
+import os
+import tempfile
+from array import array
+from contextlib import ExitStack
+from itertools import islice
+
+from .algorithms import _Progress, merge_sort
+from .keys import argsort, compact_keys, get_transform
+from .loaders import iter_number_chunks, parse_number
+from .records import _parses
+
+# CSV rows sorted in memory per run (~60 MB for generated_data.csv rows)
+DEFAULT_CHUNK_ROWS = 250000
+
+# Bytes of a number file parsed per run (a few million numbers)
+DEFAULT_CHUNK_BYTES = 1 << 24
+
+# Runs merged at once; with more runs, groups are pre-merged into longer runs
+MAX_OPEN_RUNS = 128
+
+# Items written (and numbers read back from a run) per block
+_BLOCK = 65536
+
+
+def _column_key(index, values, transform):
+    """
+    Key function for one CSV column.
+
+    The column is numeric when every value of the first chunk parses as a
+    number; otherwise the text (optionally transformed) is the key.
+    """
+    if values and all(_parses(float, value) for value in values):
+        return lambda row: parse_number(row[index])
+    if transform is None:
+        return lambda row: row[index]
+    return lambda row: transform(row[index])
+
+
+def _run_path(tmp_dir, number):
+    return os.path.join(tmp_dir, f"run{number:06d}")
+
+
+def _read_csv_run(stack, path):
+    return csv.reader(stack.enter_context(open(path, 'r', newline='', encoding='utf-8')))
+
+
+def _read_number_run(path, typecode):
+    """Yield the numbers of a binary run file, _BLOCK at a time"""
+    with open(path, 'rb') as f:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(f, _BLOCK)
+            except EOFError:
+                pass  # the last, partial block is still filled
+            if not block:
+                return
+            yield from block
+
+
+def _cascade(runs, tmp_dir, merge_group):
+    """
+    Pre-merge consecutive groups of runs until at most MAX_OPEN_RUNS remain.
+
+    Groups are consecutive so equal keys keep their input order.
+    """
+    number = len(runs)
+    while len(runs) > MAX_OPEN_RUNS:
+        merged = []
+        for start in range(0, len(runs), MAX_OPEN_RUNS):
+            group = runs[start:start + MAX_OPEN_RUNS]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            path = _run_path(tmp_dir, number)
+            number += 1
+            merged.append(merge_group(group, path))
+            for run in group:
+                os.remove(run[0])
+        runs = merged
+    return runs
+
+
+def external_sort_csv(input_path, output, column=None, kernel=merge_sort,
+                      reverse=False, transform=None, chunk_rows=DEFAULT_CHUNK_ROWS,
+                      tmp_dir=None, progress_callback=None, cancel_event=None,
+                      stats=None):
+    """
+    Sort a CSV table by one column without loading it into memory.
+
+    input_path: CSV file with a header row
+    output: path or writable text file for the sorted CSV (header included)
+    column: key column name (default: the first column)
+    kernel: engine kernel used to sort each chunk
+    chunk_rows: rows held in memory per sorted run
+    tmp_dir: where the runs are spilled (default: the system temp dir)
+
+    Returns the number of records written. If cancel_event is set, sorting
+    stops early and the output is incomplete. stats.passes is set to the
+    number of runs spilled.
+    """
+    if isinstance(transform, str):
+        transform = get_transform(transform)
+    progress = _Progress(progress_callback) if progress_callback else None
+    size = os.path.getsize(input_path) or 1
+
+    with tempfile.TemporaryDirectory(prefix="extsort-", dir=tmp_dir) as work_dir, \
+            open(input_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        if column is None and header:
+            column = header[0]
+        if column not in header:
+            raise ValueError(f"Unknown column: {column!r}. Available: {', '.join(header)}")
+        index = header.index(column)
+
+        # Phase 1: sorted runs of at most chunk_rows rows
+        key = None
+        runs = []
+        total = 0
+        while not (cancel_event is not None and cancel_event.is_set()):
+            chunk = list(islice(reader, chunk_rows))
+            if not chunk:
+                break
+            # A chunk of only blank lines is skipped, not taken for the end
+            rows = [row for row in chunk if row]
+            if not rows:
+                continue
+            if key is None:
+                key = _column_key(index, [row[index] for row in rows], transform)
+            try:
+                keys = compact_keys([key(row) for row in rows])
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"Bad value in column {column!r} near row {total + 1}: {e}") from e
+            order = argsort(keys, kernel, reverse)
+            path = _run_path(work_dir, len(runs))
+            with open(path, 'w', newline='', encoding='utf-8') as run:
+                csv.writer(run, lineterminator="\n").writerows(rows[i] for i in order)
+            runs.append((path, len(rows)))
+            total += len(rows)
+            if progress:
+                progress.report(min(f.buffer.tell() / size, 1) * 50)
+        spilled = len(runs)
+        rows = keys = order = None  # free the last chunk before merging
+
+        def merge_group(group, path):
+            with ExitStack() as stack, open(path, 'w', newline='', encoding='utf-8') as out:
+                readers = [_read_csv_run(stack, run_path) for run_path, _ in group]
+                csv.writer(out, lineterminator="\n").writerows(
+                    heapq.merge(*readers, key=key, reverse=reverse))
+            return (path, sum(count for _, count in group))
+
+        runs = _cascade(runs, work_dir, merge_group)
+
+        # Phase 2: k-way merge of the runs into the output
+        written = 0
+        with ExitStack() as stack:
+            out = output if hasattr(output, 'write') else \
+                stack.enter_context(open(output, 'w', newline='', encoding='utf-8'))
+            writer = csv.writer(out, lineterminator="\n")
+            writer.writerow(header)
+            readers = [_read_csv_run(stack, path) for path, _ in runs]
+            merged = heapq.merge(*readers, key=key, reverse=reverse)
+            while not (cancel_event is not None and cancel_event.is_set()):
+                block = list(islice(merged, _BLOCK))
+                if not block:
+                    break
+                writer.writerows(block)
+                written += len(block)
+                if progress:
+                    progress.report(50 + written / total * 50)
+
+    if stats is not None:
+        stats.passes = spilled
+    if progress:
+        progress.done()
+    return written
+
+
+def external_sort_numbers(input_path, output, kernel=merge_sort, reverse=False,
+                          chunk_bytes=DEFAULT_CHUNK_BYTES, tmp_dir=None,
+                          progress_callback=None, cancel_event=None, stats=None):
+    """
+    Sort a dataset.txt style number file without loading it into memory.
+
+    Chunks are parsed from the memory-mapped file into typed arrays, sorted
+    with kernel and spilled as binary runs; the merged numbers are written
+    one per line to output (a path or writable text file).
+
+    Returns the number of values written (see external_sort_csv).
+    """
+    progress = _Progress(progress_callback) if progress_callback else None
+    size = os.path.getsize(input_path) or 1
+
+    with tempfile.TemporaryDirectory(prefix="extsort-", dir=tmp_dir) as work_dir:
+        runs = []
+        total = 0
+        read = 0
+        for chunk in iter_number_chunks(input_path, chunk_bytes):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if type(chunk) is not array:
+                raise ValueError(f"{input_path}: ints beyond 64 bits cannot be sorted "
+                                 "externally; sort the file in memory instead")
+            path = _run_path(work_dir, len(runs))
+            with open(path, 'wb') as run:
+                array(chunk.typecode, kernel(chunk, reverse=reverse)).tofile(run)
+            runs.append((path, chunk.typecode))
+            total += len(chunk)
+            read += chunk_bytes
+            if progress:
+                progress.report(min(read / size, 1) * 50)
+        spilled = len(runs)
+
+        def merge_group(group, path):
+            typecode = 'q' if all(code == 'q' for _, code in group) else 'd'
+            merged = heapq.merge(*(_read_number_run(run_path, code) for run_path, code in group),
+                                 reverse=reverse)
+            with open(path, 'wb') as out:
+                while True:
+                    block = array(typecode, islice(merged, _BLOCK))
+                    if not block:
+                        break
+                    block.tofile(out)
+            return (path, typecode)
+
+        runs = _cascade(runs, work_dir, merge_group)
+
+        written = 0
+        with ExitStack() as stack:
+            out = output if hasattr(output, 'write') else \
+                stack.enter_context(open(output, 'w'))
+            merged = heapq.merge(*(_read_number_run(path, code) for path, code in runs),
+                                 reverse=reverse)
+            while not (cancel_event is not None and cancel_event.is_set()):
+                block = list(islice(merged, _BLOCK))
+                if not block:
+                    break
+                out.write("\n".join(map(str, block)))
+                out.write("\n")
+                written += len(block)
+                if progress:
+                    progress.report(50 + written / total * 50)
+
+    if stats is not None:
+        stats.passes = spilled
+    if progress:
+        progress.done()
+    return written
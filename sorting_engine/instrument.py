@@ -0,0 +1,170 @@
+"""
+Instrumented variants of the sorting kernels
+
+The registered kernels are the fast ones: they only fill the SortStats
+counters that cost nothing per element, so their timings are honest.
+instrumented(kernel) returns a variant with exactly the same signature that
+also counts comparisons, swaps/moves and the peak memory allocated
+(tracemalloc). Time one, count with the other:
+
+    result = merge_sort(data)                      # timed
+    stats = SortStats()
+    instrumented(merge_sort)(data, stats=stats)    # counted
+
+- comparison kernels are counted by wrapping every key in an object whose
+  <, <=, >, >= increment a counter
+- kernels that never compare keys (counting, radix, NumPy, parallel, Auto)
+  only get the memory measurement, since their keys must stay plain values
+  (worker processes are not traced)
+- register_instrumented(kernel, variant) plugs in a dedicated variant
+"""
+
+import tracemalloc
+from itertools import count
+
+from .algorithms import SortStats, bubble_sort
+
+
+class _Counted:
+    """A key whose ordering comparisons are counted"""
+
+    __slots__ = ("key", "index", "tick")
+
+    def __init__(self, key, index, tick):
+        self.key = key
+        self.index = index
+        self.tick = tick
+
+    def __lt__(self, other):
+        next(self.tick)
+        return self.key < other.key
+
+    def __le__(self, other):
+        next(self.tick)
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        next(self.tick)
+        return self.key > other.key
+
+    def __ge__(self, other):
+        next(self.tick)
+        return self.key >= other.key
+
+
+def _traced(run):
+    """Call run() and return (result, peak bytes allocated while it ran)"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        result = run()
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        if started:
+            tracemalloc.stop()
+    return result, peak
+
+
+def counting_comparisons(kernel):
+    """Instrumented variant of a comparison kernel (counts every key comparison)"""
+    def variant(arr, key=None, reverse=False, progress_callback=None,
+                cancel_event=None, stats=None):
+        if stats is None:
+            stats = SortStats()
+        items = arr if isinstance(arr, list) else list(arr)
+        tick = count()
+        wrapped = [_Counted(key(item) if key is not None else item, i, tick)
+                   for i, item in enumerate(items)]
+        result, stats.peak_memory = _traced(lambda: kernel(
+            wrapped, None, reverse, progress_callback, cancel_event, stats))
+        stats.comparisons = next(tick)
+        return [items[entry.index] for entry in result]
+
+    variant.__name__ = f"instrumented_{kernel.__name__}"
+    variant.__doc__ = kernel.__doc__
+    return variant
+
+
+def measuring_memory(kernel):
+    """Instrumented variant that adds the peak memory to the kernel's own counters"""
+    def variant(arr, key=None, reverse=False, progress_callback=None,
+                cancel_event=None, stats=None):
+        if stats is None:
+            stats = SortStats()
+        result, stats.peak_memory = _traced(lambda: kernel(
+            arr, key, reverse, progress_callback, cancel_event, stats))
+        return result
+
+    variant.__name__ = f"instrumented_{kernel.__name__}"
+    variant.__doc__ = kernel.__doc__
+    return variant
+
+
+def count_inversions(values, reverse=False):
+    """
+    Pairs i < j with values[i] > values[j] (values[i] < values[j] if reverse).
+
+    Every bubble sort swap fixes exactly one such pair, so this is its swap
+    count, found by a bottom-up merge in O(n log n).
+    """
+    data = list(values)
+    n = len(data)
+    inversions = 0
+    width = 1
+    while width < n:
+        merged = []
+        for left in range(0, n, 2 * width):
+            a = data[left:left + width]
+            b = data[left + width:left + 2 * width]
+            i = j = 0
+            while i < len(a) and j < len(b):
+                if (b[j] > a[i]) if reverse else (b[j] < a[i]):
+                    merged.append(b[j])
+                    j += 1
+                    inversions += len(a) - i
+                else:
+                    merged.append(a[i])
+                    i += 1
+            merged += a[i:]
+            merged += b[j:]
+        data = merged
+        width *= 2
+    return inversions
+
+
+def _instrumented_bubble_sort(arr, key=None, reverse=False, progress_callback=None,
+                              cancel_event=None, stats=None):
+    """Bubble sort with comparisons (per pass), swaps (inversions removed) and memory"""
+    if stats is None:
+        stats = SortStats()
+    items = arr if isinstance(arr, list) else list(arr)
+    keys = [key(item) for item in items] if key is not None else items
+    before = count_inversions(keys, reverse)
+    result, stats.peak_memory = _traced(lambda: bubble_sort(
+        items, key, reverse, progress_callback, cancel_event, stats))
+    after = 0
+    if cancel_event is not None and cancel_event.is_set():
+        after = count_inversions([key(item) for item in result] if key is not None else result,
+                                 reverse)
+    stats.swaps = before - after
+    return result
+
+
+INSTRUMENTED = {
+    bubble_sort: _instrumented_bubble_sort,
+}
+
+
+def register_instrumented(kernel, variant):
+    """Use variant (same signature as kernel) when kernel is instrumented"""
+    INSTRUMENTED[kernel] = variant
+
+
+def instrumented(kernel):
+    """The instrumented variant of a kernel (comparison counting by default)"""
+    if kernel not in INSTRUMENTED:
+        INSTRUMENTED[kernel] = counting_comparisons(kernel)
+    return INSTRUMENTED[kernel]
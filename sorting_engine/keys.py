@@ -0,0 +1,205 @@
+"""
+Sort key extraction (decorate-sort-undecorate for records)
+
+Instead of looking up a column and lower-casing both sides on every
+comparison, each record's key is computed exactly once into a compact key
+array. The kernels then sort row indices by that array (plain int/str/tuple
+comparisons) and the records are permuted in a single final pass.
+"""
+
+import locale
+from array import array
+
+from .algorithms import merge_sort
+from .numpy_backend import NUMPY_AVAILABLE, np
+
+# Text transforms applied once per key
+KEY_TRANSFORMS = {
+    "none": None,
+    "casefold": str.casefold,
+    "lower": str.lower,
+    "collate": locale.strxfrm,  # uses the current LC_COLLATE locale
+}
+
+
+def get_transform(name):
+    """Look up a text key transform by name (none, casefold, lower, collate)"""
+    try:
+        return KEY_TRANSFORMS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown key transform: {name!r}. Choose from: {', '.join(KEY_TRANSFORMS)}"
+        ) from None
+
+
+def compact_keys(values):
+    """Store int keys in a typed array('q'); other keys stay in a list"""
+    if values and all(type(value) is int for value in values):
+        try:
+            return array('q', values)
+        except OverflowError:
+            pass
+    return values
+
+
+def extract_keys(records, column, transform=None):
+    """
+    Compute the sort key of every record once.
+
+    records: sequence of mappings (e.g. csv.DictReader rows) or sequences
+    column: dictionary key or index of the key field
+    transform: optional function (or KEY_TRANSFORMS name) applied to text keys
+    """
+    if isinstance(transform, str):
+        transform = get_transform(transform)
+    values = [record[column] for record in records]
+    if transform is not None and values and isinstance(values[0], str):
+        values = [transform(value) for value in values]
+    return compact_keys(values)
+
+
+def parse_keys(values, transform=None):
+    """
+    Build keys from raw text values (e.g. a CSV column).
+
+    The column is numeric when every value parses as an int (or float);
+    otherwise the text is kept, optionally transformed.
+    """
+    if isinstance(transform, str):
+        transform = get_transform(transform)
+    for convert in (int, float):
+        try:
+            return compact_keys([convert(value) for value in values])
+        except ValueError:
+            continue
+    if transform is not None:
+        return [transform(value) for value in values]
+    return list(values)
+
+
+def parse_sort_spec(text, descending=False):
+    """
+    Parse a multi-column ordering like "LastName,FirstName,ID:desc".
+
+    Each comma-separated column may end in :asc or :desc; columns without
+    a suffix use the given default direction. Returns [(column, descending)].
+    """
+    columns = []
+    for part in text.split(","):
+        name, _, direction = part.strip().partition(":")
+        direction = direction.strip().lower()
+        if not name or direction not in ("", "asc", "desc"):
+            raise ValueError(f"Bad sort column: {part.strip()!r} (use NAME, NAME:asc or NAME:desc)")
+        columns.append((name.strip(), direction == "desc" if direction else descending))
+    return columns
+
+
+def rank_values(values):
+    """
+    Map values to non-negative int ranks that sort the same way.
+
+    Ints are offset by their minimum (no sorting needed; an array('q') of
+    non-negative ints is used as-is); other values get dense ranks from one
+    sort of the distinct values. Returns (ranks, limit) where every rank is
+    below limit.
+    """
+    if not values:
+        return array('q'), 1
+    typed = type(values) is array and values.typecode == 'q'
+    if typed or all(type(value) is int for value in values):
+        lo = min(values)
+        if typed and lo >= 0:
+            return values, max(values) + 1
+        return compact_keys([value - lo for value in values]), max(values) - lo + 1
+    distinct = merge_sort(set(values))
+    index = {value: rank for rank, value in enumerate(distinct)}
+    return array('q', map(index.__getitem__, values)), len(distinct)
+
+
+def pack_keys(columns):
+    """
+    Encode a multi-column ordering into one int key per row.
+
+    columns: [(ranks, limit, descending), ...], most significant first,
+    where ranks are ints in range(limit). Descending columns are inverted
+    (limit - 1 - rank) and every column gets just enough bits for its
+    limit, so comparing the packed ints compares the columns in order.
+    Keys up to 63 bits are stored in an array('q') (and packed with NumPy
+    when it is installed).
+    """
+    columns = list(columns)
+    widths = [(limit - 1).bit_length() for _, limit, _ in columns]
+    if NUMPY_AVAILABLE and columns and sum(widths) <= 63:
+        packed = None
+        for (ranks, limit, descending), bits in zip(columns, widths):
+            values = np.asarray(ranks, dtype=np.int64)
+            if descending:
+                values = (limit - 1) - values
+            packed = values if packed is None else (packed << bits) | values
+        keys = array('q')
+        keys.frombytes(packed.tobytes())
+        return keys
+
+    keys = None
+    for ranks, limit, descending in columns:
+        top = limit - 1
+        if keys is None:
+            keys = [top - rank for rank in ranks] if descending else ranks
+            continue
+        bits = top.bit_length()
+        if descending:
+            keys = [(key << bits) | (top - rank) for key, rank in zip(keys, ranks)]
+        else:
+            keys = [(key << bits) | rank for key, rank in zip(keys, ranks)]
+    if keys is None:
+        return array('q')
+    try:
+        return array('q', keys)
+    except OverflowError:
+        return list(keys)
+
+
+def composite_keys(records, columns, transform=None):
+    """
+    One packed int key per record for a multi-column ordering.
+
+    columns: [(column, descending), ...], e.g.
+    [("LastName", False), ("FirstName", False), ("ID", True)]
+    transform: optional function (or KEY_TRANSFORMS name) for text columns
+    """
+    return pack_keys(rank_values(extract_keys(records, column, transform)) + (descending,)
+                     for column, descending in columns)
+
+
+def argsort(keys, kernel, reverse=False, progress_callback=None,
+            cancel_event=None, stats=None):
+    """
+    Return the row order that sorts keys, using any engine kernel.
+
+    The kernel only ever compares keys (with the row index as a stable
+    tie-breaker), never the records themselves.
+    """
+    return kernel(range(len(keys)), key=keys.__getitem__, reverse=reverse,
+                  progress_callback=progress_callback,
+                  cancel_event=cancel_event, stats=stats)
+
+
+def permute(records, order):
+    """Return records rearranged into the given row order"""
+    return [records[i] for i in order]
+
+
+def sort_records(records, column, kernel, reverse=False, transform=None,
+                 progress_callback=None, cancel_event=None, stats=None):
+    """
+    Extract keys once, sort the key array, then permute the records.
+
+    column may also be a list of (column, descending) pairs; the columns
+    are then packed into one key (see composite_keys).
+    """
+    if isinstance(column, list):
+        keys = composite_keys(records, column, transform)
+    else:
+        keys = extract_keys(records, column, transform)
+    order = argsort(keys, kernel, reverse, progress_callback, cancel_event, stats)
+    return permute(records, order)
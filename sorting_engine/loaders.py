@@ -0,0 +1,258 @@
+"""
+Input file loaders for the sorting engine
+Supports: .txt (dataset.txt style numbers), .csv (generated_data.csv style
+tables with a header row), .xlsx (requires openpyxl)
+
+Tables (files with a header row) are returned as a columnar RecordStore;
+plain number files are returned as a list of numbers, or as a typed array
+by load_numbers_mmap.
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+
+from .records import RecordStore, parse_number
+
+# Try to import openpyxl for Excel support
+try:
+    import openpyxl
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+
+_SEPARATORS = re.compile(r'[,\s;]+')
+
+
+def load_numbers(filepath):
+    """Load numbers separated by commas, whitespace, semicolons or newlines"""
+    data = []
+    append = data.append
+    with open(filepath, 'r') as f:
+        for line in f:
+            for token in _SEPARATORS.split(line):
+                if token:
+                    try:
+                        append(parse_number(token.strip('[](){}')))
+                    except ValueError:
+                        continue
+    return data
+
+
+# Bytes of the mapped file parsed per chunk by load_numbers_mmap
+_MMAP_CHUNK = 1 << 22
+
+# Delimiters and brackets become spaces so bytes.split() tokenizes in C
+_DELIMITERS = bytes.maketrans(b',;[](){}', b'        ')
+
+# Binary cache kept next to the source: <file>.numcache
+_CACHE_SUFFIX = '.numcache'
+_CACHE_MAGIC = b'SENC'
+# magic, typecode, little-endian flag, source size, source mtime_ns, count
+_CACHE_HEADER = struct.Struct('<4sc?xqqq')
+
+_TOKEN_PARSERS = {'q': int, 'd': float}
+
+# Ints that fit array('q'); larger ones are kept exact in a plain list
+_INT64 = range(-2 ** 63, 2 ** 63)
+
+
+def load_numbers_mmap(filepath, cache=False):
+    """
+    Load a dataset.txt style number file into a typed array.
+
+    The file is memory-mapped and parsed chunk by chunk straight from bytes
+    (int() and float() accept bytes), so neither a decoded copy of the file
+    nor one string per line is built. Returns array('q') while every number
+    is an int and array('d') once a float appears. An int beyond int64
+    would be rounded in array('d'), so once one appears the numbers are
+    returned as a plain list instead. Tokens that are not numbers are
+    skipped, like load_numbers.
+
+    cache: keep a binary copy of the parsed array next to the source
+    (<file>.numcache). It is reused while the source size and mtime match,
+    so a reload is a single read.
+    """
+    st = os.stat(filepath)
+    cache_path = filepath + _CACHE_SUFFIX
+    if cache:
+        data = _read_cache(cache_path, st)
+        if data is not None:
+            return data
+
+    data = array('q')
+    for chunk in iter_number_chunks(filepath):
+        if type(data) is array and type(chunk) is not array:
+            data = list(data)
+        elif type(data) is array and chunk.typecode != data.typecode:
+            if data.typecode == 'q':
+                data = array('d', data)
+            else:
+                chunk = array('d', chunk)
+        data.extend(chunk)
+
+    if cache and type(data) is array:
+        _write_cache(cache_path, st, data)
+    return data
+
+
+def iter_number_chunks(filepath, chunk_bytes=_MMAP_CHUNK):
+    """
+    Parse a memory-mapped number file chunk_bytes at a time.
+
+    Yields one typed array (or list, see load_numbers_mmap) per chunk, so a
+    file of any size can be processed with bounded memory.
+    """
+    if not os.path.getsize(filepath):
+        return
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        size = len(mapped)
+        carry = b''
+        for start in range(0, size, chunk_bytes):
+            end = start + chunk_bytes
+            chunk = (carry + mapped[start:end]).translate(_DELIMITERS)
+            tokens = chunk.split()
+            # A number cut at the chunk boundary is finished by the next chunk
+            carry = tokens.pop() if end < size and tokens and not chunk[-1:].isspace() else b''
+            numbers = _extend_numbers(array('q'), tokens)
+            if numbers:
+                yield numbers
+        if carry:
+            numbers = _extend_numbers(array('q'), [carry])
+            if numbers:
+                yield numbers
+
+
+def _extend_numbers(data, tokens):
+    """
+    Append number tokens to a typed array, widening 'q' to 'd' for a float
+    and to a plain list for an int beyond int64 (see load_numbers_mmap)
+    """
+    before = len(data)
+    try:
+        data.extend(map(_TOKEN_PARSERS[data.typecode], tokens))
+        return data
+    except (ValueError, OverflowError):
+        # A float, an oversized int or a non-number: go token by token
+        del data[before:]
+    for token in tokens:
+        try:
+            value = int(token)
+        except ValueError:
+            try:
+                value = float(token)
+            except ValueError:
+                continue
+        if type(data) is array:
+            if type(value) is int and value not in _INT64:
+                data = list(data)
+            elif type(value) is float and data.typecode == 'q':
+                data = array('d', data)
+        data.append(value)
+    return data
+
+
+def _read_cache(cache_path, st):
+    """Cached array for the source described by st, or None if missing/stale"""
+    try:
+        with open(cache_path, 'rb') as f:
+            magic, typecode, little, size, mtime, count = \
+                _CACHE_HEADER.unpack(f.read(_CACHE_HEADER.size))
+            if magic != _CACHE_MAGIC or little != (sys.byteorder == 'little') \
+                    or size != st.st_size or mtime != st.st_mtime_ns:
+                return None
+            data = array(typecode.decode('ascii'))
+            data.fromfile(f, count)
+            return data
+    except (OSError, EOFError, ValueError, struct.error):
+        return None
+
+
+def _write_cache(cache_path, st, data):
+    """Write the binary cache atomically; failures (read-only dir) are ignored"""
+    tmp_path = cache_path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_CACHE_HEADER.pack(_CACHE_MAGIC, data.typecode.encode('ascii'),
+                                       sys.byteorder == 'little', st.st_size,
+                                       st.st_mtime_ns, len(data)))
+            data.tofile(f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_csv(filepath):
+    """Load a CSV table with a header row into a RecordStore"""
+    return RecordStore.from_csv(filepath)
+
+
+def load_excel(filepath):
+    """
+    Load the active sheet of an .xlsx workbook.
+
+    If the first row contains only text it is treated as a header and the
+    sheet is returned as a RecordStore. Otherwise every numeric cell is
+    collected into a plain number list (like ModernSortingApp.load_excel_file).
+    """
+    if not OPENPYXL_AVAILABLE:
+        raise RuntimeError(
+            "Please install openpyxl to read .xlsx files:\npip install openpyxl"
+        )
+
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        first = next(rows, None)
+        if first is None:
+            return []
+
+        if all(isinstance(value, str) for value in first if value is not None):
+            header = [str(value) for value in first]
+            return RecordStore.from_rows(header, (
+                ["" if value is None else str(value) for value in row]
+                for row in rows
+            ))
+
+        data = []
+        _collect_numbers(first, data)
+        for row in rows:
+            _collect_numbers(row, data)
+        return data
+    finally:
+        wb.close()
+
+
+def _collect_numbers(row, data):
+    """Append the numeric cells of one sheet row to data"""
+    for value in row:
+        if value is None or isinstance(value, bool):
+            continue
+        try:
+            num = float(value)
+        except (ValueError, TypeError):
+            continue
+        data.append(int(num) if num == int(num) else num)
+
+
+def load_input(filepath, cache=False):
+    """
+    Load any supported input file based on its extension.
+
+    Returns a RecordStore for tables, a list of numbers for .xlsx sheets or
+    a typed array for number files (cache: see load_numbers_mmap).
+    """
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext == '.csv':
+        return load_csv(filepath)
+    if ext == '.xlsx':
+        return load_excel(filepath)
+    return load_numbers_mmap(filepath, cache)
@@ -0,0 +1,115 @@
+"""
+Optional NumPy sort backend for numeric data
+
+Keeps values in a typed ndarray (int64 or float64) and sorts them with
+NumPy's vectorized sorts. When NumPy is not installed, or the data does not
+fit a numeric/text dtype, everything falls back to the pure Python
+merge sort so callers never need to check.
+"""
+
+from .algorithms import merge_sort, register_algorithm
+from .instrument import measuring_memory, register_instrumented
+
+# Try to import numpy for vectorized sorting
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# dtype kinds handled natively: signed/unsigned ints, floats, unicode text
+_SUPPORTED_KINDS = "iufU"
+
+
+def to_array(values):
+    """
+    Convert a sequence of numbers to a typed ndarray.
+
+    Returns None when NumPy is missing or the values need an object array
+    (e.g. ints wider than 64 bits or mixed types).
+    """
+    if not NUMPY_AVAILABLE:
+        return None
+    if isinstance(values, np.ndarray):
+        array = values
+    else:
+        try:
+            array = np.asarray(values)
+        except (ValueError, OverflowError):
+            return None
+    if array.ndim != 1 or array.dtype.kind not in _SUPPORTED_KINDS:
+        return None
+    return array
+
+
+def sort_array(array, reverse=False, stable=False):
+    """
+    Sort a 1-D ndarray and return the result as an ndarray.
+
+    Descending order is returned as a reversed view of the ascending result,
+    so it costs no extra copy. Plain values are indistinguishable when equal,
+    so stability only matters for argsort_array.
+    """
+    result = np.sort(array, kind="stable" if stable else None)
+    return result[::-1] if reverse else result
+
+
+def argsort_array(keys, reverse=False):
+    """
+    Stable argsort of a 1-D key array.
+
+    For descending order the keys are read through a reversed view and the
+    indices mapped back, which keeps equal keys in input order without
+    negating (and copying) the keys.
+    """
+    if not reverse:
+        return np.argsort(keys, kind="stable")
+    n = len(keys)
+    return (n - 1) - np.argsort(keys[::-1], kind="stable")[::-1]
+
+
+def numpy_sort(arr, key=None, reverse=False, progress_callback=None,
+               cancel_event=None, stats=None):
+    """
+    NumPy Sort (vectorized)
+
+    Plain numbers are sorted with np.sort; records with a key function are
+    ordered by a stable argsort of their key array and then permuted.
+    Falls back to the pure Python merge sort when NumPy is unavailable.
+
+    Time Complexity: O(n log n) (runs in compiled code)
+    Space Complexity: O(n)
+    """
+    if key is None:
+        array = to_array(arr)
+        if array is None:
+            return merge_sort(arr, None, reverse, progress_callback, cancel_event, stats)
+        if array.dtype.kind == "f" and array is not arr:
+            # Mixed int/float input: permute the original objects so ints stay ints
+            items = arr if isinstance(arr, list) else list(arr)
+            result = [items[i] for i in argsort_array(array, reverse).tolist()]
+        else:
+            result = sort_array(array, reverse).tolist()
+    else:
+        items = arr if isinstance(arr, list) else list(arr)
+        keys = to_array([key(item) for item in items])
+        if keys is None:
+            return merge_sort(items, key, reverse, progress_callback, cancel_event, stats)
+        result = [items[i] for i in argsort_array(keys, reverse).tolist()]
+
+    if stats is not None:
+        stats.passes = 1
+    if progress_callback:
+        progress_callback(100)
+    return result
+
+
+register_algorithm("NumPy Sort", numpy_sort, {
+    "best": "O(n log n)",
+    "average": "O(n log n)",
+    "worst": "O(n log n)",
+    "space": "O(n)",
+    "description": "Vectorized NumPy sort on a typed array. Falls back to Merge Sort without NumPy."
+})
+register_instrumented(numpy_sort, measuring_memory(numpy_sort))
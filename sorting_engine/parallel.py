@@ -0,0 +1,338 @@
+"""
+Parallel merge sort on a process pool
+
+Pure Python sorts are capped at one core by the GIL, even inside a
+threading.Thread. Here the data is copied once into a typed shared-memory
+buffer, every worker process sorts one contiguous partition in place with
+merge_sort, and the sorted partitions are combined by a parallel k-way
+merge: the parent picks splitter values from a sample, so each worker merges
+one independent value range straight into its slot of the output buffer.
+No large lists are pickled between processes.
+
+Only numeric data (or numeric keys) fits a typed buffer; anything else, and
+inputs below PARALLEL_THRESHOLD, is sorted by merge_sort in the calling
+process.
+"""
+
+import heapq
+import multiprocessing
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .algorithms import _Progress, merge_sort, register_algorithm
+from .instrument import measuring_memory, register_instrumented
+
+# shared_memory needs Python 3.8+; without it everything runs serially
+try:
+    from multiprocessing import shared_memory
+    SHARED_MEMORY_AVAILABLE = True
+except ImportError:
+    shared_memory = None
+    SHARED_MEMORY_AVAILABLE = False
+
+# Smaller inputs are not worth the process round trips
+PARALLEL_THRESHOLD = 50000
+
+# Samples taken per partition when choosing merge splitters
+_OVERSAMPLE = 32
+
+_default_workers = None
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def set_default_workers(workers):
+    """Worker processes used when a call does not pass workers (None = all cores)"""
+    global _default_workers
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    _default_workers = workers
+
+
+def default_workers():
+    """Number of worker processes used by default"""
+    return _default_workers or os.cpu_count() or 1
+
+
+def _get_executor(workers):
+    """Shared process pool, recreated only when the worker count changes"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            # spawn: safe to start from GUI apps with running threads
+            _executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _executor_workers = workers
+        return _executor
+
+
+def _typed(values):
+    """values as array('q') or array('d'), or None if they do not fit"""
+    for typecode in ('q', 'd'):
+        try:
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            continue
+    return None
+
+
+# ----- Shared buffers -----
+
+class _Buffer:
+    """A typed array in a shared memory block"""
+
+    def __init__(self, typecode, length, values=None):
+        itemsize = array(typecode).itemsize
+        self.shm = shared_memory.SharedMemory(create=True, size=length * itemsize)
+        if values is not None:
+            self.shm.buf[:length * itemsize] = memoryview(values).cast('B')
+        self.spec = (self.shm.name, typecode, length)
+
+    def tolist(self):
+        with _attach(self.spec) as view:
+            return view.tolist()
+
+    def release(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class _attach:
+    """Context manager giving a typed memoryview of a shared buffer spec"""
+
+    def __init__(self, spec):
+        self.name, self.typecode, self.length = spec
+        self.shm = None
+        self.view = None
+
+    def __enter__(self):
+        self.shm = shared_memory.SharedMemory(name=self.name)
+        itemsize = array(self.typecode).itemsize
+        self.view = self.shm.buf[:self.length * itemsize].cast(self.typecode)
+        return self.view
+
+    def __exit__(self, *exc):
+        self.view.release()
+        self.shm.close()
+
+
+class _KeyedView:
+    """Sequence of (key, index) pairs for a run of row indices"""
+
+    __slots__ = ("keys", "order")
+
+    def __init__(self, keys, order):
+        self.keys = keys
+        self.order = order
+
+    def __getitem__(self, pos):
+        i = self.order[pos]
+        return (self.keys[i], i)
+
+    def __len__(self):
+        return len(self.order)
+
+
+# ----- Worker tasks (module level so they can be pickled) -----
+
+def _sort_partition(values_spec, order_spec, lo, hi):
+    """
+    Sort partition [lo, hi) in place.
+
+    Plain values are sorted directly. With an order buffer, the row indices
+    lo..hi-1 are sorted by their keys (stable) and stored in the order buffer.
+    """
+    with _attach(values_spec) as values:
+        if order_spec is None:
+            values[lo:hi] = array(values_spec[1], merge_sort(values[lo:hi].tolist()))
+            return
+        with _attach(order_spec) as order:
+            order[lo:hi] = array('q', merge_sort(range(lo, hi), key=values.__getitem__))
+
+
+def _merge_range(values_spec, order_spec, out_spec, slices, offset):
+    """
+    k-way merge one value range from every partition into out[offset:].
+
+    slices: [(start, stop), ...] of each sorted partition that fall into this
+    worker's range. Keyed sorts merge (key, index) pairs so ties stay stable.
+    """
+    with _attach(values_spec) as values, _attach(out_spec) as out:
+        if order_spec is None:
+            runs = [values[start:stop].tolist() for start, stop in slices]
+            merged = list(heapq.merge(*runs))
+        else:
+            with _attach(order_spec) as order:
+                runs = [[(values[i], i) for i in order[start:stop].tolist()]
+                        for start, stop in slices]
+                merged = [i for _, i in heapq.merge(*runs)]
+        out[offset:offset + len(merged)] = array(out_spec[1], merged)
+
+
+# ----- Parent side -----
+
+def _splitters(runs, workers):
+    """workers - 1 splitter values sampled evenly from the sorted runs"""
+    sample = []
+    for run in runs:
+        length = len(run)
+        step = max(1, length // _OVERSAMPLE)
+        sample.extend(run[pos] for pos in range(step // 2, length, step))
+    sample = merge_sort(sample)
+    return [sample[len(sample) * j // workers] for j in range(1, workers)]
+
+
+def _run_tasks(executor, calls, progress, start, span, cancel_event):
+    """Submit calls, wait for them with progress; False if cancelled"""
+    futures = {executor.submit(*call) for call in calls}
+    done_count = 0
+    try:
+        while futures:
+            if cancel_event is not None and cancel_event.is_set():
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                return False
+            done, futures = wait(futures, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()  # re-raise worker errors
+            done_count += len(done)
+            if progress:
+                progress.report(start + done_count / len(calls) * span)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return True
+
+
+def parallel_merge_sort(arr, key=None, reverse=False, progress_callback=None,
+                        cancel_event=None, stats=None, workers=None):
+    """
+    Parallel Merge Sort (process pool + shared memory)
+
+    1. Copies the numbers (or numeric keys) into a shared typed buffer
+    2. Each worker merge-sorts one partition in place
+    3. Splitters sampled from the partitions give every worker one value
+       range to k-way merge straight into the shared output buffer
+
+    workers: number of processes (default: set_default_workers() or all cores)
+
+    Time Complexity: O(n log n / p) per core, plus O(n) copies
+    Space Complexity: O(n)
+    """
+    items = arr if isinstance(arr, list) else list(arr)
+    n = len(items)
+    workers = min(workers or default_workers(), max(1, n // 2))
+    if n < PARALLEL_THRESHOLD or workers < 2 or not SHARED_MEMORY_AVAILABLE:
+        return merge_sort(items, key, reverse, progress_callback, cancel_event, stats)
+
+    # Plain numbers sort as values; keyed or mixed int/float input sorts row
+    # indices by a numeric key buffer, so the original objects are kept
+    keyed = key is not None
+    if keyed:
+        values = _typed([key(item) for item in items])
+    else:
+        values = _typed(items)
+        keyed = values is not None and values.typecode == 'd' and \
+            not all(type(item) is float for item in items)
+    if values is None:
+        return merge_sort(items, key, reverse, progress_callback, cancel_event, stats)
+    if keyed and reverse:
+        # Negated keys + ascending index ties = stable descending order
+        try:
+            values = array(values.typecode, [-value for value in values])
+        except OverflowError:
+            return merge_sort(items, key, reverse, progress_callback, cancel_event, stats)
+
+    progress = _Progress(progress_callback) if progress_callback else None
+    bounds = [n * p // workers for p in range(workers + 1)]
+    out_typecode = 'q' if keyed else values.typecode
+    value_buffer = _Buffer(values.typecode, n, values)
+    order_buffer = _Buffer('q', n) if keyed else None
+    out_buffer = _Buffer(out_typecode, n)
+    del values
+    executor = _get_executor(workers)
+    try:
+        values_spec = value_buffer.spec
+        order_spec = order_buffer.spec if keyed else None
+
+        # Phase 1: sort the partitions
+        partitioned = _run_tasks(executor, [
+            (_sort_partition, values_spec, order_spec, bounds[p], bounds[p + 1])
+            for p in range(workers)
+        ], progress, 0, 60, cancel_event)
+
+        merged = False
+        if partitioned:
+            # Phase 2: split the value space and merge each range in parallel
+            with _attach(values_spec) as view:
+                if keyed:
+                    with _attach(order_spec) as order:
+                        cuts = _cut_runs([_KeyedView(view, order[bounds[p]:bounds[p + 1]])
+                                          for p in range(workers)], bounds, workers)
+                else:
+                    runs = [view[bounds[p]:bounds[p + 1]] for p in range(workers)]
+                    cuts = _cut_runs(runs, bounds, workers)
+                    for run in runs:
+                        run.release()
+
+            calls = []
+            offset = 0
+            for j in range(workers):
+                slices = [(cuts[p][j], cuts[p][j + 1]) for p in range(workers)]
+                calls.append((_merge_range, values_spec, order_spec,
+                              out_buffer.spec, slices, offset))
+                offset += sum(stop - start for start, stop in slices)
+            merged = _run_tasks(executor, calls, progress, 60, 40, cancel_event)
+
+        # Cancelled: return the partitions sorted but not merged (or untouched)
+        if merged:
+            result = out_buffer.tolist()
+        elif not keyed:
+            result = value_buffer.tolist()
+        elif partitioned:
+            result = order_buffer.tolist()
+        else:
+            result = range(n)
+    finally:
+        value_buffer.release()
+        out_buffer.release()
+        if order_buffer is not None:
+            order_buffer.release()
+
+    if keyed:
+        result = [items[i] for i in result]
+    elif reverse:
+        result.reverse()
+    if stats is not None:
+        stats.passes = workers
+    if progress:
+        progress.done()
+    return result
+
+
+def _cut_runs(runs, bounds, workers):
+    """Absolute cut positions of every splitter in every sorted run"""
+    splitters = _splitters(runs, workers)
+    cuts = []
+    for p, run in enumerate(runs):
+        base = bounds[p]
+        cuts.append([base] + [base + bisect_left(run, s) for s in splitters] + [bounds[p + 1]])
+    return cuts
+
+
+register_algorithm("Parallel Merge Sort", parallel_merge_sort, {
+    "best": "O(n log n)",
+    "average": "O(n log n)",
+    "worst": "O(n log n)",
+    "space": "O(n)",
+    "description": "Merge sort split across CPU cores with shared-memory buffers. Numeric data only."
+})
+register_instrumented(parallel_merge_sort, measuring_memory(parallel_merge_sort))
@@ -0,0 +1,195 @@
+"""
+Opt-in profiling of a single sort run
+
+profile_run() wraps any call (a kernel, RecordStore.argsort, a front-end's
+sort method) with:
+
+- cProfile: call counts and self/cumulative time per function
+- a sampling profiler: a thread that records the call stack of the
+  profiled thread every SAMPLE_INTERVAL seconds, exported as collapsed
+  stacks ("outer;inner;leaf count" lines) for flamegraph.pl, speedscope or
+  inferno
+- tracemalloc (opt-in): peak memory allocated during the call, measured
+  in a second call because tracing every allocation slows pure Python
+  sorts 10-30x and would skew the time profile toward allocating functions
+
+Profiling slows the run down (cProfile hooks every call), so a profiled
+time is only useful to compare functions within one report, never against
+a normal timing.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+from .instrument import _traced
+
+# Seconds between stack samples
+SAMPLE_INTERVAL = 0.005
+
+# Functions listed in the hottest-functions summary
+TOP_FUNCTIONS = 15
+
+
+def _label(filename, line, name):
+    """Frame name used in summaries and collapsed stacks"""
+    if filename == "~":  # built-in function (cProfile)
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class _Sampler(threading.Thread):
+    """Counts the call stacks of one thread, sampled every interval seconds"""
+
+    def __init__(self, thread_id, root_code, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.root_code = root_code  # frames from here up are not recorded
+        self.interval = interval
+        self.stacks = Counter()
+        self.finished = threading.Event()
+
+    def run(self):
+        while not self.finished.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame.f_code is not self.root_code:
+                code = frame.f_code
+                stack.append(_label(code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            # Only samples taken inside the profiled call count
+            if frame is not None and stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self.finished.set()
+        self.join()
+
+
+class ProfileReport:
+    """What profile_run measured: time, peak memory, cProfile stats and stack samples"""
+
+    def __init__(self, elapsed, peak_memory, stats=None, stacks=None,
+                 interval=SAMPLE_INTERVAL):
+        self.elapsed = elapsed
+        self.peak_memory = peak_memory  # bytes, or None when not measured
+        self.stats = stats  # pstats.Stats, or None without cProfile
+        self.stacks = stacks if stacks is not None else Counter()
+        self.interval = interval
+
+    def hottest(self, limit=TOP_FUNCTIONS):
+        """
+        The functions with the most self time, as dicts with function,
+        calls, self_seconds and cumulative_seconds.
+
+        Uses cProfile when it ran, else the stack samples (calls is then
+        None and the times are samples × interval).
+        """
+        rows = []
+        if self.stats is not None:
+            for (filename, line, name), (_, calls, self_time, cumulative, _) in self.stats.stats.items():
+                if "_lsprof.Profiler" in name:  # profiler.disable() itself
+                    continue
+                rows.append({"function": _label(filename, line, name), "calls": calls,
+                             "self_seconds": self_time, "cumulative_seconds": cumulative})
+        else:
+            leaf = Counter()
+            total = Counter()
+            for stack, samples in self.stacks.items():
+                frames = stack.split(";")
+                leaf[frames[-1]] += samples
+                for frame in set(frames):
+                    total[frame] += samples
+            for function, samples in total.items():
+                rows.append({"function": function, "calls": None,
+                             "self_seconds": leaf[function] * self.interval,
+                             "cumulative_seconds": samples * self.interval})
+        rows.sort(key=lambda row: row["self_seconds"], reverse=True)
+        return rows[:limit]
+
+    def summary(self, limit=TOP_FUNCTIONS):
+        """Plain-text report: totals, then the hottest functions"""
+        samples = sum(self.stacks.values())
+        memory = "not measured" if self.peak_memory is None else \
+            f"{self.peak_memory / 1024 / 1024:.2f} MB"
+        lines = [
+            f"Elapsed (profiled): {self.elapsed:.4f} s",
+            f"Peak memory: {memory}",
+            f"Stack samples: {samples:,} (every {self.interval * 1000:g} ms)",
+            "",
+            f"{'self s':>10} {'cum s':>10} {'calls':>10}  function",
+        ]
+        for row in self.hottest(limit):
+            calls = "-" if row["calls"] is None else f"{row['calls']:,}"
+            lines.append(f"{row['self_seconds']:>10.4f} {row['cumulative_seconds']:>10.4f} "
+                         f"{calls:>10}  {row['function']}")
+        return "\n".join(lines)
+
+    def collapsed_stacks(self):
+        """Collapsed-stack text ("root;...;leaf count" per line) for flame graph tools"""
+        return "".join(f"{stack} {samples}\n" for stack, samples in sorted(self.stacks.items()))
+
+    def save(self, prefix):
+        """
+        Write prefix.txt (summary), prefix.collapsed (stack samples) and
+        prefix.prof (cProfile data for pstats/snakeviz), when available.
+        Returns the written paths.
+        """
+        paths = []
+        with open(prefix + ".txt", "w", encoding="utf-8") as f:
+            f.write(self.summary() + "\n")
+        paths.append(prefix + ".txt")
+        if self.stacks:
+            with open(prefix + ".collapsed", "w", encoding="utf-8") as f:
+                f.write(self.collapsed_stacks())
+            paths.append(prefix + ".collapsed")
+        if self.stats is not None:
+            self.stats.dump_stats(prefix + ".prof")
+            paths.append(prefix + ".prof")
+        return paths
+
+
+def profile_run(func, args=(), kwargs=None, cprofile=True, sample=True,
+                memory=False, interval=SAMPLE_INTERVAL):
+    """
+    Call func(*args, **kwargs) under the profilers.
+
+    cprofile / sample switch cProfile and the stack sampler on or off. With
+    memory, func is called a second time under tracemalloc for the peak
+    memory (several times slower than the first call), so it should not
+    depend on side effects of the first call.
+    Returns (result of the first call, ProfileReport).
+    """
+    kwargs = kwargs or {}
+    profiler = cProfile.Profile() if cprofile else None
+
+    def run():
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+    # Stacks are recorded below run(), i.e. starting at func
+    sampler = None
+    if sample:
+        sampler = _Sampler(threading.get_ident(), run.__code__, interval)
+        sampler.start()
+    start = time.perf_counter()
+    try:
+        result = run()
+    finally:
+        elapsed = time.perf_counter() - start
+        if sampler is not None:
+            sampler.stop()
+
+    peak_memory = _traced(lambda: func(*args, **kwargs))[1] if memory else None
+    stats = pstats.Stats(profiler) if profiler is not None else None
+    stacks = sampler.stacks if sampler is not None else None
+    return result, ProfileReport(elapsed, peak_memory, stats, stacks, interval)
@@ -0,0 +1,91 @@
+"""
+Lock-free progress channel between a sort and the UI
+
+Posting a Tk event (or redrawing) from every progress callback makes the
+UI work at the sort's pace and adds that work to the measured time. With
+a ProgressChannel the sort only writes its latest numbers into a small
+shared slot, and the UI reads the slot on its own timer (FRAME_MS).
+
+The slot is a multiprocessing RawArray guarded by a sequence counter (a
+single-writer seqlock): the writer makes the counter odd, writes the
+fields, then makes it even again; readers retry when the counter was odd
+or changed while they copied. No lock is ever taken, and the same channel
+works from a thread or from a child process it was passed to at start-up.
+"""
+
+from multiprocessing.sharedctypes import RawArray
+
+# UI poll interval in milliseconds (~30 frames per second)
+FRAME_MS = 33
+
+# Reader attempts before a torn snapshot is returned anyway (writer died)
+_READ_RETRIES = 100
+
+
+class ProgressChannel:
+    """
+    Shared progress slot: one writer, any number of polling readers.
+
+    The channel is itself a progress_callback: pass it to any kernel. When
+    stats (a SortStats) is given, its counters are published with every
+    percentage.
+    """
+
+    FIELDS = ("percent", "passes", "comparisons", "swaps")
+
+    def __init__(self, stats=None):
+        self.stats = stats
+        self._slot = RawArray('d', 1 + len(self.FIELDS))  # [sequence, *FIELDS]
+        self._seen = 0.0
+
+    def __call__(self, percent):
+        self.publish(percent)
+
+    def publish(self, percent):
+        """Writer side: store the latest percentage (and stats counters)"""
+        slot = self._slot
+        sequence = slot[0]
+        slot[0] = sequence + 1  # odd: write in progress
+        slot[1] = percent
+        stats = self.stats
+        if stats is not None:
+            slot[2] = stats.passes
+            slot[3] = stats.comparisons
+            slot[4] = stats.swaps
+        slot[0] = sequence + 2
+
+    def reset(self, stats=None):
+        """Zero the slot before reusing the channel for another sort"""
+        self.stats = stats
+        slot = self._slot
+        sequence = slot[0]
+        slot[0] = sequence + 1
+        for i in range(1, len(slot)):
+            slot[i] = 0.0
+        slot[0] = sequence + 2
+
+    def _snapshot(self):
+        slot = self._slot
+        for _ in range(_READ_RETRIES):
+            sequence = slot[0]
+            values = slot[1:]
+            if sequence % 2 == 0 and slot[0] == sequence:
+                break
+        return sequence, values
+
+    def _as_dict(self, values):
+        snapshot = {name: int(value) for name, value in zip(self.FIELDS, values)}
+        snapshot["percent"] = values[0]
+        return snapshot
+
+    def read(self):
+        """Consistent copy of the slot as a dict (counters as ints)"""
+        return self._as_dict(self._snapshot()[1])
+
+    def poll(self):
+        """read() if something was published since the last poll, else None"""
+        sequence, values = self._snapshot()
+        if sequence == self._seen:
+            return None
+        self._seen = sequence
+        return self._as_dict(values)
@@ -0,0 +1,200 @@
+"""
+Non-comparison sorts for integer keys: Counting Sort and LSD Radix Sort
+
+generate_random_data values (1..10000), dataset.txt numbers and the 7-digit
+IDs of generated_data.csv are all integers in a known range, so they can be
+placed by value instead of compared. Keys are shifted by their minimum
+first, which makes negative numbers work without a separate sign pass.
+
+- counting_sort: one counting pass plus one placement pass, for key ranges
+  up to a few times n
+- radix_sort: one stable bucket pass per byte of (key - min), least
+  significant byte first
+
+Both are stable in both directions and fall back to merge_sort when the
+keys are not all ints (text, floats, bools).
+"""
+
+from itertools import chain
+
+from .algorithms import _Progress, merge_sort, register_algorithm
+from .instrument import measuring_memory, register_instrumented
+
+# Bits per radix digit (one byte -> 256 buckets per pass)
+RADIX_BITS = 8
+
+# counting_sort hands key ranges above max(this, COUNTING_RANGE_FACTOR * n)
+# to radix_sort, so the count table stays small
+COUNTING_MIN_RANGE = 1 << 16
+COUNTING_RANGE_FACTOR = 8
+
+
+def int_range(keys):
+    """(min, max) of keys, or None unless every key is an int"""
+    if not keys or not all(type(k) is int for k in keys):
+        return None
+    return min(keys), max(keys)
+
+
+def _merge_sort_fallback(items, keys, keyed, reverse, progress_callback,
+                         cancel_event, stats):
+    """merge_sort for keys that are not all ints, reusing computed keys"""
+    if not keyed:
+        return merge_sort(items, None, reverse, progress_callback, cancel_event, stats)
+    order = merge_sort(range(len(keys)), keys.__getitem__, reverse,
+                       progress_callback, cancel_event, stats)
+    return [items[i] for i in order]
+
+
+def counting_sort(arr, key=None, reverse=False, progress_callback=None,
+                  cancel_event=None, stats=None):
+    """
+    Counting Sort
+
+    1. Counts how often each key occurs in a table indexed by key - min
+    2. Plain ints are rebuilt from the counts; with a key function, prefix
+       sums give each key its output slot and items are placed in input
+       order (stable)
+
+    Key ranges wider than max(65536, 8n) are sorted with radix_sort.
+
+    Time Complexity: O(n + k) (k = max - min + 1)
+    Space Complexity: O(n + k)
+    """
+    items = arr if isinstance(arr, list) else list(arr)
+    keyed = key is not None
+    keys = [key(item) for item in items] if keyed else items
+    bounds = int_range(keys)
+    if bounds is None:
+        return _merge_sort_fallback(items, keys, keyed, reverse,
+                                    progress_callback, cancel_event, stats)
+    lo, hi = bounds
+    n = len(keys)
+    span = hi - lo + 1
+    if span > max(COUNTING_MIN_RANGE, COUNTING_RANGE_FACTOR * n):
+        return _radix_passes(items, keys, keyed, lo, hi, reverse,
+                             progress_callback, cancel_event, stats)
+
+    counts = [0] * span
+    for k in keys:
+        counts[k - lo] += 1
+    if progress_callback:
+        progress_callback(50)
+
+    offsets = range(span - 1, -1, -1) if reverse else range(span)
+    if not keyed:
+        # Equal ints are interchangeable: write each value count times
+        result = []
+        for offset in offsets:
+            count = counts[offset]
+            if count:
+                result += [offset + lo] * count
+    else:
+        # counts -> first output slot of every key, in output order
+        total = 0
+        for offset in offsets:
+            count = counts[offset]
+            counts[offset] = total
+            total += count
+        result = [None] * n
+        for item, k in zip(items, keys):
+            slot = counts[k - lo]
+            result[slot] = item
+            counts[k - lo] = slot + 1
+
+    if stats is not None:
+        stats.passes = 2
+    if progress_callback:
+        progress_callback(100)
+    return result
+
+
+def radix_sort(arr, key=None, reverse=False, progress_callback=None,
+               cancel_event=None, stats=None):
+    """
+    LSD Radix Sort (byte-wise)
+
+    1. Shifts every key by the minimum, so all keys are >= 0
+    2. One pass per byte of the largest shifted key, least significant
+       first: items are appended to 256 buckets by that byte, and the
+       buckets are concatenated (in reverse bucket order when descending)
+    3. Each pass is stable, so equal keys keep their input order
+
+    7-digit IDs need 3 passes. If cancelled, the items are returned in the
+    order of the last completed pass.
+
+    Time Complexity: O(d·(n + 256)) (d = bytes in max - min)
+    Space Complexity: O(n)
+    """
+    items = arr if isinstance(arr, list) else list(arr)
+    keyed = key is not None
+    keys = [key(item) for item in items] if keyed else items
+    bounds = int_range(keys)
+    if bounds is None:
+        return _merge_sort_fallback(items, keys, keyed, reverse,
+                                    progress_callback, cancel_event, stats)
+    return _radix_passes(items, keys, keyed, bounds[0], bounds[1], reverse,
+                         progress_callback, cancel_event, stats)
+
+
+def _radix_passes(items, keys, keyed, lo, hi, reverse, progress_callback,
+                  cancel_event, stats):
+    """The LSD passes of radix_sort over int keys in [lo, hi]"""
+    progress = _Progress(progress_callback) if progress_callback else None
+    total_passes = max(1, -(-(hi - lo).bit_length() // RADIX_BITS))
+    mask = (1 << RADIX_BITS) - 1
+
+    # Plain ints are bucketed as shifted values; keyed items as row indices
+    if not keyed:
+        work = [k - lo for k in keys]
+    else:
+        keys = [k - lo for k in keys]
+        work = range(len(keys))
+
+    passes = 0
+    for passes in range(total_passes):
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        shift = passes * RADIX_BITS
+        buckets = [[] for _ in range(mask + 1)]
+        append = [bucket.append for bucket in buckets]
+        if not keyed:
+            for value in work:
+                append[(value >> shift) & mask](value)
+        else:
+            for i in work:
+                append[(keys[i] >> shift) & mask](i)
+        work = list(chain.from_iterable(reversed(buckets) if reverse else buckets))
+        if progress:
+            progress.report((passes + 1) / total_passes * 100)
+    else:
+        passes = total_passes
+
+    if not keyed:
+        result = [value + lo for value in work]
+    else:
+        result = [items[i] for i in work]
+    if stats is not None:
+        stats.passes = passes
+    if progress:
+        progress.done()
+    return result
+
+
+register_algorithm("Counting Sort", counting_sort, {
+    "best": "O(n + k)",
+    "average": "O(n + k)",
+    "worst": "O(n + k)",
+    "space": "O(n + k)",
+    "description": "Counts each integer value (k = value range). Best for small ranges like 1..10000."
+})
+
+register_algorithm("Radix Sort", radix_sort, {
+    "best": "O(d·n)",
+    "average": "O(d·n)",
+    "worst": "O(d·n)",
+    "space": "O(n)",
+    "description": "Byte-wise LSD radix sort (d = bytes per key). No comparisons; integers only."
+})
+register_instrumented(counting_sort, measuring_memory(counting_sort))
+register_instrumented(radix_sort, measuring_memory(radix_sort))
@@ -0,0 +1,398 @@
+"""
+Columnar record store for CSV tables like generated_data.csv
+
+Instead of one dict per row, every column is stored on its own:
+- integer columns (ID) in a typed array('q') - 8 bytes per row
+  (float columns in array('d'))
+- text columns (FirstName, LastName) dictionary-encoded: an array('I') of
+  codes (4 bytes per row) plus one shared, interned string per distinct value
+
+A column is only stored as numbers when every value is written exactly as
+str() would print the number, so a loaded table is written back unchanged.
+Other numeric-looking columns ("007", "1_000", ints mixed with floats) stay
+text, but still sort by their numeric value.
+
+A 100k-row generated_data.csv drops from ~40 MB of dicts to ~2 MB.
+Sorting works on row indices: keys are built per column (text columns are
+ranked once per distinct value, so every comparison is an int compare) and
+the result is a row order that can be applied with take().
+"""
+
+import csv
+import sys
+from array import array
+from itertools import islice
+
+from .algorithms import merge_sort
+from .keys import argsort, get_transform, pack_keys, rank_values
+from .numpy_backend import NUMPY_AVAILABLE, np
+from .topk import top_k_indices
+
+
+class _TextColumn:
+    """Dictionary-encoded text column"""
+
+    __slots__ = ("codes", "values", "index")
+
+    def __init__(self):
+        self.codes = array('I')
+        self.values = []  # code -> interned string
+        self.index = {}   # string -> code
+
+    def encode(self, value):
+        """Code of a value, adding it to the dictionary if new"""
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.values.append(value)
+            self.index[value] = code
+        return code
+
+    def append(self, value):
+        self.codes.append(self.encode(value))
+
+    def extend(self, values):
+        # Register new values first, then map the whole batch in C
+        index = self.index
+        for value in set(values).difference(index):
+            self.encode(value)
+        self.codes.extend(map(index.__getitem__, values))
+
+    def __getitem__(self, i):
+        return self.values[self.codes[i]]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def copy_with(self, codes):
+        """New column sharing this column's dictionary"""
+        column = _TextColumn.__new__(_TextColumn)
+        column.codes = codes
+        column.values = self.values
+        column.index = self.index
+        return column
+
+    def rank_keys(self, transform=None):
+        """
+        Integer sort keys: the rank of each row's (transformed) value.
+
+        The transform and the string comparisons happen once per distinct
+        value; equal transformed values share a rank so sorting stays stable.
+        When every value is a number the numbers are ranked instead (and the
+        transform is not needed).
+        """
+        values = self.values
+        try:
+            values = [parse_number(value) for value in values]
+        except ValueError:
+            values = self.values
+            if transform is not None:
+                values = [transform(value) for value in values]
+        order = merge_sort(range(len(values)), key=values.__getitem__)
+        ranks = [0] * len(values)
+        rank = -1
+        previous = None
+        for position, code in enumerate(order):
+            if position == 0 or values[code] != previous:
+                rank += 1
+                previous = values[code]
+            ranks[code] = rank
+        if NUMPY_AVAILABLE:
+            # One vectorized gather instead of a Python loop over every row
+            codes = np.frombuffer(self.codes, dtype=f"u{self.codes.itemsize}")
+            keys = array('q')
+            keys.frombytes(np.asarray(ranks, dtype=np.int64)[codes].tobytes())
+            return keys
+        return array('q', [ranks[code] for code in self.codes])
+
+
+def parse_number(token):
+    """Convert a token to int, or float if it has a fractional part/exponent"""
+    if '.' in token or 'e' in token or 'E' in token:
+        return float(token)
+    return int(token)
+
+
+def _exact_int(value):
+    """int(value), for text only if str() of the result gives the text back"""
+    number = int(value)
+    if type(value) is str and str(number) != value:
+        raise ValueError(f"{value!r} does not round-trip as an int")
+    return number
+
+
+def _exact_float(value):
+    """float(value), for text only if str() of the result gives the text back"""
+    number = float(value)
+    if type(value) is str and str(number) != value:
+        raise ValueError(f"{value!r} does not round-trip as a float")
+    return number
+
+
+def _parses(convert, value):
+    """True if convert(value) succeeds"""
+    try:
+        convert(value)
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
+
+
+def _checked_rows(rows, width, first, unit="line"):
+    """Skip blank rows and reject rows whose length is not width"""
+    for number, row in enumerate(rows, first):
+        if not row:
+            continue
+        if len(row) != width:
+            raise ValueError(f"{unit} {number}: expected {width} fields, got {len(row)}")
+        yield row
+
+
+# Rows converted per bulk column pass while loading
+_LOAD_CHUNK = 65536
+
+# Parsers for numeric column typecodes (values must round-trip, see above)
+_PARSERS = {'q': _exact_int, 'd': _exact_float}
+
+# Fast C parsers for bulk loads; the text is compared with str() afterwards
+_BULK_PARSERS = {'q': int, 'd': float}
+
+
+class RecordStore:
+    """Columnar table with numeric and dictionary-encoded text columns"""
+
+    __slots__ = ("columns", "_data")
+
+    def __init__(self, columns, int_columns=(), float_columns=()):
+        self.columns = list(columns)
+        self._data = {}
+        for name in self.columns:
+            if name in int_columns:
+                self._data[name] = array('q')
+            elif name in float_columns:
+                self._data[name] = array('d')
+            else:
+                self._data[name] = _TextColumn()
+
+    # ----- Loading -----
+
+    @classmethod
+    def from_csv(cls, filepath, int_columns=None):
+        """
+        Load a CSV file with a header row.
+
+        int_columns: names of integer columns; when None, the types are
+        detected from the first row (int, then float, else text). A numeric
+        column becomes text if a later value does not fit it (e.g. a float
+        or an int beyond int64 in an int column).
+        Blank lines are skipped; a row with more or fewer fields than the
+        header raises ValueError with its line number.
+        """
+        with open(filepath, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            return cls.from_rows(header, reader, int_columns)
+
+    @classmethod
+    def from_rows(cls, header, rows, int_columns=None):
+        """Build a store from an iterable of raw rows (see from_csv)"""
+        # Line 1 is the header
+        rows = _checked_rows(rows, len(header), 2)
+        first = next(rows, None)
+        float_columns = set()
+        if int_columns is None:
+            int_columns = set()
+            for name, value in zip(header, first or ()):
+                if _parses(_exact_int, value):
+                    int_columns.add(name)
+                elif _parses(_exact_float, value):
+                    float_columns.add(name)
+        store = cls(header, int_columns, float_columns)
+        if first is not None:
+            store.append(first)
+        # Load column-wise in chunks: one bulk conversion per column
+        while True:
+            chunk = list(islice(rows, _LOAD_CHUNK))
+            if not chunk:
+                break
+            store.extend(chunk)
+        return store
+
+    def append(self, row):
+        """Append one row of raw values (strings or numbers) in column order"""
+        if len(row) != len(self.columns):
+            raise ValueError(f"expected {len(self.columns)} fields, got {len(row)}")
+        for name, value in zip(self.columns, row):
+            self._append_value(name, value)
+
+    def extend(self, rows):
+        """Append many rows, converting each column in bulk"""
+        if set(map(len, rows)) - {len(self.columns)}:
+            # Check every row before any column changes, so they stay aligned
+            rows = list(_checked_rows(rows, len(self.columns), len(self) + 1, "row"))
+        if not rows:
+            return
+        for name, values in zip(self.columns, zip(*rows)):
+            column = self._data[name]
+            if type(column) is array:
+                before = len(column)
+                try:
+                    column.extend(map(_BULK_PARSERS[column.typecode], values))
+                    if list(map(str, column[before:])) != [
+                            value if type(value) is str else str(value) for value in values]:
+                        raise ValueError("a value does not round-trip")
+                except (ValueError, OverflowError):
+                    # A value did not fit (or is beyond int64): undo the partial extend and go
+                    # value by value so the column can be widened
+                    del column[before:]
+                    for value in values:
+                        self._append_value(name, value)
+            else:
+                column.extend(values)
+
+    def _append_value(self, name, value):
+        column = self._data[name]
+        if type(column) is array:
+            try:
+                column.append(_PARSERS[column.typecode](value))
+                return
+            except (ValueError, OverflowError):
+                column = self._widen(name)
+        column.append(value if type(value) is str else str(value))
+
+    def _widen(self, name):
+        """
+        Turn a numeric column into text after a value did not fit it. (An int
+        column is not widened to float: its ints would then print as "7.0".)
+        """
+        column = _TextColumn()
+        for number in self._data[name]:
+            column.append(str(number))
+        self._data[name] = column
+        return column
+
+    # ----- Access -----
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(self._data[self.columns[0]])
+
+    def column(self, name):
+        """Indexable values of one column"""
+        return self._data[name]
+
+    def is_numeric(self, name):
+        """True if the column is stored as numbers"""
+        return type(self._data[name]) is array
+
+    def row(self, i):
+        """Row i as a tuple in column order"""
+        return tuple(self._data[name][i] for name in self.columns)
+
+    def record(self, i):
+        """Row i as a dict (like csv.DictReader rows)"""
+        return {name: self._data[name][i] for name in self.columns}
+
+    def iter_rows(self, order=None):
+        """Yield row tuples, optionally in the given row order"""
+        columns = [self._data[name] for name in self.columns]
+        indices = range(len(self)) if order is None else order
+        for i in indices:
+            yield tuple(column[i] for column in columns)
+
+    def head(self, n):
+        """New store with the first n rows (text dictionaries are shared)"""
+        return self.take(range(min(n, len(self))))
+
+    def take(self, order):
+        """New store with rows rearranged (or selected) by row index"""
+        store = RecordStore.__new__(RecordStore)
+        store.columns = list(self.columns)
+        store._data = {}
+        for name in self.columns:
+            column = self._data[name]
+            if type(column) is array:
+                store._data[name] = array(column.typecode, [column[i] for i in order])
+            else:
+                codes = column.codes
+                store._data[name] = column.copy_with(array('I', [codes[i] for i in order]))
+        return store
+
+    def memory_bytes(self):
+        """Approximate memory used by the column buffers and text dictionaries"""
+        total = 0
+        for column in self._data.values():
+            if type(column) is array:
+                total += column.itemsize * len(column)
+            else:
+                total += column.codes.itemsize * len(column.codes)
+                total += sum(sys.getsizeof(value) for value in column.values)
+        return total
+
+    # ----- Sorting -----
+
+    def sort_keys(self, name, transform=None):
+        """
+        Compact int sort keys for one column.
+
+        Numeric columns are used as-is; text columns are ranked once per
+        distinct value after applying the transform (e.g. "casefold").
+        """
+        column = self._data[name]
+        if type(column) is array:
+            return column
+        if isinstance(transform, str):
+            transform = get_transform(transform)
+        return column.rank_keys(transform)
+
+    def composite_keys(self, columns, transform=None):
+        """
+        One packed int key per row for a multi-column ordering.
+
+        columns: [(name, descending), ...], most significant first, e.g.
+        [("LastName", False), ("FirstName", False), ("ID", True)].
+        Text ranks come from sort_keys (one rank per distinct value), int
+        columns are offset by their minimum; see keys.pack_keys.
+        """
+        packed = []
+        for name, descending in columns:
+            keys = self.sort_keys(name, transform)
+            if type(self._data[name]) is _TextColumn:
+                limit = max(keys) + 1 if keys else 1
+            else:
+                keys, limit = rank_values(keys)
+            packed.append((keys, limit, descending))
+        return pack_keys(packed)
+
+    def argsort(self, name, kernel, reverse=False, transform=None,
+                progress_callback=None, cancel_event=None, stats=None):
+        """
+        Row order that sorts the store by one column.
+
+        name may also be a list of (name, descending) pairs: the columns are
+        packed into one key so a single kernel pass sorts by all of them.
+        """
+        if isinstance(name, list):
+            keys = self.composite_keys(name, transform)
+        else:
+            keys = self.sort_keys(name, transform)
+        return argsort(keys, kernel, reverse, progress_callback, cancel_event, stats)
+
+    def top_k(self, name, k, reverse=False, transform=None):
+        """
+        Row order of the first k rows sorted by one column (or a list of
+        (name, descending) pairs), without sorting the other rows.
+        """
+        if isinstance(name, list):
+            keys = self.composite_keys(name, transform)
+        else:
+            keys = self.sort_keys(name, transform)
+        return top_k_indices(keys, k, reverse)
+
+    def sorted_by(self, name, kernel, reverse=False, transform=None,
+                  progress_callback=None, cancel_event=None, stats=None):
+        """New store sorted by one column (or a list of (name, descending))"""
+        return self.take(self.argsort(name, kernel, reverse, transform,
+                                      progress_callback, cancel_event, stats))
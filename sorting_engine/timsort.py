@@ -0,0 +1,377 @@
+"""
+Tim Sort: adaptive natural-run merge sort with galloping merges
+
+Instead of starting every bottom-up pass at width 1 (or 32), the input is
+scanned for runs that are already ascending or strictly descending.
+Descending runs are reversed in place, short runs are extended to a minimum
+length with binary insertion, and runs are merged from a stack that keeps
+merges balanced. Merges "gallop" (exponential search + bisect) when one run
+keeps winning, so long presorted stretches are moved as whole slices.
+
+On sorted, reversed or nearly sorted input the work drops towards O(n).
+Inputs made of short monotone stretches (dataset.txt interleaves a falling
+and a rising sequence) still benefit, because every stretch becomes part of
+a run instead of being re-merged from width 1.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from .algorithms import _Progress, _sort_by_key, register_algorithm
+
+# Galloping starts after this many consecutive wins by the same run
+MIN_GALLOP = 7
+
+
+def compute_minrun(n):
+    """Minimum run length: n / minrun is (close to) a power of two"""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+# ----- Galloping searches -----
+# Each returns the same index as bisect_left/bisect_right on a[lo:hi], but
+# probes exponentially (1, 3, 7, ...) from one end first, so the cost is
+# O(log k) where k is the distance from that end.
+
+def _gallop_left(key, a, lo, hi):
+    """First index in a[lo:hi] with a[i] >= key, probing from lo"""
+    step = 1
+    probe = lo
+    while probe < hi and a[probe] < key:
+        lo = probe + 1
+        probe = lo + step
+        step <<= 1
+    return bisect_left(a, key, lo, min(probe, hi))
+
+
+def _gallop_right(key, a, lo, hi):
+    """First index in a[lo:hi] with a[i] > key, probing from lo"""
+    step = 1
+    probe = lo
+    while probe < hi and not key < a[probe]:
+        lo = probe + 1
+        probe = lo + step
+        step <<= 1
+    return bisect_right(a, key, lo, min(probe, hi))
+
+
+def _gallop_left_from_end(key, a, lo, hi):
+    """First index in a[lo:hi] with a[i] >= key, probing from hi - 1"""
+    step = 1
+    probe = hi - 1
+    while probe >= lo and not a[probe] < key:
+        hi = probe
+        probe = hi - 1 - step
+        step <<= 1
+    return bisect_left(a, key, max(probe + 1, lo), hi)
+
+
+def _gallop_right_from_end(key, a, lo, hi):
+    """First index in a[lo:hi] with a[i] > key, probing from hi - 1"""
+    step = 1
+    probe = hi - 1
+    while probe >= lo and key < a[probe]:
+        hi = probe
+        probe = hi - 1 - step
+        step <<= 1
+    return bisect_right(a, key, max(probe + 1, lo), hi)
+
+
+class _TimSort:
+    """Run stack and merge state for one sort call (ascending, stable)"""
+
+    __slots__ = ("data", "runs", "min_gallop")
+
+    def __init__(self, data):
+        self.data = data
+        self.runs = []  # [(base, length), ...]
+        self.min_gallop = MIN_GALLOP
+
+    # ----- Run detection -----
+
+    def count_run(self, lo, hi):
+        """Length of the natural run starting at lo; descending runs are reversed"""
+        data = self.data
+        i = lo + 1
+        if i == hi:
+            return 1
+        if data[i] < data[lo]:
+            # Strictly descending (strict keeps the sort stable)
+            i += 1
+            while i < hi and data[i] < data[i - 1]:
+                i += 1
+            data[lo:i] = data[lo:i][::-1]
+        else:
+            i += 1
+            while i < hi and not data[i] < data[i - 1]:
+                i += 1
+        return i - lo
+
+    def binary_insertion(self, lo, start, hi):
+        """Extend the sorted run data[lo:start] to data[lo:hi]"""
+        data = self.data
+        for i in range(start, hi):
+            item = data[i]
+            pos = bisect_right(data, item, lo, i)
+            if pos < i:
+                data[pos + 1:i + 1] = data[pos:i]
+                data[pos] = item
+
+    # ----- Merging -----
+
+    def merge_collapse(self):
+        """Merge runs until the stack invariants hold (lengths grow like Fibonacci)"""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merge all remaining runs"""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i):
+        """Merge runs[i] and runs[i + 1]"""
+        data = self.data
+        runs = self.runs
+        base_a, len_a = runs[i]
+        base_b, len_b = runs[i + 1]
+        runs[i] = (base_a, len_a + len_b)
+        del runs[i + 1]
+
+        # Elements of A that are <= B[0] are already in place
+        start = _gallop_right(data[base_b], data, base_a, base_b)
+        len_a -= start - base_a
+        base_a = start
+        if len_a == 0:
+            return
+
+        # Elements of B that are >= A[-1] are already in place
+        end_b = _gallop_left_from_end(data[base_b - 1], data, base_b, base_b + len_b)
+        len_b = end_b - base_b
+        if len_b == 0:
+            return
+
+        if len_a <= len_b:
+            self.merge_lo(base_a, len_a, base_b, len_b)
+        else:
+            self.merge_hi(base_a, len_a, base_b, len_b)
+
+    def merge_lo(self, base_a, len_a, base_b, len_b):
+        """Merge left to right, buffering the shorter run A"""
+        data = self.data
+        tmp = data[base_a:base_a + len_a]
+        i, j, k = 0, base_b, base_a
+        end_b = base_b + len_b
+        min_gallop = self.min_gallop
+
+        while True:
+            # One element at a time until one run wins min_gallop times
+            count_a = count_b = 0
+            a, b = tmp[i], data[j]
+            while True:
+                if b < a:
+                    data[k] = b
+                    k += 1
+                    j += 1
+                    if j == end_b:
+                        break
+                    b = data[j]
+                    count_b += 1
+                    count_a = 0
+                    if count_b >= min_gallop:
+                        break
+                else:
+                    data[k] = a
+                    k += 1
+                    i += 1
+                    if i == len_a:
+                        break
+                    a = tmp[i]
+                    count_a += 1
+                    count_b = 0
+                    if count_a >= min_gallop:
+                        break
+            if i == len_a or j == end_b:
+                break
+
+            # Galloping: move whole blocks while it keeps paying off
+            while i < len_a and j < end_b:
+                pos = _gallop_right(data[j], tmp, i, len_a)
+                count_a = pos - i
+                if count_a:
+                    data[k:k + count_a] = tmp[i:pos]
+                    k += count_a
+                    i = pos
+                    if i == len_a:
+                        break
+
+                pos = _gallop_left(tmp[i], data, j, end_b)
+                count_b = pos - j
+                if count_b:
+                    data[k:k + count_b] = data[j:pos]
+                    k += count_b
+                    j = pos
+
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+
+            if i >= len_a or j >= end_b:
+                break
+
+        # Rest of A (if any) goes after everything merged; rest of B is in place
+        if i < len_a:
+            data[k:k + len_a - i] = tmp[i:]
+        self.min_gallop = min_gallop
+
+    def merge_hi(self, base_a, len_a, base_b, len_b):
+        """Merge right to left, buffering the shorter run B"""
+        data = self.data
+        tmp = data[base_b:base_b + len_b]
+        i, j, k = base_a + len_a - 1, len_b - 1, base_b + len_b - 1
+        min_gallop = self.min_gallop
+
+        while True:
+            count_a = count_b = 0
+            a, b = data[i], tmp[j]
+            while True:
+                if b < a:
+                    data[k] = a
+                    k -= 1
+                    i -= 1
+                    if i < base_a:
+                        break
+                    a = data[i]
+                    count_a += 1
+                    count_b = 0
+                    if count_a >= min_gallop:
+                        break
+                else:
+                    data[k] = b
+                    k -= 1
+                    j -= 1
+                    if j < 0:
+                        break
+                    b = tmp[j]
+                    count_b += 1
+                    count_a = 0
+                    if count_b >= min_gallop:
+                        break
+            if i < base_a or j < 0:
+                break
+
+            while i >= base_a and j >= 0:
+                # Elements of A greater than tmp[j] go to the right
+                pos = _gallop_right_from_end(tmp[j], data, base_a, i + 1)
+                count_a = i + 1 - pos
+                if count_a:
+                    data[k - count_a + 1:k + 1] = data[pos:i + 1]
+                    k -= count_a
+                    i = pos - 1
+                    if i < base_a:
+                        break
+
+                # Elements of B greater than or equal to A[i] go to the right
+                pos = _gallop_left_from_end(data[i], tmp, 0, j + 1)
+                count_b = j + 1 - pos
+                if count_b:
+                    data[k - count_b + 1:k + 1] = tmp[pos:j + 1]
+                    k -= count_b
+                    j = pos - 1
+
+                if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+                min_gallop = max(1, min_gallop - 1)
+
+            if i < base_a or j < 0:
+                break
+
+        # Rest of B (if any) goes first; rest of A is in place
+        if j >= 0:
+            data[base_a:base_a + j + 1] = tmp[:j + 1]
+        self.min_gallop = min_gallop
+
+
+def tim_sort(arr, key=None, reverse=False, progress_callback=None,
+             cancel_event=None, stats=None):
+    """
+    Tim Sort (natural runs + galloping merges)
+
+    Optimizations:
+    1. Detects existing ascending and descending runs
+    2. Extends short runs to minrun with binary insertion
+    3. Galloping merges copy long winning streaks as slices
+    4. Neighbouring runs already in order are never merged element-wise
+
+    Time Complexity: Best: O(n), Average: O(n log n), Worst: O(n log n)
+    Space Complexity: O(n)
+    """
+    if key is not None:
+        return _sort_by_key(tim_sort, arr, key, reverse,
+                            progress_callback, cancel_event, stats)
+
+    data = list(arr)
+    n = len(data)
+    progress = _Progress(progress_callback) if progress_callback else None
+
+    # Stable descending sort: reverse, sort ascending, reverse back
+    if reverse:
+        data.reverse()
+
+    state = _TimSort(data)
+    minrun = compute_minrun(n)
+    lo = 0
+    runs_found = 0
+    while lo < n:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+
+        run_len = state.count_run(lo, n)
+        if run_len < minrun:
+            forced = min(minrun, n - lo)
+            state.binary_insertion(lo, lo + run_len, lo + forced)
+            run_len = forced
+
+        state.runs.append((lo, run_len))
+        state.merge_collapse()
+        lo += run_len
+        runs_found += 1
+
+        if progress:
+            progress.report(lo / n * 100)
+    else:
+        state.merge_force_collapse()
+
+    if reverse:
+        data.reverse()
+    if stats is not None:
+        stats.passes = runs_found
+    if progress:
+        progress.done()
+    return data
+
+
+register_algorithm("Tim Sort", tim_sort, {
+    "best": "O(n)",
+    "average": "O(n log n)",
+    "worst": "O(n log n)",
+    "space": "O(n)",
+    "description": "Adaptive merge sort that reuses existing runs. Near O(n) on nearly sorted data."
+})
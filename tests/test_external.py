@@ -0,0 +1,29 @@
+import csv
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sorting_engine import external_sort_csv
+
+
+class BlankChunkTests(unittest.TestCase):
+
+    def test_rows_after_a_chunk_of_blank_lines_are_kept(self):
+        f = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False,
+                                        newline="", encoding="utf-8")
+        with f:
+            f.write("ID,Name\n" + "\n" * 5 + "3,c\n1,a\n\n2,b\n")
+        self.addCleanup(os.remove, f.name)
+        out = io.StringIO()
+        written = external_sort_csv(f.name, out, "ID", chunk_rows=2)
+        self.assertEqual(written, 3)
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows, [["ID", "Name"], ["1", "a"], ["2", "b"], ["3", "c"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
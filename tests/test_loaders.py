@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sorting_engine import load_numbers_mmap
+from sorting_engine.loaders import iter_number_chunks
+
+
+class BigIntTests(unittest.TestCase):
+
+    def write_numbers(self, text):
+        f = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+        with f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_int_beyond_int64_is_kept_exact(self):
+        big = 2 ** 63 + 1
+        path = self.write_numbers(f"5 {big} 3\n-2\n")
+        data = load_numbers_mmap(path)
+        self.assertEqual(list(data), [5, big, 3, -2])
+        self.assertTrue(all(type(value) is int for value in data))
+
+    def test_floats_and_big_ints_are_not_rounded(self):
+        big = 2 ** 64 + 7
+        path = self.write_numbers(f"1.5 {big}\n" + "4\n" * 20 + "2.5\n")
+        data = load_numbers_mmap(path)
+        self.assertEqual(list(data), [1.5, big] + [4] * 20 + [2.5])
+        chunks = [value for chunk in iter_number_chunks(path, 16) for value in chunk]
+        self.assertEqual(chunks, [1.5, big] + [4] * 20 + [2.5])
+        self.assertIs(type(chunks[1]), int)
+
+    def test_int64_files_stay_typed(self):
+        path = self.write_numbers(f"{2 ** 63 - 1} {-2 ** 63} 0\n")
+        data = load_numbers_mmap(path)
+        self.assertEqual(data, array('q', [2 ** 63 - 1, -2 ** 63, 0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sorting_engine import RecordStore, merge_sort
+from sorting_engine.cli import main
+
+
+class RaggedRowTests(unittest.TestCase):
+
+    def write_csv(self, text):
+        f = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False,
+                                        newline="", encoding="utf-8")
+        with f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_short_row_is_rejected_with_its_line(self):
+        path = self.write_csv("ID,FirstName,LastName\n3,Ann,Lee\n1,Bob\n2,Cy,Day\n")
+        with self.assertRaisesRegex(ValueError, "line 3: expected 3 fields, got 2"):
+            RecordStore.from_csv(path)
+
+    def test_long_row_in_a_later_chunk_is_rejected(self):
+        rows = [[str(i), "x"] for i in range(70000)]
+        rows[69000].append("extra")
+        with self.assertRaisesRegex(ValueError, "line 69002: expected 2 fields, got 3"):
+            RecordStore.from_rows(["ID", "Name"], rows)
+
+    def test_blank_lines_are_skipped(self):
+        path = self.write_csv("ID,Name\n2,b\n\n1,a\n")
+        store = RecordStore.from_csv(path)
+        self.assertEqual(list(store.iter_rows()), [(2, "b"), (1, "a")])
+
+    def test_append_and_extend_leave_columns_aligned(self):
+        store = RecordStore(["ID", "Name"], int_columns=("ID",))
+        store.append(["1", "a"])
+        with self.assertRaises(ValueError):
+            store.append(["2"])
+        with self.assertRaises(ValueError):
+            store.extend([["3", "c"], ["4"]])
+        self.assertEqual(len(store.column("ID")), len(store.column("Name")))
+        self.assertEqual(list(store.iter_rows()), [(1, "a")])
+
+
+
+class RoundTripTests(unittest.TestCase):
+
+    ROWS = [
+        ["ID", "Code", "Amount", "Price", "Name"],
+        ["3", "007", "1_000", "7", "Cy"],
+        ["10", "012", " 42", "7.5", "Ann"],
+        ["2", "100", "5", "0.25", "Bob"],
+        ["-1", "009", "30", "12", "Dee"],
+    ]
+
+    def test_sorted_csv_keeps_every_value_as_written(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "in.csv")
+            with open(source, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f, lineterminator="\n").writerows(self.ROWS)
+            for column in ("ID", "Code", "Amount", "Price", "Name"):
+                target = os.path.join(tmp, f"out-{column}.csv")
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertEqual(main([source, "-c", column, "-o", target]), 0)
+                with open(target, newline="", encoding="utf-8") as f:
+                    out = list(csv.reader(f))
+                self.assertEqual(out[0], self.ROWS[0])
+                self.assertEqual(sorted(out[1:]), sorted(self.ROWS[1:]), column)
+
+    def test_text_numbers_still_sort_numerically(self):
+        store = RecordStore.from_rows(self.ROWS[0], self.ROWS[1:])
+        self.assertFalse(store.is_numeric("Code"))
+        self.assertFalse(store.is_numeric("Price"))
+        self.assertTrue(store.is_numeric("ID"))
+        for column, expected in (("Code", ["007", "009", "012", "100"]),
+                                 ("Amount", ["5", "30", " 42", "1_000"]),
+                                 ("Price", ["0.25", "7", "7.5", "12"])):
+            index = self.ROWS[0].index(column)
+            order = store.sorted_by(column, merge_sort)
+            self.assertEqual([row[index] for row in order.iter_rows()], expected)
+
+    def test_ints_beyond_int64_become_text(self):
+        big = "99999999999999999999"
+        first = RecordStore.from_rows(["ID", "N"], iter([[big, "a"], ["5", "b"]]))
+        later = RecordStore.from_rows(["ID", "N"], [["5", "b"]] + [[big, "a"]] * 3)
+        named = RecordStore(["ID", "N"], int_columns=("ID",))
+        named.append(["5", "b"])
+        named.append([big, "a"])
+        for store in (first, later, named):
+            self.assertFalse(store.is_numeric("ID"))
+            order = store.sorted_by("ID", merge_sort)
+            self.assertEqual([row[0] for row in order.iter_rows()][-1], big)
+            self.assertEqual(sorted(store.column("ID")[i] for i in range(len(store))),
+                             sorted(["5"] + [big] * (len(store) - 1)))
+
+
+if __name__ == "__main__":
+    unittest.main()